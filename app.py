@@ -1,22 +1,36 @@
 # app.py
 
+import os
+import tempfile
+import time
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 from typing import Dict
 from PIL import Image
-import matplotlib.pyplot as plt
 
 from src.models import TrafficData, ClimateData, SubgradeProperties, MaterialProperties, Pavement
-from src.performance import design_new_pavement
-from src.lcca import perform_LCCA
-from src.reporting import generate_report, export_report_to_pdf
-from src.design import design_pavement_structure
-from src.utils.helpers import read_excel, save_pdf
+from src.evaluation_graph import EvaluationGraph
+from src.reporting import generate_report, render_report_pdf, export_reports
+from src.design import design_pavement_structure, optimize_pavement_structure, mechanistic_evaluator
+from src.response import critical_strains, layer_moduli, mechanistic_damage, subgrade_elastic_modulus
+from src.store import ProjectStore, RESULT_COLUMNS, restore_models
+from src.jobs import JobManager, QUEUED, RUNNING, DONE, FAILED
+from src.cache import fingerprint, get_default_cache
+from src.sensitivity import SENSITIVITY_PARAMETERS, run_oat_sensitivity, run_sobol_analysis
+from src.maintenance import DEFAULT_TREATMENTS, Treatment, optimize_maintenance_for_design, schedule_to_text
+from src.performance import compute_distress_arrays
+from src.utils.helpers import read_excel
+from src.visualization import (cost_series, distress_pie_png, layer_structure_png, maintenance_pie_png,
+                               maintenance_table, results_table)
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Above this many reports the batch export writes a zip of PDFs, whose memory does not grow with the count.
+MAX_MULTI_PAGE_REPORTS = 500
+
 st.set_page_config(page_title="ME Pavement Design Tool", layout="wide")
 
 st.title("🛣️ Mechanistic-Empirical Pavement Design Tool for Highways and Airports")
@@ -29,7 +43,138 @@ st.sidebar.image(image, use_container_width=True)
 # Sidebar for Navigation
 st.sidebar.title("Navigation")
 app_mode = st.sidebar.selectbox("Choose the app mode",
-                                ["Home", "Input Data", "Design Pavement", "Run Simulation", "View Results", "Generate Report"])
+                                ["Home", "Input Data", "Design Pavement", "Run Simulation", "View Results", "Stored Scenarios",
+                                 "Generate Report"])
+
+
+@st.cache_resource
+def get_project_store() -> ProjectStore:
+    """
+    Project store shared by all sessions (ME_PAVEMENT_STORE, default me_pavement_design.db).
+
+    :return: ProjectStore instance.
+    """
+    return ProjectStore()
+
+
+@st.cache_resource
+def get_job_manager() -> JobManager:
+    """
+    Background job queue shared by all sessions; finished jobs are kept for reruns.
+
+    :return: JobManager instance.
+    """
+    return JobManager()
+
+
+def poll_job(job_id: str) -> Dict:
+    """
+    Show the progress of a background job and rerun the page until it has finished.
+
+    The status and result are read together (JobManager.poll), so a job evicted by another
+    session's job is reported as failed instead of crashing the page.
+
+    :param job_id: Job ID.
+    :return: Job status once it has finished, with the job's return value under 'result' when done.
+    """
+    try:
+        status = get_job_manager().poll(job_id)
+    except KeyError as e:
+        return {'status': FAILED, 'error': str(e), 'elapsed': 0.0}
+    if status['status'] in (QUEUED, RUNNING):
+        st.progress(status['progress'], text=f"{status['name']}: {status['message'] or status['status']}")
+        time.sleep(0.5)
+        st.rerun()
+    return status
+
+
+def simulation_job(graph: EvaluationGraph, pavement_design, traffic_data: TrafficData, climate_data: ClimateData,
+                   subgrade_props: SubgradeProperties, material_props: MaterialProperties, lcca_inputs: Dict,
+                   store_target, progress) -> Dict:
+    """
+    Background simulation and LCCA; only results affected by changed inputs are recomputed.
+
+    :return: Results, lifecycle cost, cumulative LCC curve and the stored scenario ID (or None).
+    """
+    progress(0.1, "Predicting distresses")
+    with graph.lock:
+        graph.set_models(None, traffic_data, climate_data, subgrade_props, material_props)
+        graph.set_inputs(**lcca_inputs)
+        results = graph.evaluate()
+        progress(0.6, "Lifecycle cost analysis")
+        lcc_over_time = graph.value('lcc_over_time').tolist()
+    lcc = results.pop('Lifecycle Cost')
+    scenario_id = None
+    if store_target is not None:
+        progress(0.8, "Saving to the project store")
+        scenario_id = get_project_store().save_scenario(
+            store_target[0], store_target[1],
+            inputs={'traffic': traffic_data, 'climate': climate_data, 'subgrade': subgrade_props,
+                    'material': material_props, **lcca_inputs},
+            design=pavement_design,
+            results={**results, 'Lifecycle Cost': lcc, 'lcc_over_time': lcc_over_time})
+    return {'results': results, 'lcc': lcc, 'maintenance_costs': lcca_inputs['maintenance_costs'],
+            'lcc_over_time': lcc_over_time, 'lcca_inputs': lcca_inputs, 'scenario_id': scenario_id}
+
+
+def sensitivity_job(method: str, models, lcca_inputs: Dict, relative_range: float, n_samples: int,
+                    progress) -> Dict:
+    """
+    Background one-at-a-time or Sobol sensitivity analysis.
+
+    :return: See run_oat_sensitivity and run_sobol_analysis.
+    """
+    if method == "One-at-a-time":
+        progress(0.5, "Evaluating input variations")
+        return run_oat_sensitivity(*models, lcca_inputs, relative_range=relative_range)
+    return run_sobol_analysis(*models, lcca_inputs, relative_range=relative_range, n_samples=n_samples,
+                              progress=progress)
+
+
+def report_job(simulation_results: Dict, lcc: float, progress) -> bytes:
+    """
+    Background report generation.
+
+    :return: PDF bytes.
+    """
+    progress(0.2, "Generating report")
+    report_content = generate_report(simulation_results, lcc)
+    progress(0.5, "Rendering PDF")
+    return render_report_pdf(report_content)
+
+
+def batch_report_job(filters: Dict, archive: bool, progress) -> str:
+    """
+    Background export of one report per stored scenario matching the filters.
+
+    The export is written to a temporary file, so neither the job queue nor the session holds
+    it in memory; the job manager counts its size against its byte bound and deletes it on eviction.
+
+    :return: Path of a multi-page PDF, or of a zip archive with one PDF per scenario.
+    """
+    store = get_project_store()
+    total = max(store.count(**filters), 1)
+
+    def reports():
+        done = 0
+        for page in store.iter_scenarios(page_size=500, **filters):
+            for scenario in page:
+                results = {key: scenario[column] for key, column in RESULT_COLUMNS.items()
+                           if key != 'Lifecycle Cost' and scenario[column] is not None}
+                name = f"{scenario['project']}_{scenario['section'] or 'section'}_{scenario['id']}"
+                yield name, generate_report(results, scenario['lifecycle_cost'] or 0.0)
+            done += len(page)
+            progress(done / total, f"{done:,} of {total:,} reports")
+
+    fd, path = tempfile.mkstemp(prefix='pavement_reports_', suffix='.zip' if archive else '.pdf')
+    try:
+        with os.fdopen(fd, 'wb') as target:
+            export_reports(reports(), target, archive=archive)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
 
 # Initialize session state
 if 'simulation_results' not in st.session_state:
@@ -42,6 +187,9 @@ if 'lcc_over_time' not in st.session_state:
     st.session_state.lcc_over_time = {}
 if 'pavement_design' not in st.session_state:
     st.session_state.pavement_design = {}
+if 'evaluation_graph' not in st.session_state:
+    # Backed by the process-wide result cache, so earlier input sets (from any session) are not recomputed
+    st.session_state.evaluation_graph = EvaluationGraph(cache=get_default_cache())
 
 # Home Page
 if app_mode == "Home":
@@ -275,17 +423,22 @@ elif app_mode == "Design Pavement":
             total_thickness = sum([thickness for _, thickness in design_summary])
             total_cost = sum([layer_costs.get(layer_type, 0) * thickness for layer_type, thickness in design_summary])
 
-            # Predict Distresses (Simplified Example Formulas)
-            fatigue_cracking = total_thickness * 0.05  # Placeholder formula
-            rutting = total_thickness * 0.03
-            thermal_cracking = total_thickness * 0.02
+            # Critical strains from the layered-elastic response table and the resulting damage
+            layer_types = [layer_type for layer_type, _ in design_summary]
+            moduli = layer_moduli(layer_types, st.session_state.material_props)
+            strains = critical_strains(np.array([thickness for _, thickness in design_summary]), moduli,
+                                       subgrade_elastic_modulus(st.session_state.subgrade_props))
+            structure_damage = mechanistic_damage(strains, moduli[0], st.session_state.traffic_data)
+            thermal_cracking = st.session_state.material_props.thermal_coeff * st.session_state.climate_data.temperature_variation
 
             # Display Calculation Results
             st.write(f"**Total Pavement Thickness:** {total_thickness} mm")
             st.write(f"**Estimated Total Cost:** ${total_cost:,.2f}")
-            st.write(f"**Predicted Fatigue Cracking:** {fatigue_cracking:.2f} cracks")
-            st.write(f"**Predicted Rutting:** {rutting:.2f} mm")
-            st.write(f"**Predicted Thermal Cracking:** {thermal_cracking:.2f} cracks")
+            st.write(f"**Tensile Strain at Bottom of Top Layer:** {strains['tensile_strain'][0] * 1e6:.1f} microstrain")
+            st.write(f"**Compressive Strain on Subgrade:** {strains['compressive_strain'][0] * 1e6:.1f} microstrain")
+            st.write(f"**Fatigue Damage (Miner's sum):** {structure_damage['Fatigue Damage'][0]:.3f}")
+            st.write(f"**Subgrade Rutting Damage (Miner's sum):** {structure_damage['Rutting Damage'][0]:.3f}")
+            st.write(f"**Thermal Cracking Index:** {thermal_cracking:.4f}")
 
             st.subheader("Detailed Pavement Layers")
             design_df = pd.DataFrame(design_summary, columns=["Layer Type", "Thickness (mm)"])
@@ -293,15 +446,34 @@ elif app_mode == "Design Pavement":
 
             # Optional: Visual Representation of Pavement Layers
             st.markdown("### Pavement Structure Visualization")
-            fig, ax = plt.subplots(figsize=(6, 3))
-            current_y = 0
-            for layer_type, thickness in design_summary:
-                ax.barh(1, thickness, left=current_y, height=0.5, label=layer_type)
-                current_y += thickness
-            ax.set_xlabel("Thickness (mm)")
-            ax.set_yticks([])
-            ax.legend()
-            st.pyplot(fig)
+            st.image(layer_structure_png(design_summary))
+
+            st.subheader("Optimize Layer Thicknesses")
+            st.write("Search the layer types and thicknesses above for the cheapest structure that keeps "
+                     "every predicted distress within its limit.")
+            with st.form("optimize_structure_form"):
+                fatigue_limit = st.number_input("Fatigue Damage Limit (Miner's sum)", min_value=0.0, value=1.0, step=0.1)
+                rutting_limit = st.number_input("Subgrade Rutting Damage Limit (Miner's sum)", min_value=0.0, value=1.0, step=0.1)
+                thermal_limit = st.number_input("Thermal Cracking Limit", min_value=0.0, value=1.0, step=0.1)
+                swap_surface = st.checkbox("Consider both Asphalt and Concrete for the surface layer", value=True)
+                thickness_step = st.number_input("Thickness Step (mm)", min_value=1.0, max_value=100.0, value=10.0, step=1.0)
+                optimize = st.form_submit_button("Optimize Structure")
+                if optimize:
+                    try:
+                        layer_options = [[layer_type] for layer_type, _ in design_summary]
+                        if swap_surface and layer_options[0][0] in ("Asphalt", "Concrete"):
+                            layer_options[0] = ["Asphalt", "Concrete"]
+                        evaluator = mechanistic_evaluator(st.session_state.traffic_data, st.session_state.climate_data,
+                                                          st.session_state.subgrade_props, st.session_state.material_props)
+                        limits = {'Fatigue Cracking': fatigue_limit, 'Rutting': rutting_limit, 'Thermal Cracking': thermal_limit}
+                        optimum = optimize_pavement_structure(layer_options, layer_costs, limits, evaluator, step=thickness_step)
+                        st.session_state.pavement_design = optimum['layers']
+                        st.success(f"Cheapest structure found: ${optimum['cost']:,.2f} "
+                                   f"({optimum['evaluations']} candidates evaluated in {optimum['elapsed']:.2f} s). "
+                                   "It is now the current pavement design.")
+                        st.table(pd.DataFrame(optimum['layers'], columns=["Layer Type", "Thickness (mm)"]))
+                    except Exception as e:
+                        st.error(f"Error in structure optimization: {e}")
 
 
 # Run Simulation Page
@@ -311,13 +483,60 @@ elif app_mode == "Run Simulation":
     if 'pavement_design' in st.session_state and 'traffic_data' in st.session_state and 'climate_data' in st.session_state and \
        'subgrade_props' in st.session_state and 'material_props' in st.session_state:
 
+        st.subheader("Maintenance Strategy Optimization")
+        with st.expander("Optimize maintenance timing for distress limits"):
+            with st.form("maintenance_strategy_form"):
+                treatments_df = st.data_editor(pd.DataFrame([{
+                    'Treatment': treatment.name,
+                    'Cost ($)': treatment.cost,
+                    'Fatigue Reduction (%)': 100 * treatment.reductions.get('Fatigue Cracking', 0.0),
+                    'Rutting Reduction (%)': 100 * treatment.reductions.get('Rutting', 0.0)
+                } for treatment in DEFAULT_TREATMENTS]), num_rows="dynamic")
+                baseline = compute_distress_arrays(st.session_state.traffic_data, st.session_state.climate_data,
+                                                   st.session_state.subgrade_props, st.session_state.material_props)
+                col1, col2, col3 = st.columns(3)
+                fatigue_limit = col1.number_input("Fatigue Cracking Limit (0 = none)", min_value=0.0,
+                                                  value=float(baseline['Fatigue Cracking']) / 2, format="%.6g")
+                rutting_limit = col2.number_input("Rutting Limit (0 = none)", min_value=0.0,
+                                                  value=float(baseline['Rutting']) / 2, format="%.6g")
+                strategy_discount_rate = col3.number_input("Discount Rate (%)", min_value=0.0, max_value=100.0,
+                                                           value=3.0, step=0.1)
+                optimize_maintenance = st.form_submit_button("Optimize Maintenance")
+                if optimize_maintenance:
+                    try:
+                        treatments = [Treatment(str(row['Treatment']), float(row['Cost ($)']),
+                                                {'Fatigue Cracking': float(row['Fatigue Reduction (%)']) / 100,
+                                                 'Rutting': float(row['Rutting Reduction (%)']) / 100})
+                                      for _, row in treatments_df.dropna().iterrows()]
+                        limits = {name: limit for name, limit in (('Fatigue Cracking', fatigue_limit),
+                                                                  ('Rutting', rutting_limit)) if limit > 0}
+                        strategy = optimize_maintenance_for_design(
+                            st.session_state.traffic_data, st.session_state.climate_data,
+                            st.session_state.subgrade_props, st.session_state.material_props,
+                            limits, treatments, strategy_discount_rate / 100)
+                        st.session_state.optimized_maintenance = schedule_to_text(strategy['maintenance_costs'])
+                        st.table(pd.DataFrame({
+                            'Year': list(strategy['treatments'].keys()),
+                            'Treatment': list(strategy['treatments'].values()),
+                            'Cost ($)': list(strategy['maintenance_costs'].values())
+                        }))
+                        st.success(f"Optimal schedule found in {strategy['elapsed'] * 1000:.0f} ms; "
+                                   f"discounted maintenance cost ${strategy['Lifecycle Cost']:,.2f}. "
+                                   "It has been filled into the maintenance costs below.")
+                    except Exception as e:
+                        st.error(f"Maintenance optimization failed: {e}")
+
         st.subheader("Simulation Parameters")
         with st.form("simulation_parameters_form"):
             initial_cost = st.number_input("Initial Construction Cost ($)", min_value=0.0, value=1000000.0, step=1000.0)
             maintenance_costs_input = st.text_area("Maintenance Costs (Year:Cost, separated by commas)", 
-                                                   value="5:100000, 10:150000, 15:200000, 20:250000")
+                                                   value=st.session_state.get('optimized_maintenance',
+                                                                              "5:100000, 10:150000, 15:200000, 20:250000"))
             discount_rate = st.number_input("Discount Rate (% per annum)", min_value=0.0, max_value=100.0, value=3.0, step=0.1)
             analysis_period = st.number_input("Lifecycle Analysis Period (Years)", min_value=1, max_value=100, value=20, step=1)
+            save_to_store = st.checkbox("Save to project store", value=True)
+            project = st.text_input("Project", value="default")
+            section = st.text_input("Section", value="")
 
             submitted = st.form_submit_button("Run Simulation")
             if submitted:
@@ -338,29 +557,41 @@ elif app_mode == "Run Simulation":
                     subgrade_props = st.session_state.subgrade_props
                     material_props = st.session_state.material_props
 
-                    # Run simulation
-                    simulation_results = design_new_pavement(pavement_design, traffic_data, climate_data, subgrade_props, material_props)
-                    st.session_state.simulation_results = simulation_results
-
-                    # Perform LCCA
-                    lcc = perform_LCCA(initial_cost, maintenance_costs, discount_rate / 100, analysis_period)
-                    st.session_state.lcc = lcc
-                    st.session_state.maintenance_costs = maintenance_costs
-
-                    # Calculate LCCA over time for visualization
-                    lcc_over_time = []
-                    cumulative_lcc = initial_cost
-                    for year in range(1, analysis_period + 1):
-                        maintenance_cost = maintenance_costs.get(year, 0)
-                        discounted_cost = maintenance_cost / ((1 + discount_rate / 100) ** year)
-                        cumulative_lcc += discounted_cost
-                        lcc_over_time.append(cumulative_lcc)
-                    st.session_state.lcc_over_time = lcc_over_time
-
-                    st.success("Simulation and LCCA completed successfully.")
+                    # Run simulation and LCCA in the background; identical inputs reuse the finished job,
+                    # except when saving, so every save request writes a scenario (the graph cache keeps
+                    # the rerun cheap)
+                    lcca_inputs = {'initial_cost': initial_cost, 'maintenance_costs': maintenance_costs,
+                                   'discount_rate': discount_rate / 100, 'lcca_period': int(analysis_period)}
+                    store_target = (project, section) if save_to_store else None
+                    job_key = None if store_target is not None else fingerprint(
+                        'simulation', pavement_design, traffic_data, climate_data, subgrade_props, material_props,
+                        lcca_inputs)
+                    st.session_state.simulation_job = get_job_manager().submit(
+                        simulation_job, st.session_state.evaluation_graph, pavement_design, traffic_data,
+                        climate_data, subgrade_props, material_props, lcca_inputs, store_target,
+                        name="Simulation", key=job_key, with_progress=True)
 
                 except Exception as e:
                     st.error(f"Error during simulation: {e}")
+
+        # Poll the submitted simulation and copy its results into the session once
+        job_id = st.session_state.get('simulation_job')
+        if job_id and st.session_state.get('applied_simulation_job') != job_id:
+            status = poll_job(job_id)
+            if status['status'] == DONE:
+                payload = status['result']
+                st.session_state.simulation_results = payload['results']
+                st.session_state.lcc = payload['lcc']
+                st.session_state.maintenance_costs = payload['maintenance_costs']
+                st.session_state.lcc_over_time = payload['lcc_over_time']
+                st.session_state.lcca_inputs = payload['lcca_inputs']
+                st.session_state.applied_simulation_job = job_id
+                if payload['scenario_id'] is not None:
+                    st.info(f"Scenario saved to the project store (ID {payload['scenario_id']}).")
+                st.success(f"Simulation and LCCA completed successfully in {status['elapsed']:.2f} s.")
+            elif status['status'] == FAILED:
+                st.session_state.applied_simulation_job = job_id
+                st.error(f"Error during simulation: {status['error']}")
     else:
         st.warning("Please input the necessary data in the 'Input Data' and 'Design Pavement' sections before running simulations.")
 
@@ -375,16 +606,16 @@ elif app_mode == "View Results":
         lcc_over_time = st.session_state.lcc_over_time
 
         st.subheader("Pavement Performance Predictions")
-        df_results = pd.DataFrame(list(simulation_results.items()), columns=["Distress Type", "Value"])
+        df_results = results_table(simulation_results)
         st.table(df_results)
 
         st.subheader("Lifecycle Cost Analysis (LCCA)")
         st.write(f"**Total Lifecycle Cost:** ${lcc:,.2f}")
 
+        # Charts and tables are memoized on the results, so reruns and page switches reuse them.
         # Visualization 1: Pie Chart of Distress Types
         st.subheader("Distribution of Pavement Distresses")
-        pie_chart_data = df_results.set_index('Distress Type')
-        st.pyplot(pie_chart_data.plot.pie(y='Value', autopct='%1.1f%%', figsize=(6, 6)).figure)
+        st.image(distress_pie_png(simulation_results))
 
         # Visualization 2: Bar Chart of Distress Types
         st.subheader("Pavement Distresses Overview")
@@ -393,26 +624,13 @@ elif app_mode == "View Results":
         # Visualization 3: Line Chart of Lifecycle Cost Over Time
         if lcc_over_time:
             st.subheader("Lifecycle Cost Over Time")
-            years = list(range(1, len(lcc_over_time) + 1))
-            cost_data = pd.DataFrame({
-                'Year': years,
-                'Cumulative LCC': lcc_over_time
-            })
-            st.line_chart(cost_data.set_index('Year'))
+            st.line_chart(cost_series(lcc_over_time))
 
             # Detailed Breakdown Table
             st.subheader("Maintenance Costs Over Time")
-            maintenance_df = pd.DataFrame({
-                'Year': list(maintenance_costs.keys()),
-                'Maintenance Cost ($)': list(maintenance_costs.values())
-            }).sort_values('Year')
-            st.table(maintenance_df)
-
-            # Visualization 4: Line Chart of Cumulative LCCA
-            st.subheader("Cumulative Lifecycle Cost Analysis")
-            st.line_chart(cost_data.set_index('Year'))
+            st.table(maintenance_table(maintenance_costs))
 
-        # Visualization 5: Comparison of Initial Cost vs LCCA
+        # Visualization 4: Comparison of Initial Cost vs LCCA
         st.subheader("Initial Cost vs Total Lifecycle Cost")
         initial_cost = st.session_state.get('initial_cost', 0)
         comparison_df = pd.DataFrame({
@@ -424,11 +642,7 @@ elif app_mode == "View Results":
         # Additional Visualization: Pie Chart of Maintenance Cost Distribution
         if maintenance_costs:
             st.subheader("Maintenance Cost Distribution")
-            maintenance_df_pie = pd.DataFrame({
-                'Year': list(maintenance_costs.keys()),
-                'Maintenance Cost ($)': list(maintenance_costs.values())
-            }).sort_values('Year')
-            st.pyplot(maintenance_df_pie.plot.pie(y='Maintenance Cost ($)', labels=maintenance_df_pie['Year'], autopct='%1.1f%%', figsize=(6,6)).figure)
+            st.image(maintenance_pie_png(maintenance_costs))
 
         # Pavement Design Results
         if 'pavement_design' in st.session_state and st.session_state.pavement_design:
@@ -437,9 +651,131 @@ elif app_mode == "View Results":
             design_df = pd.DataFrame(pavement_design, columns=["Layer Type", "Thickness (mm)"])
             st.table(design_df)
 
+        # Sensitivity of the results to the inputs
+        st.subheader("Sensitivity Analysis")
+        st.write("Which inputs drive the results: " + ", ".join(SENSITIVITY_PARAMETERS)
+                 + " are varied uniformly around the simulated values (cost inputs only when LCCA inputs are known).")
+        with st.form("sensitivity_form"):
+            col1, col2, col3 = st.columns(3)
+            method = col1.selectbox("Method", ["One-at-a-time", "Sobol indices"])
+            relative_range = col2.number_input("Input Range (+/- %)", min_value=1.0, max_value=90.0, value=20.0,
+                                               step=1.0)
+            n_samples = col3.number_input("Sobol Samples per Matrix", min_value=256, max_value=1000000, value=4096,
+                                          step=256)
+            if st.form_submit_button("Run Sensitivity Analysis"):
+                models = (st.session_state.traffic_data, st.session_state.climate_data,
+                          st.session_state.subgrade_props, st.session_state.material_props)
+                lcca_inputs = st.session_state.get('lcca_inputs')
+                st.session_state.sensitivity_job = get_job_manager().submit(
+                    sensitivity_job, method, models, lcca_inputs, relative_range / 100, int(n_samples),
+                    name="Sensitivity", key=fingerprint('sensitivity', method, models, lcca_inputs, relative_range,
+                                                        int(n_samples)),
+                    with_progress=True)
+
+        job_id = st.session_state.get('sensitivity_job')
+        if job_id:
+            status = poll_job(job_id)
+            if status['status'] == DONE:
+                sensitivity = status['result']
+                st.write(f"**Model evaluations:** {sensitivity['evaluations']:,} in "
+                         f"{sensitivity['elapsed']:.2f} s")
+                if 'tornado' in sensitivity:
+                    for output, rows in sensitivity['tornado'].items():
+                        st.markdown(f"**{output}** (base {sensitivity['base'][output]:,.4g})")
+                        tornado_df = pd.DataFrame(rows).set_index('Parameter')
+                        st.bar_chart(tornado_df[['Swing']])
+                        st.table(tornado_df)
+                else:
+                    for output in sensitivity['first_order']:
+                        st.markdown(f"**{output}**")
+                        st.table(pd.DataFrame({'First Order': sensitivity['first_order'][output],
+                                               'Total Order': sensitivity['total_order'][output]}))
+            elif status['status'] == FAILED:
+                st.error(f"Sensitivity analysis failed: {status['error']}")
+
     else:
         st.warning("No simulation results to display. Please run a simulation first.")
 
+# Stored Scenarios Page
+elif app_mode == "Stored Scenarios":
+    st.header("Stored Scenarios")
+
+    store = get_project_store()
+    projects = store.projects()
+    if projects:
+        col1, col2, col3 = st.columns(3)
+        project = col1.selectbox("Project", projects)
+        section = col2.selectbox("Section", ["All"] + store.sections(project))
+        page_size = col3.selectbox("Scenarios per page", [25, 50, 100, 500], index=1)
+        date_range = st.date_input("Run date range", value=())
+        filters = {'project': project, 'section': None if section == "All" else section}
+        if len(date_range) == 2:
+            filters['date_from'] = date_range[0]
+            filters['date_to'] = date_range[1] + pd.Timedelta(days=1)
+
+        # Only the requested page is read from the store
+        total = store.count(**filters)
+        n_pages = max(1, -(-total // page_size))
+        page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, step=1)
+        st.write(f"**{total:,} matching scenario(s)**")
+        st.dataframe(pd.DataFrame(store.query(limit=page_size, offset=(page - 1) * page_size, **filters)))
+
+        scenario_id = st.number_input("Scenario ID to load", min_value=1, step=1)
+        if st.button("Load Scenario"):
+            scenario = store.get(scenario_id)
+            if scenario is None:
+                st.error(f"Scenario {scenario_id} not found.")
+            else:
+                inputs = restore_models(scenario['inputs'])
+                for key, state in (('traffic', 'traffic_data'), ('climate', 'climate_data'),
+                                   ('subgrade', 'subgrade_props'), ('material', 'material_props')):
+                    if key in inputs:
+                        st.session_state[state] = inputs[key]
+                if scenario['design']:
+                    st.session_state.pavement_design = scenario['design']
+                results = dict(scenario['results'])
+                st.session_state.lcc = results.pop('Lifecycle Cost', 0.0)
+                st.session_state.lcc_over_time = results.pop('lcc_over_time', [])
+                st.session_state.simulation_results = results
+                st.session_state.maintenance_costs = {int(year): cost for year, cost
+                                                      in inputs.get('maintenance_costs', {}).items()}
+                if 'initial_cost' in inputs and 'discount_rate' in inputs:
+                    st.session_state.lcca_inputs = {key: inputs[key] for key in ('initial_cost', 'discount_rate',
+                                                                                 'lcca_period') if key in inputs}
+                    st.session_state.lcca_inputs['maintenance_costs'] = st.session_state.maintenance_costs
+                else:
+                    st.session_state.lcca_inputs = None
+                st.success(f"Scenario {scenario_id} loaded.")
+
+        st.subheader("Batch Report Export")
+        export_format = st.radio("Format", ["One multi-page PDF", "Zip of PDFs"], horizontal=True)
+        if export_format == "One multi-page PDF" and total > MAX_MULTI_PAGE_REPORTS:
+            st.info(f"A multi-page PDF holds every page in memory until it is saved; more than "
+                    f"{MAX_MULTI_PAGE_REPORTS:,} reports are exported as a zip of PDFs instead.")
+        if st.button(f"Export reports for the {total:,} matching scenario(s)"):
+            archive = export_format == "Zip of PDFs" or total > MAX_MULTI_PAGE_REPORTS
+            st.session_state.batch_report_job = (get_job_manager().submit(
+                batch_report_job, filters, archive, name="Batch reports", with_progress=True,
+                size=os.path.getsize, cleanup=os.remove), archive)
+        if st.session_state.get('batch_report_job'):
+            job_id, archive = st.session_state.batch_report_job
+            status = poll_job(job_id)
+            export_file = None
+            if status['status'] == DONE:
+                try:
+                    export_file = open(status['result'], 'rb')
+                except FileNotFoundError:
+                    status = {'status': FAILED, 'error': "The exported file has expired; export the reports again."}
+            if export_file is not None:
+                with export_file:
+                    st.download_button("Download Reports", data=export_file,
+                                       file_name="pavement_reports.zip" if archive else "pavement_reports.pdf",
+                                       mime='application/zip' if archive else 'application/pdf')
+            elif status['status'] == FAILED:
+                st.error(f"Failed to export reports: {status['error']}")
+    else:
+        st.info("No stored scenarios yet. Run a simulation with 'Save to project store' enabled.")
+
 # Generate Report Page
 elif app_mode == "Generate Report":
     st.header("Generate Report")
@@ -458,32 +794,26 @@ elif app_mode == "Generate Report":
         st.write(f"**Lifecycle Cost Analysis (LCCA):** ${lcc:,.2f}")
 
         st.subheader("Maintenance Costs Breakdown")
-        maintenance_df = pd.DataFrame({
-            'Year': list(maintenance_costs.keys()),
-            'Maintenance Cost ($)': list(maintenance_costs.values())
-        }).sort_values('Year')
-        st.table(maintenance_df)
+        st.table(maintenance_table(maintenance_costs))
 
         st.subheader("Lifecycle Cost Over Time")
         if lcc_over_time:
-            years = list(range(1, len(lcc_over_time) + 1))
-            cost_data = pd.DataFrame({
-                'Year': years,
-                'Cumulative LCC': lcc_over_time
-            })
-            st.line_chart(cost_data.set_index('Year'))
+            st.line_chart(cost_series(lcc_over_time))
 
         generate_report_btn = st.button("Generate and Download Report")
         if generate_report_btn:
-            try:
-                report_content = generate_report(simulation_results, lcc)
-                report_path = "pavement_design_report.pdf"
-                export_report_to_pdf(report_content, report_path)
-                with open(report_path, "rb") as pdf_file:
-                    PDFbyte = pdf_file.read()
-                st.download_button(label="Download Report as PDF", data=PDFbyte, file_name="pavement_design_report.pdf", mime='application/octet-stream')
+            st.session_state.report_job = get_job_manager().submit(
+                report_job, simulation_results, lcc, name="Report",
+                key=fingerprint('report', simulation_results, lcc), with_progress=True)
+
+        job_id = st.session_state.get('report_job')
+        if job_id:
+            status = poll_job(job_id)
+            if status['status'] == DONE:
+                st.download_button(label="Download Report as PDF", data=status['result'],
+                                   file_name="pavement_design_report.pdf", mime='application/octet-stream')
                 st.success("Report generated and ready for download.")
-            except Exception as e:
-                st.error(f"Failed to generate report: {e}")
+            elif status['status'] == FAILED:
+                st.error(f"Failed to generate report: {status['error']}")
     else:
         st.warning("No simulation results available. Please run a simulation first.")
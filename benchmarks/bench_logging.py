@@ -0,0 +1,122 @@
+# benchmarks/bench_logging.py
+"""
+Per-call cost of the logging modes on the single-scenario simulation path.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_logging [n_calls]
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+import types
+from contextlib import nullcontext
+from typing import Dict, List
+
+from src.lcca import perform_LCCA
+from src.models import TrafficData, ClimateData, SubgradeProperties, MaterialProperties, Pavement
+from src.performance import design_new_pavement
+from src.utils import logger as logger_module
+from src.utils.logger import configure_logging, simulation_logging_disabled
+
+
+def _synced_emit(self, record: logging.LogRecord):
+    """
+    FileHandler.emit followed by fsync, i.e. every record waits for the disk as on
+    storage without a write cache (network or synchronously mounted file systems).
+    """
+    logging.FileHandler.emit(self, record)
+    self.flush()
+    os.fsync(self.stream.fileno())
+
+
+def _active_file_handlers() -> List[logging.FileHandler]:
+    """
+    File handlers currently doing the I/O: the queue listener's, or every logger's own.
+    """
+    if logger_module._queue_listener is not None:
+        handlers = logger_module._queue_listener.handlers
+    else:
+        handlers = [handler for name in logger_module._registry for handler in logging.getLogger(name).handlers]
+    return [handler for handler in handlers if isinstance(handler, logging.FileHandler)]
+
+
+def _configure(use_queue: bool, log_file: str, synced: bool):
+    """
+    Rebuild the handlers, optionally forcing every file write to disk.
+    """
+    configure_logging(use_queue=use_queue, log_file=log_file, console=False)
+    if synced:
+        for handler in _active_file_handlers():
+            handler.emit = types.MethodType(_synced_emit, handler)
+
+
+def _time_calls(n_calls: int, disabled: bool = False) -> float:
+    """
+    Microseconds per design_new_pavement + perform_LCCA call pair.
+
+    :param n_calls: Number of call pairs.
+    :param disabled: Run inside simulation_logging_disabled().
+    :return: Mean microseconds per call pair.
+    """
+    pavement = Pavement([100.0, 200.0, 300.0])
+    traffic = TrafficData([80.0, 100.0, 120.0], 0.02, 20)
+    climate = ClimateData(15.0, 10.0, 500.0)
+    subgrade = SubgradeProperties(3000.0, 10.0)
+    material = MaterialProperties(3000.0, 30.0, 0.0001)
+    maintenance = {5: 100000.0, 10: 150000.0, 15: 200000.0, 20: 250000.0}
+    with simulation_logging_disabled() if disabled else nullcontext():
+        start = time.perf_counter()
+        for _ in range(n_calls):
+            design_new_pavement(pavement, traffic, climate, subgrade, material)
+            perform_LCCA(1000000.0, maintenance, 0.03, 20)
+        elapsed = time.perf_counter() - start
+    return elapsed / n_calls * 1e6
+
+
+def _drain_seconds() -> float:
+    """
+    Seconds until the queue listener has written every pending record.
+    """
+    start = time.perf_counter()
+    logger_module._stop_listener()
+    return time.perf_counter() - start
+
+
+def run(n_calls: int = 5000) -> Dict[str, float]:
+    """
+    Compare direct handlers, the shared queue listener and disabled logging.
+
+    Logs go to a temporary file without console output so terminal speed does not
+    dominate the measurement. Each handler mode runs twice: with the OS page cache
+    absorbing the writes, and with every record forced to disk (fsync), which is the
+    slow-I/O case the queue listener is meant for. For the queue, the compute-thread
+    time is reported together with the end-to-end time including draining the queue.
+
+    :param n_calls: Number of call pairs per mode.
+    :return: Mapping of mode to microseconds per call pair.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, 'bench.log')
+        results = {}
+        for synced, label in ((False, 'cached'), (True, 'fsync')):
+            _configure(False, log_file, synced)
+            results[f"direct, {label}"] = _time_calls(n_calls)
+            _configure(True, log_file, synced)
+            compute = _time_calls(n_calls)
+            results[f"queue, {label}"] = compute
+            results[f"queue+drain, {label}"] = compute + _drain_seconds() / n_calls * 1e6
+        _configure(False, log_file, False)
+        results['disabled'] = _time_calls(n_calls, disabled=True)
+        configure_logging()
+    return results
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"{'Logging mode':<22}{'us/call':>10}")
+    for mode, micros in run(n).items():
+        print(f"{mode:<22}{micros:>10.1f}")
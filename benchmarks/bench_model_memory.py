@@ -0,0 +1,85 @@
+# benchmarks/bench_model_memory.py
+"""
+Memory per instance of the mutable model classes versus their slotted record variants.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_model_memory [n_instances]
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from src.models import (TrafficData, ClimateData, SubgradeProperties, MaterialProperties, Pavement,
+                        TrafficRecord, ClimateRecord, SubgradeRecord, MaterialRecord, PavementRecord)
+
+
+def _measure(build: Callable[[], List[object]], n_instances: int, repeats: int = 3) -> Dict[str, float]:
+    """
+    Peak traced bytes per instance and construction time for one builder.
+
+    Construction time is the best of several untraced runs, since tracemalloc slows
+    allocation-heavy code by a large and uneven factor.
+
+    :param build: Callable returning the list of instances.
+    :param n_instances: Number of instances the builder creates.
+    :param repeats: Number of timed runs.
+    :return: Dictionary with 'bytes_per_instance' and 'seconds'.
+    """
+    tracemalloc.start()
+    instances = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    seconds = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        instances = build()
+        seconds = min(seconds, time.perf_counter() - start)
+        del instances
+    return {'bytes_per_instance': current / n_instances, 'seconds': seconds}
+
+
+def run(n_instances: int = 100000) -> Dict[str, Dict[str, float]]:
+    """
+    Measure every model class in its mutable and record form.
+
+    :param n_instances: Number of instances per class.
+    :return: Mapping of class name to measurement.
+    """
+    rng = np.random.default_rng(0)
+    loads = (80.0, 100.0, 120.0)
+    a = rng.uniform(0.0, 0.05, n_instances).tolist()
+    b = rng.uniform(1000.0, 5000.0, n_instances).tolist()
+    c = rng.uniform(1.0, 30.0, n_instances).tolist()
+    periods = rng.integers(10, 50, n_instances).tolist()
+
+    cases = {
+        # Both traffic variants share one spectrum object, so the figures compare the instances
+        # themselves; the per-row cases below add one copy of the spectrum to every instance.
+        'TrafficData': lambda: [TrafficData(loads, g, n) for g, n in zip(a, periods)],
+        'TrafficRecord': lambda: TrafficRecord.from_columns(axle_loads=loads, traffic_growth_rate=a, analysis_period=periods),
+        'TrafficData (per-row spectrum)': lambda: [TrafficData((*loads,), g, n) for g, n in zip(a, periods)],
+        'TrafficRecord (per-row spectrum)': lambda: TrafficRecord.from_columns(
+            axle_loads=[(*loads,) for _ in periods], traffic_growth_rate=a, analysis_period=periods),
+        'ClimateData': lambda: [ClimateData(x, y, z) for x, y, z in zip(c, c, b)],
+        'ClimateRecord': lambda: ClimateRecord.from_columns(average_temperature=c, temperature_variation=c, rainfall=b),
+        'SubgradeProperties': lambda: [SubgradeProperties(x, y) for x, y in zip(b, c)],
+        'SubgradeRecord': lambda: SubgradeRecord.from_columns(modulus=b, CBR=c),
+        'MaterialProperties': lambda: [MaterialProperties(x, y, z) for x, y, z in zip(b, c, a)],
+        'MaterialRecord': lambda: MaterialRecord.from_columns(asphalt_modulus=b, concrete_strength=c, thermal_coeff=a),
+        'Pavement': lambda: [Pavement([x, y]) for x, y in zip(c, b)],
+        'PavementRecord': lambda: PavementRecord.from_columns(layers=[(x, y) for x, y in zip(c, b)], pavement_type='Flexible'),
+    }
+    return {name: _measure(build, n_instances) for name, build in cases.items()}
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"{'Class':<34}{'bytes/instance':>16}{'build time (s)':>16}")
+    for name, result in run(n).items():
+        print(f"{name:<34}{result['bytes_per_instance']:>16.1f}{result['seconds']:>16.3f}")
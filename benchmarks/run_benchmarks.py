@@ -0,0 +1,202 @@
+# benchmarks/run_benchmarks.py
+"""
+Benchmark suite for the performance, LCCA and reporting pipeline.
+
+Synthetic inputs are generated with a fixed seed at scaled sizes: axle-load spectra
+from 10 to 10^6 bins, analysis periods from 1 to 100 years and batch sizes from 1 to
+10^5 scenarios. Every case reports latency percentiles, throughput and peak traced
+memory. The results are written as JSON so runs can be compared over time.
+
+Run from the repository root:
+
+    python -m benchmarks.run_benchmarks [--quick] [--output benchmark_results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from src.lcca import perform_LCCA, calculate_LCCA_batch
+from src.models import TrafficData, ClimateData, SubgradeProperties, MaterialProperties, Pavement
+from src.performance import design_new_pavement, design_new_pavement_batch
+from src.reporting import generate_report, export_report_to_pdf
+from src.utils.logger import configure_logging
+
+SPECTRUM_BINS = (10, 1000, 100000, 1000000)
+ANALYSIS_PERIODS = (1, 20, 50, 100)
+BATCH_SIZES = (1, 100, 10000, 100000)
+MAINTENANCE_COSTS = {5: 100000.0, 10: 150000.0, 15: 200000.0, 20: 250000.0}
+# get_total_axle_loads materializes years x bins Python floats; larger cases are skipped.
+MAX_MATERIALIZED_CELLS = 5000000
+
+
+def measure(func: Callable[[], Any], items: int, repeat: int) -> Dict[str, float]:
+    """
+    Time func repeatedly and trace its peak memory in one extra run.
+
+    :param func: Zero-argument callable to benchmark.
+    :param items: Work items processed per call (used for throughput).
+    :param repeat: Number of timed calls.
+    :return: Latency percentiles (ms), throughput (items/s) and peak memory (bytes).
+    """
+    func()  # Warm-up (imports, caches)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    timings = np.array(timings)
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99]) * 1000
+    return {
+        'items': items,
+        'repeat': repeat,
+        'latency_ms_p50': float(p50),
+        'latency_ms_p95': float(p95),
+        'latency_ms_p99': float(p99),
+        'throughput_items_per_s': float(items / timings.mean()) if timings.mean() > 0 else float('inf'),
+        'peak_memory_bytes': int(peak)
+    }
+
+
+def _traffic(rng: np.random.Generator, bins: int, years: int) -> TrafficData:
+    """
+    Synthetic traffic with a uniform 20-200 kN spectrum.
+
+    :param rng: NumPy random generator.
+    :param bins: Number of axle-load bins.
+    :param years: Analysis period in years.
+    :return: TrafficData instance.
+    """
+    return TrafficData(rng.uniform(20.0, 200.0, bins).tolist(), 0.02, years)
+
+
+def _scenarios(rng: np.random.Generator, size: int) -> Dict[str, np.ndarray]:
+    """
+    Synthetic columnar scenarios for the batch entry points.
+
+    :param rng: NumPy random generator.
+    :param size: Number of scenarios.
+    :return: Mapping of column name to array.
+    """
+    return {
+        'traffic_growth_rate': rng.uniform(0.0, 0.05, size),
+        'analysis_period': rng.integers(1, 101, size).astype(float),
+        'rainfall': rng.uniform(100.0, 2000.0, size),
+        'temperature_variation': rng.uniform(5.0, 30.0, size),
+        'subgrade_modulus': rng.uniform(500.0, 5000.0, size),
+        'asphalt_modulus': rng.uniform(1000.0, 6000.0, size),
+        'thermal_coeff': np.full(size, 0.0001),
+        'discount_rate': rng.uniform(0.0, 0.08, size)
+    }
+
+
+def run_suite(quick: bool = False, repeat: int = 20) -> List[Dict[str, Any]]:
+    """
+    Run every benchmark case.
+
+    :param quick: Use only the two smallest sizes of every scale (for CI smoke runs).
+    :param repeat: Number of timed calls per case.
+    :return: List of result records.
+    """
+    rng = np.random.default_rng(12345)
+    bins_scale = SPECTRUM_BINS[:2] if quick else SPECTRUM_BINS
+    period_scale = ANALYSIS_PERIODS[:2] if quick else ANALYSIS_PERIODS
+    batch_scale = BATCH_SIZES[:2] if quick else BATCH_SIZES
+    climate = ClimateData(15.0, 10.0, 500.0)
+    subgrade = SubgradeProperties(3000.0, 10.0)
+    material = MaterialProperties(3000.0, 30.0, 0.0001)
+    pavement = Pavement([100.0, 200.0, 300.0])
+    results = []
+
+    def record(case: str, params: Dict[str, Any], func: Callable[[], Any], items: int, runs: int = repeat):
+        """
+        Measure one case, store its result record and print a summary line.
+        """
+        metrics = measure(func, items, runs)
+        results.append({'case': case, 'params': params, **metrics})
+        print(f"{case:<28}{json.dumps(params):<36}p50={metrics['latency_ms_p50']:.3f} ms  "
+              f"peak={metrics['peak_memory_bytes'] / 1e6:.1f} MB")
+
+    for bins in bins_scale:
+        for years in period_scale:
+            traffic = _traffic(rng, bins, years)
+            params = {'bins': bins, 'years': years}
+            if bins * years <= MAX_MATERIALIZED_CELLS:
+                record('get_total_axle_loads', params, traffic.get_total_axle_loads, bins * years, max(3, repeat // 4))
+            record('design_new_pavement', params,
+                   lambda: design_new_pavement(pavement, traffic, climate, subgrade, material), bins * years)
+
+    for years in period_scale:
+        record('perform_LCCA', {'years': years},
+               lambda: perform_LCCA(1000000.0, MAINTENANCE_COSTS, 0.03, years), years)
+
+    shared_loads = rng.uniform(20.0, 200.0, 1000)
+    for size in batch_scale:
+        scenarios = _scenarios(rng, size)
+        record('design_new_pavement_batch', {'scenarios': size},
+               lambda: design_new_pavement_batch(scenarios, shared_loads), size)
+        record('calculate_LCCA_batch', {'scenarios': size},
+               lambda: calculate_LCCA_batch(1000000.0, MAINTENANCE_COSTS, scenarios['discount_rate'],
+                                            scenarios['analysis_period']), size)
+
+    simulation = design_new_pavement(pavement, _traffic(rng, 10, 20), climate, subgrade, material)
+    record('generate_report', {}, lambda: generate_report(simulation, 1464666.29), 1)
+    try:
+        import reportlab  # noqa: F401
+    except ImportError:
+        print("reportlab not installed; skipping export_report_to_pdf.")
+    else:
+        report = generate_report(simulation, 1464666.29)
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = os.path.join(tmp, 'report.pdf')
+            record('export_report_to_pdf', {}, lambda: export_report_to_pdf(report, pdf_path), 1, max(3, repeat // 4))
+    return results
+
+
+def main(argv: List[str] = None):
+    """
+    Command-line entry point.
+
+    :param argv: Optional argument list (defaults to sys.argv).
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', default='benchmark_results.json', help="JSON file for the results.")
+    parser.add_argument('--quick', action='store_true', help="Only run the smallest sizes.")
+    parser.add_argument('--repeat', type=int, default=20, help="Timed calls per case.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep logging on (it is part of the real cost) but out of the console and the project log.
+        configure_logging(log_file=os.path.join(tmp, 'bench.log'), console=False)
+        results = run_suite(quick=args.quick, repeat=args.repeat)
+        configure_logging()
+
+    payload = {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'quick': args.quick,
+        'results': results
+    }
+    with open(args.output, 'w') as fh:
+        json.dump(payload, fh, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,274 @@
+# src/cache.py
+
+import copy
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from src.lcca import perform_LCCA_over_time
+from src.performance import design_new_pavement
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_MISSING = object()
+
+# Part of every memoize key. Bump it whenever a cached model or LCCA formula changes, so
+# entries persisted by an older version are not served after an upgrade.
+CACHE_VERSION = 1
+
+_NUMBER_TYPES = (int, float, np.integer, np.floating)
+
+
+def _is_numeric_sequence(obj: Any) -> bool:
+    """
+    Whether a list or tuple holds only int or float numbers (no bools), so it converts to one array.
+
+    :param obj: List or tuple.
+    :return: True for a non-empty homogeneous numeric sequence.
+    """
+    if not obj or not isinstance(obj[0], _NUMBER_TYPES) or isinstance(obj[0], (bool, np.bool_)):
+        return False
+    try:
+        kind = np.asarray(obj).dtype.kind
+    except (ValueError, OverflowError):
+        return False
+    return kind in 'iuf'
+
+
+def _update_digest(digest, obj: Any):
+    """
+    Feed a canonical, type-tagged encoding of obj into a hashlib digest.
+
+    Model objects are encoded by class name and public fields, so two instances
+    with equal inputs produce the same fingerprint.
+
+    :param digest: hashlib hash object.
+    :param obj: Object to encode.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        digest.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, np.ndarray):
+        digest.update(f"ndarray:{obj.dtype.str}:{obj.shape};".encode())
+        digest.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, np.generic):
+        _update_digest(digest, obj.item())
+    elif isinstance(obj, (list, tuple)) and _is_numeric_sequence(obj):
+        # Homogeneous numeric sequences (e.g. axle-load spectra) are hashed as one array buffer;
+        # the tag keeps them distinct from the element-wise and ndarray encodings.
+        values = np.asarray(obj)
+        digest.update(f"{type(obj).__name__}<{values.dtype.str}>{values.shape};".encode())
+        digest.update(np.ascontiguousarray(values).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        digest.update(f"{type(obj).__name__}[{len(obj)}](".encode())
+        for item in obj:
+            _update_digest(digest, item)
+        digest.update(b");")
+    elif isinstance(obj, dict):
+        digest.update(f"dict[{len(obj)}](".encode())
+        for key in sorted(obj, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, obj[key])
+        digest.update(b");")
+    else:
+        if hasattr(obj, '__dict__'):
+            fields = {k: v for k, v in vars(obj).items() if not k.startswith('_')}
+        else:
+            slots = [name for cls in type(obj).__mro__ for name in getattr(cls, '__slots__', ())]
+            fields = {k: getattr(obj, k) for k in slots if not k.startswith('_') and hasattr(obj, k)}
+        digest.update(f"{type(obj).__qualname__}".encode())
+        _update_digest(digest, fields)
+
+
+def fingerprint(*objects: Any) -> str:
+    """
+    Content hash of the given objects' fields.
+
+    :param objects: Objects to fingerprint (model instances, containers, scalars, arrays).
+    :return: Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    _update_digest(digest, objects)
+    return digest.hexdigest()
+
+
+class SimulationCache:
+    def __init__(self, maxsize: int = 256, directory: Optional[str] = None):
+        """
+        Initialize a content-addressed result cache.
+
+        :param maxsize: Maximum number of results kept in memory (least recently used are evicted).
+        :param directory: Optional directory for an on-disk store that survives restarts.
+        """
+        self.maxsize = maxsize
+        self.directory = directory
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _disk_path(self, key: str) -> str:
+        """
+        Path of the on-disk entry for key.
+
+        :param key: Fingerprint of the inputs.
+        :return: File path inside the cache directory.
+        """
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up a result by key, checking memory first and then the on-disk store.
+
+        :param key: Fingerprint of the inputs.
+        :param default: Value returned on a miss.
+        :return: Cached result or default.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._entries[key])
+        if self.directory and os.path.exists(self._disk_path(key)):
+            try:
+                with open(self._disk_path(key), 'rb') as fh:
+                    value = pickle.load(fh)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            else:
+                self._store(key, value)
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                return copy.deepcopy(value)
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def _store(self, key: str, value: Any):
+        """
+        Insert into the in-memory LRU, evicting the least recently used entries.
+
+        :param key: Fingerprint of the inputs.
+        :param value: Result to keep.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def put(self, key: str, value: Any):
+        """
+        Store a result in memory and, if configured, on disk.
+
+        :param key: Fingerprint of the inputs.
+        :param value: Result to cache.
+        """
+        value = copy.deepcopy(value)
+        self._store(key, value)
+        if self.directory:
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as fh:
+                    pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self._disk_path(key))
+            except Exception as e:
+                logger.warning(f"Failed to persist cache entry {key}: {e}")
+
+    def memoize(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Return func(*args, **kwargs), computing it only if the inputs have not been seen.
+
+        The key covers CACHE_VERSION, the function's qualified name and the argument fields.
+
+        :param func: Function to call on a miss.
+        :param args: Positional arguments, part of the fingerprint.
+        :param kwargs: Keyword arguments, part of the fingerprint.
+        :return: Result of the call.
+        """
+        key = fingerprint(CACHE_VERSION, func.__module__, func.__qualname__, args, kwargs)
+        result = self.get(key, _MISSING)
+        if result is _MISSING:
+            result = func(*args, **kwargs)
+            self.put(key, result)
+        return result
+
+    def clear(self):
+        """
+        Drop all in-memory entries and reset the counters (the on-disk store is kept).
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.disk_hits = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Hit/miss counters and current size.
+
+        :return: Dictionary with 'hits', 'misses', 'disk_hits' and 'size'.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'disk_hits': self.disk_hits, 'size': len(self._entries)}
+
+
+_default_cache = SimulationCache(directory=os.environ.get('ME_PAVEMENT_CACHE_DIR') or None)
+
+
+def get_default_cache() -> SimulationCache:
+    """
+    Process-wide cache used by the cached_* wrappers.
+
+    :return: The default SimulationCache.
+    """
+    return _default_cache
+
+
+def configure_default_cache(maxsize: int = 256, directory: Optional[str] = None) -> SimulationCache:
+    """
+    Replace the process-wide cache, e.g. to enable the on-disk store.
+
+    :param maxsize: Maximum number of in-memory results.
+    :param directory: Optional directory for the on-disk store.
+    :return: The new default SimulationCache.
+    """
+    global _default_cache
+    _default_cache = SimulationCache(maxsize=maxsize, directory=directory)
+    return _default_cache
+
+
+def cached_design_new_pavement(pavement, traffic_data, climate_data, subgrade_props, material_props) -> Dict[str, float]:
+    """
+    design_new_pavement served from the default cache when the inputs are unchanged.
+
+    :param pavement: Pavement structure.
+    :param traffic_data: Traffic data.
+    :param climate_data: Climate data.
+    :param subgrade_props: Subgrade properties.
+    :param material_props: Material properties.
+    :return: Dictionary with predicted distresses.
+    """
+    return _default_cache.memoize(design_new_pavement, pavement, traffic_data, climate_data, subgrade_props, material_props)
+
+
+def cached_perform_LCCA_over_time(initial_cost: float, maintenance_costs: Dict[int, float], discount_rate: float,
+                                  analysis_period: int) -> Tuple[float, np.ndarray]:
+    """
+    perform_LCCA_over_time served from the default cache when the inputs are unchanged.
+
+    :param initial_cost: Initial construction cost.
+    :param maintenance_costs: Maintenance costs with year as key.
+    :param discount_rate: Annual discount rate.
+    :param analysis_period: Number of years to analyze.
+    :return: Tuple of (total lifecycle cost, cumulative lifecycle cost at the end of each year).
+    """
+    return _default_cache.memoize(perform_LCCA_over_time, initial_cost, maintenance_costs, discount_rate, analysis_period)
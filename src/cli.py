@@ -0,0 +1,304 @@
+# src/cli.py
+"""
+Headless command-line runner for the design engine.
+
+Examples (from the repository root):
+
+    python -m src.cli scenarios.csv -o results.csv --axle-loads 80,100,120 --maintenance 5:100000,10:150000
+    python -m src.cli scenarios.parquet -o results.parquet --workers 8 --chunk-size 50000
+    python -m src.cli inputs.xlsx -o results.csv --initial-cost 1000000 --discount-rate 3 --report report.pdf
+    python -m src.cli scenarios.csv -o results.csv --wim station_2024.parquet --bin-width 2
+    python -m src.cli scenarios.csv -o results.csv --store projects.db --project A1 --section KM12
+    python -m src.cli projects.db -o a1.csv --project A1 --since 2024-01-01
+    python -m src.cli sections.csv -o section_results.csv --network --axle-loads 80,100,120 --limit Rutting=12.5
+
+Only NumPy and the engine modules are imported at start-up. pandas (Excel input),
+pyarrow (Parquet) and reportlab (PDF reports) are imported only when a feature needs them.
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.ingestion import iter_scenario_chunks, read_scenarios, write_result_pages, write_results
+from src.utils.logger import setup_logger, configure_logging
+
+logger = setup_logger(__name__)
+
+STORE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+
+def parse_axle_loads(text: str) -> List[float]:
+    """
+    Parse comma-separated axle loads, as entered in the app.
+
+    :param text: e.g. "80, 100, 120".
+    :return: List of loads in kN.
+    """
+    return [float(load.strip()) for load in text.split(',') if load.strip()]
+
+
+def parse_maintenance_costs(text: str) -> Dict[int, float]:
+    """
+    Parse 'Year:Cost' pairs separated by commas, as entered in the app.
+
+    :param text: e.g. "5:100000, 10:150000".
+    :return: Maintenance costs with year as key.
+    """
+    costs = {}
+    for item in text.split(','):
+        if ':' in item:
+            year, cost = item.strip().split(':')
+            costs[int(year)] = float(cost)
+        elif item.strip():
+            logger.warning(f"Ignoring invalid maintenance cost entry: '{item}'")
+    return costs
+
+
+def _shared_spectrum(args: argparse.Namespace):
+    """
+    Shared axle loads and counts from --axle-loads or a streamed --wim file.
+
+    :param args: Parsed command-line arguments.
+    :return: Tuple of (axle loads or None, load counts or None).
+    """
+    axle_loads = parse_axle_loads(args.axle_loads) if args.axle_loads else None
+    load_counts = None
+    if args.wim:
+        from src.ingestion import traffic_from_wim
+
+        wim_traffic = traffic_from_wim(args.wim, 0.0, 1, args.wim_column, args.bin_width,
+                                       type_column=args.wim_type_column, max_load=args.wim_max_load)
+        axle_loads, load_counts = wim_traffic.axle_loads, wim_traffic.load_counts
+    return axle_loads, load_counts
+
+
+def _add_lcca_defaults(columns: Dict[str, np.ndarray], args: argparse.Namespace) -> Dict[str, np.ndarray]:
+    """
+    Fill the initial cost and discount rate columns from the command line when the file lacks them.
+
+    :param columns: Scenario columns (updated in place).
+    :param args: Parsed command-line arguments.
+    :return: The same columns.
+    """
+    if 'initial_cost' not in columns and args.initial_cost is not None:
+        columns['initial_cost'] = np.full(len(next(iter(columns.values()))), args.initial_cost)
+    if 'discount_rate' not in columns and args.discount_rate is not None:
+        columns['discount_rate'] = np.full(len(next(iter(columns.values()))), args.discount_rate / 100)
+    return columns
+
+
+def run_scenario_file(args: argparse.Namespace) -> Dict[str, np.ndarray]:
+    """
+    Evaluate every row of a CSV/Parquet scenario file.
+
+    :param args: Parsed command-line arguments.
+    :return: Input columns followed by result columns.
+    """
+    from src.parallel import run_parallel_sweep
+
+    columns = _add_lcca_defaults(read_scenarios(args.input), args)
+    axle_loads, load_counts = _shared_spectrum(args)
+    results = run_parallel_sweep(columns, axle_loads, parse_maintenance_costs(args.maintenance),
+                                 max_workers=args.workers, chunk_size=args.chunk_size, load_counts=load_counts)
+    return {**columns, **results}
+
+
+def parse_limits(items: Optional[List[str]]) -> Dict[str, float]:
+    """
+    Parse 'Result=Value' limits, e.g. ['Rutting=12.5'].
+
+    :param items: Raw --limit values.
+    :return: Limit per result name.
+    """
+    limits = {}
+    for item in items or ():
+        if '=' not in item:
+            raise ValueError(f"Invalid limit '{item}'. Use 'Result=Value', e.g. 'Rutting=12.5'.")
+        name, value = item.split('=', 1)
+        limits[name.strip()] = float(value)
+    return limits
+
+
+def run_network(args: argparse.Namespace) -> Dict[str, float]:
+    """
+    Network mode: stream a sections file through the pipeline and aggregate network KPIs.
+
+    :param args: Parsed command-line arguments.
+    :return: Network KPIs.
+    """
+    from src.network import run_network_analysis
+
+    axle_loads, load_counts = _shared_spectrum(args)
+    chunks = (_add_lcca_defaults(chunk, args) for chunk in iter_scenario_chunks(args.input, args.chunk_size))
+    kpis = run_network_analysis(chunks, args.output, axle_loads, parse_maintenance_costs(args.maintenance),
+                                parse_limits(args.limit), max_workers=args.workers, chunk_size=args.chunk_size,
+                                load_counts=load_counts)
+    for name, value in kpis.items():
+        logger.info(f"{name}: {value:,.4g}")
+    if args.reports:
+        from src.reporting import section_reports, export_reports
+
+        # Reports are built from the written results, one chunk at a time.
+        n_reports = export_reports(section_reports(iter_scenario_chunks(args.output, args.chunk_size)), args.reports)
+        logger.info(f"{n_reports} section report(s) written to {args.reports}")
+    if args.kpi_output:
+        import json
+
+        with open(args.kpi_output, 'w') as fh:
+            json.dump(kpis, fh, indent=2)
+        logger.info(f"Network KPIs written to {args.kpi_output}")
+    return kpis
+
+
+def run_workbook(args: argparse.Namespace) -> Dict[str, np.ndarray]:
+    """
+    Evaluate the single design described by an input workbook (same sheets as the app).
+
+    :param args: Parsed command-line arguments.
+    :return: One-row result columns.
+    """
+    from src.lcca import perform_LCCA
+    from src.models import TrafficData, ClimateData, SubgradeProperties, MaterialProperties
+    from src.performance import design_new_pavement
+    from src.utils.helpers import read_excel
+
+    sheets = read_excel(args.input)
+    ordered = list(sheets.values())
+
+    def sheet(name: str, position: int):
+        if name in sheets:
+            return sheets[name]
+        if position < len(ordered):
+            return ordered[position]
+        raise ValueError(f"Workbook has no '{name}' sheet.")
+
+    traffic_data = TrafficData.from_dataframe(sheet('Traffic', 0))
+    climate_data = ClimateData.from_dataframe(sheet('Climate', 1))
+    subgrade_props = SubgradeProperties.from_dataframe(sheet('Subgrade', 2))
+    material_props = MaterialProperties.from_dataframe(sheet('Materials', 3))
+    results = design_new_pavement(None, traffic_data, climate_data, subgrade_props, material_props)
+    if args.initial_cost is not None and args.discount_rate is not None:
+        results['Lifecycle Cost'] = perform_LCCA(args.initial_cost, parse_maintenance_costs(args.maintenance),
+                                                 args.discount_rate / 100, traffic_data.analysis_period)
+    if args.report:
+        from src.reporting import generate_report, export_report_to_pdf
+
+        distresses = {k: v for k, v in results.items() if k != 'Lifecycle Cost'}
+        export_report_to_pdf(generate_report(distresses, results.get('Lifecycle Cost', 0.0)), args.report)
+    return {key: np.array([value]) for key, value in results.items()}
+
+
+def export_store(args: argparse.Namespace) -> int:
+    """
+    Page through the scenarios of a project store matching the filters and write them out.
+
+    :param args: Parsed command-line arguments.
+    :return: Number of scenarios written.
+    """
+    from src.store import ProjectStore, SUMMARY_COLUMNS
+
+    with ProjectStore(args.input) as store:
+        pages = store.iter_scenarios(page_size=args.chunk_size, project=args.project, section=args.section,
+                                     date_from=args.since, date_to=args.until)
+        columns = ({name: np.array([scenario[name] for scenario in page], dtype=object) for name in SUMMARY_COLUMNS}
+                   for page in pages)
+        return write_result_pages(args.output, columns)
+
+
+def store_results(args: argparse.Namespace, columns: Dict[str, np.ndarray]):
+    """
+    Bulk-insert evaluated scenarios into the project store given by --store.
+
+    :param args: Parsed command-line arguments.
+    :param columns: Input and result columns, one row per scenario.
+    """
+    from src.store import ProjectStore
+
+    with ProjectStore(args.store) as store:
+        store.bulk_insert(columns, project=args.project or 'default', section=args.section or '',
+                          batch_size=args.chunk_size)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Command-line interface definition.
+
+    :return: Argument parser.
+    """
+    parser = argparse.ArgumentParser(prog='python -m src.cli',
+                                     description="Headless ME pavement design runner.")
+    parser.add_argument('input', help="Scenario file (.csv/.parquet, one row per scenario), input workbook (.xlsx) "
+                                      "or project store (.db) to export stored scenarios from.")
+    parser.add_argument('-o', '--output', required=True, help="Results file (.csv or .parquet).")
+    parser.add_argument('--axle-loads', help="Shared axle loads in kN, e.g. '80,100,120'. Without it the "
+                                             "scenario file must provide axle_load_sum and axle_load_cube_sum.")
+    parser.add_argument('--wim', help="Weigh-in-motion file (.csv/.parquet) streamed into a shared binned load spectrum.")
+    parser.add_argument('--wim-column', default='Axle_Load', help="Axle-load column of the WIM file.")
+    parser.add_argument('--wim-type-column', help="Axle-type column (single/tandem/tridem) of the WIM file; "
+                                                  "loads are then read as axle-group loads.")
+    parser.add_argument('--bin-width', type=float, default=1.0, help="Load bin width in kN for WIM input.")
+    parser.add_argument('--wim-max-load', type=float,
+                        help="Skip WIM loads above this value in kN as implausible (e.g. corrupt records).")
+    parser.add_argument('--maintenance', default='', help="Maintenance costs as 'Year:Cost' pairs, comma-separated.")
+    parser.add_argument('--initial-cost', type=float, help="Initial construction cost, if not a scenario column.")
+    parser.add_argument('--discount-rate', type=float, help="Discount rate in %% per annum, if not a scenario column.")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes for scenario files.")
+    parser.add_argument('--chunk-size', type=int, default=10000, help="Scenarios per worker chunk.")
+    parser.add_argument('--report', help="Also export a PDF report (workbook input only).")
+    parser.add_argument('--network', action='store_true', help="Network mode: treat the input as a sections table, "
+                                                               "stream per-section results and report network KPIs.")
+    parser.add_argument('--limit', action='append', help="Network distress limit as 'Result=Value' (repeatable), "
+                                                         "e.g. 'Rutting=12.5'.")
+    parser.add_argument('--kpi-output', help="Write the network KPIs to this JSON file.")
+    parser.add_argument('--reports', help="Network mode: also export one report per section to a multi-page "
+                                          ".pdf or a .zip of PDFs.")
+    parser.add_argument('--store', help="Also save the evaluated scenarios to this project store (.db).")
+    parser.add_argument('--project', help="Project of stored scenarios (saving) or project filter (export).")
+    parser.add_argument('--section', help="Section of stored scenarios without a 'section' column, or section filter.")
+    parser.add_argument('--since', help="Export scenarios run on or after this ISO date.")
+    parser.add_argument('--until', help="Export scenarios run before this ISO date.")
+    parser.add_argument('--log-file', default=None, help="Log file (defaults to the project log).")
+    parser.add_argument('--quiet', action='store_true', help="Do not echo log records to the console.")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    :param argv: Optional argument list (defaults to sys.argv).
+    :return: Process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    configure_logging(log_file=args.log_file, console=not args.quiet)
+    start = time.perf_counter()
+    try:
+        if args.network:
+            kpis = run_network(args)
+            logger.info(f"Analysed {int(kpis['Sections'])} section(s) in {time.perf_counter() - start:.2f} s.")
+            return 0
+        if args.input.lower().endswith(STORE_EXTENSIONS):
+            n_rows = export_store(args)
+            logger.info(f"Exported {n_rows} stored scenario(s) in {time.perf_counter() - start:.2f} s.")
+            return 0
+        if args.input.lower().endswith(('.xlsx', '.xls')):
+            columns = run_workbook(args)
+        else:
+            columns = run_scenario_file(args)
+        write_results(args.output, columns)
+        if args.store:
+            store_results(args, columns)
+    except Exception as e:
+        logger.error(f"Run failed: {e}")
+        return 1
+    n_rows = len(next(iter(columns.values()))) if columns else 0
+    logger.info(f"Evaluated {n_rows} scenario(s) in {time.perf_counter() - start:.2f} s.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
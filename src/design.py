@@ -1,6 +1,31 @@
 # src/design.py
 
-from typing import List, Tuple
+import itertools
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models import TrafficData, ClimateData, SubgradeProperties, MaterialProperties
+from src.performance import batch_scenario, design_new_pavement_batch
+from src.response import critical_strains, layer_moduli, mechanistic_damage, subgrade_elastic_modulus
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Structural layer coefficients per inch (AASHTO 1993 typical values).
+LAYER_COEFFICIENTS = {'Asphalt': 0.44, 'Concrete': 0.50, 'Base': 0.14, 'Sub-base': 0.11}
+# Exponent of (SN + 1) in the AASHTO flexible design equation; allowable traffic grows with (SN + 1) ** 9.36.
+STRUCTURAL_NUMBER_EXPONENT = 9.36
+# Default searched thickness range (mm) for each layer type.
+DEFAULT_THICKNESS_BOUNDS = {'Asphalt': (50.0, 300.0), 'Concrete': (150.0, 350.0),
+                            'Base': (100.0, 400.0), 'Sub-base': (0.0, 400.0)}
+DISTRESS_KEYS = ('Fatigue Cracking', 'Rutting', 'Thermal Cracking')
+
+# An evaluator maps (layer types, thickness matrix of shape candidates x layers) to an array of
+# each distress per candidate. Distresses must not increase when any thickness increases.
+StructureEvaluator = Callable[[Tuple[str, ...], np.ndarray], Dict[str, np.ndarray]]
+
 
 def design_pavement_structure(layers: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
     """
@@ -14,3 +39,275 @@ def design_pavement_structure(layers: List[Tuple[str, float]]) -> List[Tuple[str
         return pavement_design
     except Exception as e:
         raise ValueError(f"Error in pavement structure design: {e}")
+
+
+def structural_number(layer_types: Sequence[str], thicknesses: np.ndarray) -> np.ndarray:
+    """
+    Structural number SN = sum(a_i * D_i) of each candidate, with D_i in inches.
+
+    :param layer_types: Type of each layer.
+    :param thicknesses: Thickness matrix in mm (candidates x layers).
+    :return: Structural number of each candidate.
+    """
+    coefficients = np.array([LAYER_COEFFICIENTS[layer_type] for layer_type in layer_types])
+    return np.asarray(thicknesses, dtype=float) / 25.4 @ coefficients
+
+
+def structural_number_evaluator(traffic_data: TrafficData, climate_data: ClimateData,
+                                subgrade_props: SubgradeProperties, material_props: MaterialProperties,
+                                reference_structural_number: float = 3.0) -> StructureEvaluator:
+    """
+    Build an evaluator that scales the closed-form distress predictions by structure.
+
+    The predictions of design_new_pavement are taken to hold for a structure with the
+    reference structural number; load-related damage of another structure is scaled by
+    ((SN_ref + 1) / (SN + 1)) ** 9.36, the inverse of its relative allowable traffic.
+    Thermal cracking does not depend on the structure.
+
+    :param traffic_data: Traffic data.
+    :param climate_data: Climate data.
+    :param subgrade_props: Subgrade properties.
+    :param material_props: Material properties.
+    :param reference_structural_number: Structural number the unscaled predictions refer to.
+    :return: Structure evaluator for optimize_pavement_structure.
+    """
+    scenario = {column: [value] for column, value in
+                batch_scenario(traffic_data, climate_data, subgrade_props, material_props).items()}
+    base = design_new_pavement_batch(scenario, traffic_data.axle_loads, getattr(traffic_data, 'load_counts', None))
+    base = {key: float(values[0]) for key, values in base.items()}
+
+    def evaluate(layer_types: Tuple[str, ...], thicknesses: np.ndarray) -> Dict[str, np.ndarray]:
+        sn = structural_number(layer_types, thicknesses)
+        scale = ((reference_structural_number + 1) / (sn + 1)) ** STRUCTURAL_NUMBER_EXPONENT
+        return {
+            'Fatigue Cracking': base['Fatigue Cracking'] * scale,
+            'Rutting': base['Rutting'] * scale,
+            'Thermal Cracking': np.full(sn.shape, base['Thermal Cracking'])
+        }
+
+    return evaluate
+
+
+def mechanistic_evaluator(traffic_data: TrafficData, climate_data: ClimateData,
+                          subgrade_props: SubgradeProperties, material_props: MaterialProperties,
+                          layer_moduli_overrides: Optional[Dict[str, float]] = None) -> StructureEvaluator:
+    """
+    Build an evaluator from layered-elastic strains (see src.response).
+
+    'Fatigue Cracking' and 'Rutting' are Miner's damage ratios over the analysis period
+    (1.0 = end of service life) from the Asphalt Institute transfer functions; 'Thermal
+    Cracking' is the structure-independent thermal cracking index. Thin top layers use the
+    conservative strain envelope so that damage never increases with thickness.
+
+    :param traffic_data: Traffic data.
+    :param climate_data: Climate data.
+    :param subgrade_props: Subgrade properties.
+    :param material_props: Material properties.
+    :param layer_moduli_overrides: Optional moduli (MPa) per layer type.
+    :return: Structure evaluator for optimize_pavement_structure.
+    """
+    subgrade_modulus = subgrade_elastic_modulus(subgrade_props)
+    thermal = material_props.thermal_coeff * climate_data.temperature_variation
+
+    def evaluate(layer_types: Tuple[str, ...], thicknesses: np.ndarray) -> Dict[str, np.ndarray]:
+        moduli = layer_moduli(layer_types, material_props, layer_moduli_overrides)
+        strains = critical_strains(thicknesses, moduli, subgrade_modulus, thin_layer_envelope=True)
+        damage = mechanistic_damage(strains, moduli[0], traffic_data)
+        return {
+            'Fatigue Cracking': damage['Fatigue Damage'],
+            'Rutting': damage['Rutting Damage'],
+            'Thermal Cracking': np.full(len(strains['tensile_strain']), thermal)
+        }
+
+    return evaluate
+
+
+class _Search:
+    def __init__(self, evaluator: StructureEvaluator, limits: Dict[str, float], batch_size: int):
+        """
+        Shared state of one optimization run: evaluator, limits and evaluation count.
+
+        :param evaluator: Structure evaluator.
+        :param limits: Maximum allowed value of each limited distress.
+        :param batch_size: Maximum number of candidates per evaluator call.
+        """
+        self.evaluator = evaluator
+        self.limits = limits
+        self.batch_size = batch_size
+        self.evaluations = 0
+
+    def feasible(self, layer_types: Tuple[str, ...], thicknesses: np.ndarray) -> np.ndarray:
+        """
+        Whether each candidate meets every distress limit, evaluated in batches.
+
+        :param layer_types: Type of each layer.
+        :param thicknesses: Thickness matrix in mm (candidates x layers).
+        :return: Boolean array, one entry per candidate.
+        """
+        ok = np.ones(len(thicknesses), dtype=bool)
+        for start in range(0, len(thicknesses), self.batch_size):
+            chunk = thicknesses[start:start + self.batch_size]
+            distresses = self.evaluator(layer_types, chunk)
+            for key, limit in self.limits.items():
+                ok[start:start + len(chunk)] &= np.asarray(distresses[key]) <= limit
+        self.evaluations += len(thicknesses)
+        return ok
+
+    def bisect_last(self, layer_types: Tuple[str, ...], prefixes: np.ndarray, grid: np.ndarray) -> np.ndarray:
+        """
+        Smallest grid thickness of the last layer that makes each prefix feasible.
+
+        Every prefix must be feasible with the last layer at grid[-1].
+
+        :param layer_types: Type of each layer.
+        :param prefixes: Thicknesses of all layers but the last (candidates x layers - 1).
+        :param grid: Sorted thickness grid of the last layer.
+        :return: Index into grid for each prefix.
+        """
+        low = np.zeros(len(prefixes), dtype=int)
+        high = np.full(len(prefixes), grid.size - 1)
+        while True:
+            active = low < high
+            if not active.any():
+                return high
+            mid = (low[active] + high[active]) // 2
+            ok = self.feasible(layer_types, np.column_stack([prefixes[active], grid[mid]]))
+            high[np.flatnonzero(active)[ok]] = mid[ok]
+            low[np.flatnonzero(active)[~ok]] = mid[~ok] + 1
+
+    def solve(self, layer_types: Tuple[str, ...], grids: List[np.ndarray],
+              costs: np.ndarray) -> Optional[Tuple[float, np.ndarray]]:
+        """
+        Cheapest feasible thicknesses for one sequence of layer types (branch and bound).
+
+        Layers are fixed one at a time over their grids. Because distresses do not increase
+        with thickness, a prefix is dropped when it fails even with the remaining layers at
+        their maximum, and completed immediately when it passes with them at their minimum.
+        Survivors are completed with the middle layers at maximum and the last layer bisected,
+        which gives an incumbent cost; prefixes whose lower bound reaches it are pruned.
+
+        :param layer_types: Type of each layer.
+        :param grids: Sorted thickness grid of each layer.
+        :param costs: Cost per mm of each layer.
+        :return: Tuple of (cost, thicknesses), or None if no structure meets the limits.
+        """
+        lows = np.array([grid[0] for grid in grids])
+        highs = np.array([grid[-1] for grid in grids])
+        n_layers = len(grids)
+        if not self.feasible(layer_types, highs[None, :])[0]:
+            return None
+        if self.feasible(layer_types, lows[None, :])[0]:
+            return float(costs @ lows), lows
+
+        best_cost, best = float(costs @ highs), highs
+        prefixes = np.zeros((1, 0))
+        for level in range(n_layers - 1):
+            grid = grids[level]
+            prefixes = np.column_stack([np.repeat(prefixes, grid.size, axis=0), np.tile(grid, len(prefixes))])
+            prefix_cost = prefixes @ costs[:level + 1]
+            rest_low = lows[level + 1:]
+            bound = prefix_cost + costs[level + 1:] @ rest_low
+            keep = bound < best_cost
+            prefixes, prefix_cost, bound = prefixes[keep], prefix_cost[keep], bound[keep]
+
+            reachable = self.feasible(layer_types, np.column_stack([prefixes, np.tile(highs[level + 1:], (len(prefixes), 1))]))
+            prefixes, prefix_cost, bound = prefixes[reachable], prefix_cost[reachable], bound[reachable]
+            if not len(prefixes):
+                break
+
+            done = self.feasible(layer_types, np.column_stack([prefixes, np.tile(rest_low, (len(prefixes), 1))]))
+            if done.any():
+                index = np.argmin(bound[done])
+                if bound[done][index] < best_cost:
+                    best_cost = float(bound[done][index])
+                    best = np.concatenate([prefixes[done][index], rest_low])
+            prefixes, prefix_cost, bound = prefixes[~done], prefix_cost[~done], bound[~done]
+
+            if level < n_layers - 2 and len(prefixes):
+                middle = np.tile(highs[level + 1:-1], (len(prefixes), 1))
+                last = grids[-1][self.bisect_last(layer_types, np.column_stack([prefixes, middle]), grids[-1])]
+                upper = prefix_cost + costs[level + 1:-1] @ highs[level + 1:-1] + costs[-1] * last
+                index = np.argmin(upper)
+                if upper[index] < best_cost:
+                    best_cost = float(upper[index])
+                    best = np.concatenate([prefixes[index], highs[level + 1:-1], [last[index]]])
+            keep = bound < best_cost
+            prefixes = prefixes[keep]
+            if not len(prefixes):
+                break
+
+        if len(prefixes):
+            last = grids[-1][self.bisect_last(layer_types, prefixes, grids[-1])]
+            total = prefixes @ costs[:-1] + costs[-1] * last
+            index = np.argmin(total)
+            if total[index] < best_cost:
+                best_cost = float(total[index])
+                best = np.append(prefixes[index], last[index])
+        return best_cost, best
+
+
+def optimize_pavement_structure(layer_options: Sequence[Sequence[str]], layer_costs: Dict[str, float],
+                                limits: Dict[str, float], evaluator: StructureEvaluator,
+                                thickness_bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+                                step: float = 10.0, batch_size: int = 200000) -> Dict[str, object]:
+    """
+    Find the minimum-cost layer stack whose predicted distresses stay within limits.
+
+    Every combination of the allowed layer types is searched; for each one the layer
+    thicknesses are chosen on a grid of the given step by a vectorized branch and bound
+    (see _Search.solve). The evaluator must predict distresses that do not increase with
+    any layer thickness.
+
+    :param layer_options: Allowed layer types for each position, top to bottom,
+                          e.g. [['Asphalt', 'Concrete'], ['Base'], ['Sub-base']].
+    :param layer_costs: Cost per mm of each layer type.
+    :param limits: Maximum allowed value of each distress, e.g. {'Rutting': 12.5}.
+    :param evaluator: Structure evaluator, e.g. from mechanistic_evaluator or structural_number_evaluator.
+    :param thickness_bounds: Overrides of DEFAULT_THICKNESS_BOUNDS per layer type (mm).
+    :param step: Thickness grid step in mm.
+    :param batch_size: Maximum number of candidates per evaluator call.
+    :return: Dictionary with 'layers' ([(type, thickness)]), 'cost', 'distresses',
+             'evaluations' and 'elapsed' (seconds).
+    """
+    if not layer_options or any(not options for options in layer_options):
+        raise ValueError("Every layer position needs at least one allowed layer type.")
+    if step <= 0:
+        raise ValueError("Thickness step must be positive.")
+    unknown = [key for key in limits if key not in DISTRESS_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown distress limits {unknown}. Choose from {list(DISTRESS_KEYS)}.")
+    bounds = dict(DEFAULT_THICKNESS_BOUNDS)
+    bounds.update(thickness_bounds or {})
+
+    start = time.perf_counter()
+    search = _Search(evaluator, limits, batch_size)
+    best = None
+    for layer_types in itertools.product(*layer_options):
+        missing = [layer_type for layer_type in layer_types if layer_type not in layer_costs or layer_type not in bounds]
+        if missing:
+            raise ValueError(f"No cost or thickness bounds for layer types: {sorted(set(missing))}")
+        grids = []
+        for layer_type in layer_types:
+            low, high = bounds[layer_type]
+            grids.append(np.append(np.arange(low, high, step), float(high)))
+        costs = np.array([layer_costs[layer_type] for layer_type in layer_types], dtype=float)
+        solution = search.solve(tuple(layer_types), grids, costs)
+        if solution is not None and (best is None or solution[0] < best[0]):
+            best = (solution[0], tuple(layer_types), solution[1])
+    elapsed = time.perf_counter() - start
+
+    if best is None:
+        logger.error(f"No layer stack within the thickness bounds meets the distress limits {limits}.")
+        raise ValueError("No pavement structure within the thickness bounds meets the distress limits.")
+    cost, layer_types, thicknesses = best
+    distresses = {key: float(np.asarray(values)[0])
+                  for key, values in evaluator(layer_types, thicknesses[None, :]).items()}
+    logger.info(f"Optimized structure {list(zip(layer_types, thicknesses.tolist()))} at cost ${cost:,.2f} "
+                f"after {search.evaluations} evaluations in {elapsed:.3f} s.")
+    return {
+        'layers': [(layer_type, float(thickness)) for layer_type, thickness in zip(layer_types, thicknesses)],
+        'cost': cost,
+        'distresses': distresses,
+        'evaluations': search.evaluations,
+        'elapsed': elapsed
+    }
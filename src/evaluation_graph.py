@@ -0,0 +1,333 @@
+# src/evaluation_graph.py
+
+import logging
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.cache import CACHE_VERSION, SimulationCache, fingerprint
+from src.models import Pavement, TrafficData, ClimateData, SubgradeProperties, MaterialProperties
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Scalar inputs of the graph and the model attribute each one is read from.
+MODEL_INPUTS = {
+    'traffic': {'traffic_growth_rate': 'traffic_growth_rate', 'analysis_period': 'analysis_period'},
+    'climate': {'rainfall': 'rainfall', 'temperature_variation': 'temperature_variation'},
+    'subgrade': {'subgrade_modulus': 'modulus'},
+    'material': {'asphalt_modulus': 'asphalt_modulus', 'thermal_coeff': 'thermal_coeff'},
+    'pavement': {'layers': 'layers', 'pavement_type': 'pavement_type'}
+}
+LCCA_INPUTS = ('initial_cost', 'maintenance_costs', 'discount_rate', 'lcca_period')
+OUTPUTS = ('Fatigue Cracking', 'Rutting', 'Thermal Cracking', 'Lifecycle Cost')
+
+_MISSING = object()
+
+
+class _Node(NamedTuple):
+    """
+    One computation of the graph.
+
+    Regular nodes are called as compute(deps). Yearly nodes produce one value per analysis
+    year and are called as compute(deps, years) for the year indices still missing, so a
+    longer period only computes its tail; period names the input holding the number of years.
+    """
+    dependencies: Tuple[str, ...]
+    compute: Callable
+    period: Optional[str] = None
+
+
+def _load_moment(power: float) -> Callable:
+    """
+    Node function for the base-year spectrum moment sum(counts * load ** power), as TrafficData.load_moment.
+
+    :param power: Exponent applied to every load.
+    :return: Node compute function.
+    """
+    def compute(deps: Dict[str, Any]) -> float:
+        loads = deps['axle_loads']
+        if deps['load_counts'] is None:
+            return float(np.sum(loads ** power))
+        return float(np.dot(deps['load_counts'], loads ** power))
+
+    return compute
+
+
+def _maintenance_per_year(deps: Dict[str, Any], years: np.ndarray) -> np.ndarray:
+    """
+    Maintenance cost of the given year indices (0 = year 1).
+
+    :param deps: Dependency values.
+    :param years: Year indices.
+    :return: Costs aligned with years.
+    """
+    costs = np.zeros(years.size)
+    for year, cost in deps['maintenance_costs'].items():
+        index = int(year) - 1 - (int(years[0]) if years.size else 0)
+        if 0 <= index < years.size:
+            costs[index] += cost
+    return costs
+
+
+def _lcc_over_time(deps: Dict[str, Any]) -> np.ndarray:
+    """
+    Cumulative lifecycle cost at the end of each year.
+
+    :param deps: Dependency values.
+    :return: Array of cumulative present values.
+    """
+    return deps['initial_cost'] + np.cumsum(deps['maintenance_per_year'] * deps['discount_factors'])
+
+
+# Nodes in topological order. The per-year formulas match compute_distress_arrays and
+# calculate_LCCA_over_time.
+NODES = {
+    'load_moment_1': _Node(('axle_loads', 'load_counts'), _load_moment(1)),
+    'load_moment_3': _Node(('axle_loads', 'load_counts'), _load_moment(3)),
+    'fatigue_per_year': _Node(
+        ('traffic_growth_rate', 'analysis_period', 'load_moment_3', 'asphalt_modulus'),
+        lambda deps, years: ((1 + deps['traffic_growth_rate']) ** years) ** 3
+        * (deps['load_moment_3'] / deps['asphalt_modulus'] ** 3),
+        period='analysis_period'),
+    'rutting_per_year': _Node(
+        ('traffic_growth_rate', 'analysis_period', 'load_moment_1', 'subgrade_modulus', 'rainfall'),
+        lambda deps, years: (1 + deps['traffic_growth_rate']) ** years
+        * (deps['load_moment_1'] / deps['subgrade_modulus'] * (deps['rainfall'] / 1000)),
+        period='analysis_period'),
+    'Fatigue Cracking': _Node(('fatigue_per_year',), lambda deps: float(deps['fatigue_per_year'].sum())),
+    'Rutting': _Node(('rutting_per_year',), lambda deps: float(deps['rutting_per_year'].sum())),
+    'Thermal Cracking': _Node(('thermal_coeff', 'temperature_variation'),
+                              lambda deps: deps['thermal_coeff'] * deps['temperature_variation']),
+    'maintenance_per_year': _Node(('maintenance_costs', 'lcca_period'), _maintenance_per_year, period='lcca_period'),
+    'discount_factors': _Node(('discount_rate', 'lcca_period'),
+                              lambda deps, years: (1 + deps['discount_rate']) ** -(years + 1.0),
+                              period='lcca_period'),
+    'lcc_over_time': _Node(('initial_cost', 'maintenance_per_year', 'discount_factors'), _lcc_over_time),
+    'Lifecycle Cost': _Node(('initial_cost', 'lcc_over_time'),
+                            lambda deps: float(deps['lcc_over_time'][-1]) if deps['lcc_over_time'].size
+                            else float(deps['initial_cost']))
+}
+
+
+def _read_only(values: Sequence[float]) -> np.ndarray:
+    """
+    Float array copy of values that cannot be modified after it was fingerprinted.
+
+    :param values: Sequence of numbers.
+    :return: Read-only float array.
+    """
+    array = np.array(values, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+class EvaluationGraph:
+    def __init__(self, cache: Optional[SimulationCache] = None):
+        """
+        Dependency-tracked evaluation of the distress predictions and LCCA.
+
+        Inputs are set individually (set_inputs) or from the model objects (set_models).
+        Only nodes downstream of a changed input are recomputed by evaluate(); e.g. a new
+        rainfall recomputes rutting only, and a new discount rate recomputes the discount
+        factors and lifecycle cost but reuses the per-year maintenance costs. Per-year
+        arrays are kept with the inputs they were computed from, so changing only the
+        analysis period slices or extends them instead of recomputing every year.
+
+        Every input is fingerprinted once when it is set (the axle-load spectrum as one float
+        array), and each node is identified by its name and its dependencies' fingerprints, so
+        large spectra are never re-hashed per node. With a cache, every recomputed node is
+        first looked up by that key, so returning to an earlier input set (in this graph or in
+        another graph sharing the cache) is served from the cache, including its on-disk store.
+
+        The graph itself is not thread-safe; callers sharing it across threads (e.g. background
+        jobs) hold lock around a set_inputs/evaluate sequence.
+
+        :param cache: Optional SimulationCache backing the node computations.
+        """
+        self._inputs: Dict[str, Any] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._node_keys: Dict[str, str] = {}
+        self._values: Dict[str, Any] = {}
+        self._dirty = set(NODES)
+        self._yearly: Dict[str, Tuple[str, np.ndarray]] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        for name, node in NODES.items():
+            for dependency in node.dependencies:
+                self._dependents.setdefault(dependency, []).append(name)
+        self.evaluations = Counter()
+        self.cache = cache
+        self.lock = threading.RLock()
+
+    def _invalidate(self, name: str):
+        """
+        Mark every node downstream of name as dirty.
+
+        :param name: Input or node name.
+        """
+        for dependent in self._dependents.get(name, ()):
+            if dependent not in self._dirty:
+                self._dirty.add(dependent)
+                self._invalidate(dependent)
+
+    def set_inputs(self, **inputs: Any) -> List[str]:
+        """
+        Set raw graph inputs by name; unchanged values do not invalidate anything.
+
+        :param inputs: Input values, e.g. rainfall=650.0 or maintenance_costs={5: 1e5}.
+        :return: Names of the inputs that changed.
+        """
+        changed = []
+        for name, value in inputs.items():
+            key = fingerprint(value)
+            if self._fingerprints.get(name) == key:
+                continue
+            self._inputs[name] = value
+            self._fingerprints[name] = key
+            self._invalidate(name)
+            changed.append(name)
+        if changed:
+            logger.debug("Evaluation graph inputs changed: %s", changed)
+        return changed
+
+    def set_models(self, pavement: Optional[Pavement] = None, traffic_data: Optional[TrafficData] = None,
+                   climate_data: Optional[ClimateData] = None, subgrade_props: Optional[SubgradeProperties] = None,
+                   material_props: Optional[MaterialProperties] = None) -> List[str]:
+        """
+        Set the graph inputs from model objects (or their record counterparts).
+
+        :param pavement: Pavement structure.
+        :param traffic_data: Traffic data.
+        :param climate_data: Climate data.
+        :param subgrade_props: Subgrade properties.
+        :param material_props: Material properties.
+        :return: Names of the inputs that changed.
+        """
+        models = {'pavement': pavement, 'traffic': traffic_data, 'climate': climate_data,
+                  'subgrade': subgrade_props, 'material': material_props}
+        inputs = {}
+        for group, model in models.items():
+            if model is None:
+                continue
+            for name, attribute in MODEL_INPUTS[group].items():
+                inputs[name] = getattr(model, attribute)
+        if traffic_data is not None:
+            counts = getattr(traffic_data, 'load_counts', None)
+            inputs['axle_loads'] = _read_only(traffic_data.axle_loads)
+            inputs['load_counts'] = None if counts is None else _read_only(counts)
+        return self.set_inputs(**inputs)
+
+    def _required(self, name: str, needed: set):
+        """
+        Collect name and everything it depends on.
+
+        :param name: Node or input name.
+        :param needed: Set updated in place.
+        """
+        if name in needed:
+            return
+        needed.add(name)
+        for dependency in NODES[name].dependencies if name in NODES else ():
+            self._required(dependency, needed)
+
+    def _key(self, name: str, node: _Node, exclude: Optional[str] = None) -> str:
+        """
+        Fingerprint of a node from its name and the fingerprints of its dependencies.
+
+        :param name: Node name.
+        :param node: Node definition.
+        :param exclude: Optional dependency left out (the period of a yearly node).
+        :return: Hex digest.
+        """
+        keys = tuple(self._fingerprints[dependency] if dependency in self._inputs else self._node_keys[dependency]
+                     for dependency in node.dependencies if dependency != exclude)
+        return fingerprint(CACHE_VERSION, 'evaluation_graph', name, keys)
+
+    def _compute(self, name: str, node: _Node, deps: Dict[str, Any]) -> Tuple[Any, bool]:
+        """
+        Value of a node, from the cache when it holds the same node and dependency values.
+
+        :param name: Node name.
+        :param node: Node definition.
+        :param deps: Dependency values.
+        :return: Tuple of (value, whether it was computed rather than served from the cache).
+        """
+        key = self._node_keys[name] = self._key(name, node)
+        if self.cache is not None:
+            value = self.cache.get(key, _MISSING)
+            if value is not _MISSING:
+                if node.period is not None:
+                    self._yearly[name] = (self._key(name, node, exclude=node.period), value)
+                return value, False
+        value = self._compute_yearly(name, node, deps) if node.period is not None else node.compute(deps)
+        if self.cache is not None:
+            self.cache.put(key, value)
+        return value, True
+
+    def _compute_yearly(self, name: str, node: _Node, deps: Dict[str, Any]) -> np.ndarray:
+        """
+        Compute a yearly node, reusing the stored array when only its period changed.
+
+        :param name: Node name.
+        :param node: Node definition.
+        :param deps: Dependency values.
+        :return: Array with one value per year of the period.
+        """
+        n_years = int(deps[node.period])
+        key = self._key(name, node, exclude=node.period)
+        stored_key, stored = self._yearly.get(name, (None, None))
+        if stored_key == key and stored.size >= n_years:
+            return stored[:n_years]
+        start = stored.size if stored_key == key else 0
+        tail = np.asarray(node.compute(deps, np.arange(start, n_years, dtype=float)), dtype=float)
+        values = np.concatenate([stored, tail]) if start else tail
+        self._yearly[name] = (key, values)
+        if start:
+            logger.debug("Extended %s from %d to %d years.", name, start, n_years)
+        return values
+
+    def evaluate(self, outputs: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Recompute the dirty nodes needed for the requested outputs.
+
+        :param outputs: Node names to return; defaults to every entry of OUTPUTS whose inputs are set.
+        :return: Mapping of output name to value.
+        """
+        if outputs is None:
+            outputs = [name for name in OUTPUTS if name != 'Lifecycle Cost'
+                       or all(key in self._inputs for key in LCCA_INPUTS)]
+        needed = set()
+        for name in outputs:
+            if name not in NODES:
+                raise ValueError(f"Unknown evaluation graph output '{name}'. Choose from {list(NODES)}.")
+            self._required(name, needed)
+        missing = sorted(name for name in needed if name not in NODES and name not in self._inputs)
+        if missing:
+            logger.error(f"Evaluation graph inputs not set: {missing}")
+            raise ValueError(f"Missing evaluation graph inputs: {missing}")
+
+        recomputed = []
+        for name, node in NODES.items():
+            if name not in needed or name not in self._dirty:
+                continue
+            deps = {dependency: self._inputs[dependency] if dependency in self._inputs else self._values[dependency]
+                    for dependency in node.dependencies}
+            self._values[name], computed = self._compute(name, node, deps)
+            self._dirty.discard(name)
+            if computed:
+                self.evaluations[name] += 1
+                recomputed.append(name)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Evaluation graph recomputed {len(recomputed)} node(s): {recomputed}")
+        return {name: self._values[name] for name in outputs}
+
+    def value(self, name: str) -> Any:
+        """
+        Current value of a node (e.g. 'lcc_over_time' or 'rutting_per_year'), evaluating it if needed.
+
+        :param name: Node name.
+        :return: Node value.
+        """
+        return self.evaluate([name])[name]
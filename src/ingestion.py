@@ -0,0 +1,378 @@
+# src/ingestion.py
+
+import csv
+import itertools
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models import AXLES_PER_GROUP, LoadSpectrum, TrafficData
+from src.parallel import LCCA_INPUT_COLUMNS
+from src.performance import BATCH_INPUT_COLUMNS, BATCH_SPECTRUM_COLUMNS
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_LOAD_COLUMN = 'Axle_Load'
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+# CSV scenario columns read as floats: the model and LCCA inputs and the network section length.
+# Every other column (identifiers, notes, results read back for reports) is kept as text.
+SCENARIO_NUMERIC_COLUMNS = BATCH_INPUT_COLUMNS + BATCH_SPECTRUM_COLUMNS + LCCA_INPUT_COLUMNS + ('length_km',)
+
+
+class LoadSpectrumAccumulator:
+    def __init__(self, bin_width: float = 1.0, max_load: Optional[float] = None):
+        """
+        Incrementally fold raw axle loads into a binned load spectrum.
+
+        Each bin keeps its repetition count and the sum of its loads, so the representative
+        load of a bin is the mean of the axles that fell into it. Only occupied bins are
+        stored (sorted by bin index), so memory depends on the number of distinct bins, not
+        on the number of axles or on how large an outlier load is.
+
+        :param bin_width: Width of each load bin in kN.
+        :param max_load: Optional upper limit in kN; larger loads are rejected as implausible.
+        """
+        if bin_width <= 0:
+            raise ValueError("bin_width must be positive.")
+        if max_load is not None and max_load <= 0:
+            raise ValueError("max_load must be positive.")
+        self.bin_width = bin_width
+        self.max_load = max_load
+        self.bins = np.zeros(0, dtype=np.int64)
+        self.counts = np.zeros(0)
+        self.load_sums = np.zeros(0)
+        self.n_axles = 0
+        self.n_rejected = 0
+
+    def add(self, loads: np.ndarray):
+        """
+        Add one chunk of raw axle loads; missing, non-positive and (with max_load) implausibly
+        large loads are rejected.
+
+        :param loads: Array of axle loads in kN.
+        """
+        loads = np.asarray(loads, dtype=float).ravel()
+        valid = np.isfinite(loads) & (loads > 0)
+        if self.max_load is not None:
+            valid &= loads <= self.max_load
+        self.n_rejected += int(loads.size - np.count_nonzero(valid))
+        loads = loads[valid]
+        if loads.size == 0:
+            return
+        chunk_bins, inverse = np.unique((loads // self.bin_width).astype(np.int64), return_inverse=True)
+        merged = np.union1d(self.bins, chunk_bins)
+        counts = np.zeros(merged.size)
+        load_sums = np.zeros(merged.size)
+        previous = np.searchsorted(merged, self.bins)
+        counts[previous] = self.counts
+        load_sums[previous] = self.load_sums
+        current = np.searchsorted(merged, chunk_bins)
+        counts[current] += np.bincount(inverse, minlength=chunk_bins.size)
+        load_sums[current] += np.bincount(inverse, weights=loads, minlength=chunk_bins.size)
+        self.bins, self.counts, self.load_sums = merged, counts, load_sums
+        self.n_axles += int(loads.size)
+
+    def spectrum(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Non-empty bins of the accumulated spectrum.
+
+        :return: Tuple of (representative load per bin in kN, repetitions per bin).
+        """
+        return self.load_sums / self.counts, self.counts.copy()
+
+    def to_load_spectrum(self, axle_type: str = 'single') -> LoadSpectrum:
+        """
+        Accumulated spectrum as a LoadSpectrum of the given axle type.
+
+        :param axle_type: Axle group type of the accumulated loads.
+        :return: LoadSpectrum instance.
+        """
+        loads, counts = self.spectrum()
+        return LoadSpectrum(loads.tolist(), counts.tolist(), axle_type)
+
+
+def iter_load_chunks(file_path: str, column: str = DEFAULT_LOAD_COLUMN, chunk_size: int = 1000000,
+                     type_column: Optional[str] = None) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """
+    Stream the load (and optionally axle-type) column of a CSV or Parquet weigh-in-motion
+    file in fixed-size chunks.
+
+    :param file_path: Path to a .csv or .parquet file with one axle record per row.
+    :param column: Name of the axle-load column (kN).
+    :param chunk_size: Number of rows per chunk.
+    :param type_column: Optional name of the axle-type column.
+    :return: Iterator of (load array, axle-type array or None) tuples.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    columns = [column] if type_column is None else [column, type_column]
+    if extension == '.csv':
+        import pandas as pd
+
+        for chunk in pd.read_csv(file_path, usecols=columns, chunksize=chunk_size):
+            loads = pd.to_numeric(chunk[column], errors='coerce').to_numpy(dtype=float)
+            types = None if type_column is None else chunk[type_column].astype(str).str.strip().str.lower().to_numpy()
+            yield loads, types
+    elif extension in PARQUET_EXTENSIONS:
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunk_size, columns=columns):
+            loads = batch.column(0).to_numpy(zero_copy_only=False).astype(float)
+            types = None
+            if type_column is not None:
+                types = np.char.lower(np.char.strip(batch.column(1).to_numpy(zero_copy_only=False).astype(str)))
+            yield loads, types
+    else:
+        raise ValueError(f"Unsupported WIM file '{file_path}'. Use .csv or .parquet.")
+
+
+def stream_load_spectrum(file_path: str, column: str = DEFAULT_LOAD_COLUMN, bin_width: float = 1.0,
+                         chunk_size: int = 1000000, max_load: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build a binned load spectrum from a WIM file without loading it into memory.
+
+    :param file_path: Path to a .csv or .parquet file with one axle record per row.
+    :param column: Name of the axle-load column (kN).
+    :param bin_width: Width of each load bin in kN.
+    :param chunk_size: Number of rows read per chunk.
+    :param max_load: Optional upper limit in kN; larger loads are skipped as implausible.
+    :return: Tuple of (representative load per bin in kN, repetitions per bin).
+    """
+    accumulator = LoadSpectrumAccumulator(bin_width, max_load)
+    try:
+        for loads, _ in iter_load_chunks(file_path, column, chunk_size):
+            accumulator.add(loads)
+    except Exception as e:
+        logger.error(f"Error reading WIM file '{file_path}': {e}")
+        raise IOError(f"Error reading WIM file: {e}")
+    if accumulator.n_rejected:
+        logger.warning(f"Skipped {accumulator.n_rejected} missing, non-positive or implausible axle loads "
+                       f"in '{file_path}'.")
+    loads, counts = accumulator.spectrum()
+    logger.info(f"Load spectrum built from {accumulator.n_axles} axles in '{file_path}': {loads.size} bins.")
+    return loads, counts
+
+
+def stream_load_spectra(file_path: str, type_column: str, column: str = DEFAULT_LOAD_COLUMN,
+                        bin_width: float = 1.0, chunk_size: int = 1000000,
+                        max_load: Optional[float] = None) -> List[LoadSpectrum]:
+    """
+    Build one binned load spectrum per axle type from a WIM file with an axle-type column.
+
+    Loads are axle-group loads; rows with an unknown axle type are skipped.
+
+    :param file_path: Path to a .csv or .parquet file with one axle-group record per row.
+    :param type_column: Name of the axle-type column ('single', 'tandem' or 'tridem').
+    :param column: Name of the group-load column (kN).
+    :param bin_width: Width of each load bin in kN.
+    :param chunk_size: Number of rows read per chunk.
+    :param max_load: Optional upper group load in kN; larger loads are skipped as implausible.
+    :return: List of LoadSpectrum instances, one per axle type present.
+    """
+    accumulators: Dict[str, LoadSpectrumAccumulator] = {}
+    n_unknown = 0
+    try:
+        for loads, types in iter_load_chunks(file_path, column, chunk_size, type_column):
+            for axle_type in AXLES_PER_GROUP:
+                selected = types == axle_type
+                if selected.any():
+                    if axle_type not in accumulators:
+                        accumulators[axle_type] = LoadSpectrumAccumulator(bin_width, max_load)
+                    accumulators[axle_type].add(loads[selected])
+            n_unknown += int(np.count_nonzero(~np.isin(types, list(AXLES_PER_GROUP))))
+    except Exception as e:
+        logger.error(f"Error reading WIM file '{file_path}': {e}")
+        raise IOError(f"Error reading WIM file: {e}")
+    if n_unknown:
+        logger.warning(f"Skipped {n_unknown} records with an unknown axle type in '{file_path}'.")
+    n_rejected = sum(accumulator.n_rejected for accumulator in accumulators.values())
+    if n_rejected:
+        logger.warning(f"Skipped {n_rejected} missing, non-positive or implausible group loads in '{file_path}'.")
+    logger.info(f"Load spectra built from '{file_path}' for axle types: {sorted(accumulators)}.")
+    return [accumulator.to_load_spectrum(axle_type) for axle_type, accumulator in accumulators.items()]
+
+
+def traffic_from_wim(file_path: str, traffic_growth_rate: float, analysis_period: int,
+                     column: str = DEFAULT_LOAD_COLUMN, bin_width: float = 1.0,
+                     chunk_size: int = 1000000, annual_scale: Optional[float] = None,
+                     type_column: Optional[str] = None, max_load: Optional[float] = None) -> TrafficData:
+    """
+    Create binned TrafficData from a WIM file.
+
+    :param file_path: Path to a .csv or .parquet file with one axle record per row.
+    :param traffic_growth_rate: Annual traffic growth rate (decimal).
+    :param analysis_period: Number of years for analysis.
+    :param column: Name of the axle-load column (kN).
+    :param bin_width: Width of each load bin in kN.
+    :param chunk_size: Number of rows read per chunk.
+    :param annual_scale: Optional factor converting the file's counts to base-year repetitions
+                         (e.g. 365 / days of data).
+    :param type_column: Optional axle-type column; loads are then treated as axle-group loads.
+    :param max_load: Optional upper (group) load in kN; larger loads are skipped as implausible.
+    :return: TrafficData with one entry per load bin and its repetitions.
+    """
+    if type_column is not None:
+        spectra = stream_load_spectra(file_path, type_column, column, bin_width, chunk_size, max_load)
+    else:
+        loads, counts = stream_load_spectrum(file_path, column, bin_width, chunk_size, max_load)
+        spectra = [LoadSpectrum(loads.tolist(), counts.tolist())]
+    if annual_scale is not None:
+        spectra = [LoadSpectrum(s.load_bins, (np.asarray(s.counts) * annual_scale).tolist(), s.axle_type)
+                   for s in spectra]
+    return TrafficData.from_load_spectra(spectra, traffic_growth_rate, analysis_period)
+
+
+def _column_array(values: Sequence[str], name: str, numeric: bool, first_line: int, path: str) -> np.ndarray:
+    """
+    Convert a CSV column to floats (model columns) or keep it as strings.
+
+    :param values: Raw cell values.
+    :param name: Column name, for error messages.
+    :param numeric: Convert the cells to floats.
+    :param first_line: File line number of the first cell, for error messages.
+    :param path: File path, for error messages.
+    :return: NumPy array.
+    """
+    if not numeric:
+        return np.array(values, dtype=object)
+    try:
+        return np.array(values, dtype=float)
+    except ValueError:
+        for offset, value in enumerate(values):
+            try:
+                float(value)
+            except ValueError:
+                logger.error(f"Invalid value '{value}' in column '{name}' on line {first_line + offset} of '{path}'.")
+                raise ValueError(f"Column '{name}' must be numeric; line {first_line + offset} of '{path}' "
+                                 f"holds '{value}'.") from None
+        raise
+
+
+def _csv_columns(header: List[str], rows: List[List[str]], numeric_columns: Sequence[str], first_line: int,
+                 path: str) -> Dict[str, np.ndarray]:
+    """
+    Columnar arrays of a block of CSV rows.
+
+    :param header: Column names.
+    :param rows: Raw rows.
+    :param numeric_columns: Columns converted to floats; all others stay strings.
+    :param first_line: File line number of the first row.
+    :param path: File path, for error messages.
+    :return: Mapping of column name to array.
+    """
+    cells = list(zip(*rows)) or [()] * len(header)
+    return {name: _column_array(list(values), name, name in numeric_columns, first_line, path)
+            for name, values in zip(header, cells)}
+
+
+def read_scenarios(path: str, numeric_columns: Sequence[str] = SCENARIO_NUMERIC_COLUMNS) -> Dict[str, np.ndarray]:
+    """
+    Read a CSV or Parquet scenario file into columnar arrays, one row per scenario.
+
+    CSV columns listed in numeric_columns are read as floats; every other column (e.g. section
+    identifiers such as "0012") is kept as text, so it is written back unchanged.
+
+    :param path: Path to a .csv or .parquet file.
+    :param numeric_columns: CSV columns read as floats.
+    :return: Mapping of column name to array.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        with open(path, newline='') as fh:
+            reader = csv.reader(fh)
+            header = [name.strip() for name in next(reader)]
+            return _csv_columns(header, list(reader), numeric_columns, 2, path)
+    if extension in PARQUET_EXTENSIONS:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        return {name: table.column(name).to_numpy() for name in table.column_names}
+    raise ValueError(f"Unsupported scenario file '{path}'. Use .csv or .parquet.")
+
+
+def iter_scenario_chunks(path: str, chunk_size: int = 10000,
+                         numeric_columns: Sequence[str] = SCENARIO_NUMERIC_COLUMNS) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Read a CSV or Parquet scenario file chunk by chunk, so memory does not grow with the file.
+
+    Column types do not depend on the chunk: CSV columns listed in numeric_columns are floats
+    (a non-numeric cell raises a ValueError naming the column and line before the chunk is
+    yielded) and all others are strings, as in read_scenarios; Parquet keeps the file schema.
+
+    :param path: Path to a .csv or .parquet file.
+    :param chunk_size: Rows per chunk.
+    :param numeric_columns: CSV columns read as floats.
+    :return: Iterator of column mappings with the same columns as read_scenarios.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        with open(path, newline='') as fh:
+            reader = csv.reader(fh)
+            header = [name.strip() for name in next(reader)]
+            first_line = 2
+            while True:
+                rows = list(itertools.islice(reader, chunk_size))
+                if not rows:
+                    return
+                yield _csv_columns(header, rows, numeric_columns, first_line, path)
+                first_line += len(rows)
+    elif extension in PARQUET_EXTENSIONS:
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield {name: batch.column(name).to_numpy(zero_copy_only=False) for name in batch.schema.names}
+    else:
+        raise ValueError(f"Unsupported scenario file '{path}'. Use .csv or .parquet.")
+
+
+def write_results(path: str, columns: Dict[str, np.ndarray]):
+    """
+    Write result columns to CSV or Parquet, chosen by file extension.
+
+    :param path: Output file path.
+    :param columns: Mapping of column name to array.
+    """
+    write_result_pages(path, [columns])
+
+
+def write_result_pages(path: str, pages: Iterable[Dict[str, np.ndarray]]) -> int:
+    """
+    Write pages of result columns to one CSV or Parquet file, holding one page at a time.
+
+    :param path: Output file path.
+    :param pages: Iterable of column mappings with the same columns.
+    :return: Number of rows written.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in PARQUET_EXTENSIONS and extension != '.csv':
+        raise ValueError(f"Unsupported output file '{path}'. Use .csv or .parquet.")
+    n_rows = 0
+    if extension in PARQUET_EXTENSIONS:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for columns in pages:
+                table = pa.table({name: np.asarray(values) for name, values in columns.items()})
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+                n_rows += table.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        with open(path, 'w', newline='') as fh:
+            writer = csv.writer(fh)
+            for index, columns in enumerate(pages):
+                if index == 0:
+                    writer.writerow(columns.keys())
+                rows = list(zip(*(np.asarray(values).tolist() for values in columns.values())))
+                writer.writerows(rows)
+                n_rows += len(rows)
+    logger.info(f"Results written to {path}")
+    return n_rows
@@ -0,0 +1,321 @@
+# src/jobs.py
+
+import itertools
+import sys
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    Approximate bytes held by a job result.
+
+    Bytes and strings count their length, arrays and DataFrames their buffers, and containers
+    the sum of their items; other objects count their shallow size.
+
+    :param obj: Result object.
+    :return: Size in bytes.
+    """
+    if isinstance(obj, (bytes, bytearray, str)):
+        return len(obj)
+    if hasattr(obj, 'nbytes'):
+        return int(obj.nbytes)
+    if hasattr(obj, 'memory_usage'):
+        return int(np.sum(obj.memory_usage(deep=True)))
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(estimate_size(key) + estimate_size(value) for key, value in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(estimate_size(item) for item in obj)
+    return sys.getsizeof(obj)
+
+
+class Job:
+    def __init__(self, job_id: str, name: str, key: Optional[str] = None,
+                 cleanup: Optional[Callable[[Any], None]] = None, size: Optional[Callable[[Any], int]] = None):
+        """
+        State of one submitted job; updated by the worker, read through JobManager.status().
+
+        :param job_id: Unique job ID.
+        :param name: Human-readable job name.
+        :param key: Optional deduplication key (e.g. a fingerprint of the inputs).
+        :param cleanup: Optional callable releasing the result (e.g. deleting a result file) on eviction.
+        :param size: Optional callable returning the bytes held by the result (e.g. os.path.getsize for a file).
+        """
+        self.id = job_id
+        self.name = name
+        self.key = key
+        self.cleanup = cleanup
+        self.size = size
+        self.result_bytes = 0
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message = ''
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.submitted = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.future = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Copy of the job state without the result.
+
+        :return: Dictionary with id, name, status, progress, message, error and timings.
+        """
+        end = self.finished or time.time()
+        return {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'progress': self.progress,
+            'message': self.message,
+            'error': self.error,
+            'submitted': self.submitted,
+            'elapsed': end - self.started if self.started else 0.0
+        }
+
+
+class JobManager:
+    def __init__(self, max_workers: int = 2, max_finished: int = 100, max_result_bytes: int = 64 * 1024 ** 2):
+        """
+        Local job queue backed by a thread pool.
+
+        Jobs get an ID at submission and run in the background; callers poll status() and
+        fetch result() when done. Finished jobs are kept up to max_finished jobs and
+        max_result_bytes of results (sized at completion by the job's size callable or
+        estimate_size), oldest evicted first (the most recently submitted finished job is
+        always kept); large outputs are best written to a file by the job, with
+        size=os.path.getsize and a cleanup callable deleting it on eviction. A job submitted with the key of a queued, running or
+        successful job returns that job's ID instead of computing again, so UI reruns do not
+        recompute.
+
+        :param max_workers: Number of worker threads.
+        :param max_finished: Number of finished jobs to keep.
+        :param max_result_bytes: Total size of the kept results.
+        """
+        self.max_finished = max_finished
+        self.max_result_bytes = max_result_bytes
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='me-pavement-job')
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._keys: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def submit(self, fn: Callable, *args: Any, name: Optional[str] = None, key: Optional[str] = None,
+               with_progress: bool = False, cleanup: Optional[Callable[[Any], None]] = None,
+               size: Optional[Callable[[Any], int]] = None, **kwargs: Any) -> str:
+        """
+        Queue fn(*args, **kwargs) for background execution.
+
+        :param fn: Callable to run.
+        :param args: Positional arguments.
+        :param name: Job name (defaults to the function name).
+        :param key: Optional deduplication key; an active or successful job with the same key is reused.
+        :param with_progress: Pass progress=callback(fraction, message) to fn.
+        :param cleanup: Optional callable called with the result when the job is evicted.
+        :param size: Optional callable returning the bytes held by the result, counted against
+                     max_result_bytes (defaults to estimate_size; pass os.path.getsize for file results).
+        :param kwargs: Keyword arguments.
+        :return: Job ID.
+        """
+        with self._lock:
+            if key is not None and key in self._keys:
+                existing = self._jobs.get(self._keys[key])
+                if existing is not None and existing.status not in (FAILED, CANCELLED):
+                    logger.info(f"Reusing job {existing.id} ({existing.name}) for identical inputs.")
+                    return existing.id
+            job = Job(f"job-{next(self._ids)}", name or getattr(fn, '__name__', 'job'), key, cleanup, size)
+            self._jobs[job.id] = job
+            if key is not None:
+                self._keys[key] = job.id
+            if with_progress:
+                kwargs['progress'] = lambda fraction, message='': self._report(job, fraction, message)
+            job.future = self._executor.submit(self._run, job, fn, args, kwargs)
+        logger.info(f"Submitted job {job.id} ({job.name}).")
+        return job.id
+
+    @staticmethod
+    def _report(job: Job, fraction: float, message: str = ''):
+        """
+        Progress callback handed to jobs.
+
+        :param job: Job being reported on.
+        :param fraction: Completed fraction between 0 and 1.
+        :param message: Optional description of the current step.
+        """
+        job.progress = min(max(float(fraction), 0.0), 1.0)
+        job.message = message
+
+    def _run(self, job: Job, fn: Callable, args: tuple, kwargs: Dict[str, Any]):
+        """
+        Worker body: run the job and record its outcome.
+        """
+        if job.status == CANCELLED:
+            return
+        job.status = RUNNING
+        job.started = time.time()
+        try:
+            result = fn(*args, **kwargs)
+            job.result_bytes = self._result_size(job, result)
+            job.result = result
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.status = FAILED
+            logger.error(f"Job {job.id} ({job.name}) failed: {e}\n{traceback.format_exc()}")
+        else:
+            job.progress = 1.0
+            job.status = DONE
+            logger.info(f"Job {job.id} ({job.name}) completed in {time.time() - job.started:.2f} s.")
+        finally:
+            job.finished = time.time()
+            self._evict()
+
+    @staticmethod
+    def _result_size(job: Job, result: Any) -> int:
+        """
+        Bytes held by a job result, from the job's size callable or estimate_size.
+
+        :param job: Finished job.
+        :param result: Its return value.
+        :return: Size in bytes.
+        """
+        try:
+            return int((job.size or estimate_size)(result))
+        except Exception as e:
+            logger.warning(f"Could not size the result of job {job.id} ({job.name}): {e}")
+            return estimate_size(result)
+
+    def _evict(self):
+        """
+        Drop the oldest finished jobs beyond max_finished or max_result_bytes, releasing their results.
+        """
+        evicted = []
+        with self._lock:
+            finished = [job for job in self._jobs.values() if job.status in FINISHED_STATES]
+            excess = max(len(finished) - self.max_finished, 0)
+            held = sum(job.result_bytes for job in finished)
+            for position, job in enumerate(finished[:-1]):
+                if position >= excess and held <= self.max_result_bytes:
+                    break
+                held -= job.result_bytes
+                del self._jobs[job.id]
+                if job.key is not None and self._keys.get(job.key) == job.id:
+                    del self._keys[job.key]
+                evicted.append(job)
+        for job in evicted:
+            if job.cleanup is not None and job.status == DONE:
+                try:
+                    job.cleanup(job.result)
+                except Exception as e:
+                    logger.warning(f"Failed to release the result of job {job.id} ({job.name}): {e}")
+            job.result = None
+        if evicted:
+            logger.debug("Evicted %d finished job(s).", len(evicted))
+
+    def _get(self, job_id: str) -> Job:
+        """
+        Look up a job by ID.
+
+        :param job_id: Job ID.
+        :return: Job.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise KeyError(f"Unknown or expired job '{job_id}'.")
+        return job
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Current state of a job.
+
+        :param job_id: Job ID.
+        :return: See Job.snapshot().
+        """
+        return self._get(job_id).snapshot()
+
+    def poll(self, job_id: str) -> Dict[str, Any]:
+        """
+        Current state of a job together with its result, read atomically.
+
+        The state and result are read under the manager lock, so a job evicted in between
+        (e.g. when another caller's job finishes) cannot leave a DONE state without its result.
+
+        :param job_id: Job ID.
+        :return: See Job.snapshot(), plus 'result' once the job is done.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise KeyError(f"Unknown or expired job '{job_id}'.")
+            snapshot = job.snapshot()
+            if job.status == DONE:
+                snapshot['result'] = job.result
+        return snapshot
+
+    def result(self, job_id: str, timeout: Optional[float] = None) -> Any:
+        """
+        Result of a job, waiting for it to finish if needed.
+
+        :param job_id: Job ID.
+        :param timeout: Seconds to wait (None waits indefinitely).
+        :return: Return value of the job function.
+        """
+        job = self._get(job_id)
+        job.future.result(timeout=timeout)
+        if job.status == FAILED:
+            raise RuntimeError(f"Job {job_id} failed: {job.error}")
+        if job.status == CANCELLED:
+            raise RuntimeError(f"Job {job_id} was cancelled.")
+        return self.poll(job_id)['result']
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job that has not started yet.
+
+        :param job_id: Job ID.
+        :return: True if the job was cancelled.
+        """
+        job = self._get(job_id)
+        if job.status == QUEUED and job.future.cancel():
+            job.status = CANCELLED
+            job.finished = time.time()
+            logger.info(f"Cancelled job {job_id} ({job.name}).")
+            return True
+        return False
+
+    def jobs(self) -> List[Dict[str, Any]]:
+        """
+        States of all kept jobs, oldest first.
+
+        :return: List of snapshots.
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job.snapshot() for job in jobs]
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the worker pool.
+
+        :param wait: Wait for running jobs to finish.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
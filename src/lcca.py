@@ -1,13 +1,63 @@
 # src/lcca.py
 
 import logging
-from typing import Dict
+from typing import Dict, Tuple, Union
+
+import numpy as np
 
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+def discount_factors(discount_rate: float, analysis_period: int) -> np.ndarray:
+    """
+    Present-value discount factors 1 / (1 + r) ** year for year = 1 .. analysis_period.
+
+    :param discount_rate: Annual discount rate (decimal).
+    :param analysis_period: Number of years to analyze.
+    :return: Array of discount factors, one per year.
+    """
+    return (1 + discount_rate) ** -np.arange(1, analysis_period + 1, dtype=float)
+
+
+def maintenance_cost_vector(maintenance_costs: Dict[int, float], analysis_period: int) -> np.ndarray:
+    """
+    Dense per-year maintenance costs; years outside 1 .. analysis_period are ignored.
+
+    :param maintenance_costs: Maintenance costs with year as key.
+    :param analysis_period: Number of years to analyze.
+    :return: Array where element i holds the cost of year i + 1.
+    """
+    costs = np.zeros(analysis_period)
+    for year, cost in maintenance_costs.items():
+        if 1 <= year <= analysis_period:
+            costs[int(year) - 1] += cost
+    return costs
+
+
+def calculate_LCCA_over_time(initial_cost: float, maintenance_costs: Dict[int, float], discount_rate: float,
+                             analysis_period: int) -> Tuple[float, np.ndarray]:
+    """
+    Calculate the lifecycle cost and its cumulative present-value curve in one pass.
+
+    :param initial_cost: Initial construction cost.
+    :param maintenance_costs: Maintenance costs with year as key.
+    :param discount_rate: Annual discount rate (decimal, e.g., 0.03 for 3%).
+    :param analysis_period: Number of years to analyze.
+    :return: Tuple of (total lifecycle cost, cumulative lifecycle cost at the end of each year).
+    """
+    costs = maintenance_cost_vector(maintenance_costs, analysis_period)
+    discounted = costs * discount_factors(discount_rate, analysis_period)
+    cumulative = initial_cost + np.cumsum(discounted)
+    lcc = float(cumulative[-1]) if analysis_period > 0 else float(initial_cost)
+    if logger.isEnabledFor(logging.DEBUG):
+        for year in np.flatnonzero(costs > 0):
+            logger.debug("Year %d: Maintenance Cost $%s, Discounted Cost $%s",
+                         year + 1, f"{costs[year]:,.2f}", f"{discounted[year]:,.2f}")
+    return lcc, cumulative
+
+
 def calculate_LCCA(initial_cost: float, maintenance_costs: Dict[int, float], discount_rate: float, analysis_period: int) -> float:
     """
     Calculate the Life-Cycle Cost Analysis (LCCA) for the pavement.
@@ -18,18 +68,59 @@ def calculate_LCCA(initial_cost: float, maintenance_costs: Dict[int, float], dis
     :param analysis_period: Number of years to analyze.
     :return: Present value of total lifecycle costs.
     """
-    lcc = initial_cost
-    logger.info(f"Initial Cost: ${initial_cost:,.2f}")
-    for year in range(1, analysis_period + 1):
-        maintenance_cost = maintenance_costs.get(year, 0)
-        discounted_cost = maintenance_cost / ((1 + discount_rate) ** year)
-        lcc += discounted_cost
-        if maintenance_cost > 0:
-            logger.debug(f"Year {year}: Maintenance Cost ${maintenance_cost:,.2f}, Discounted Cost ${discounted_cost:,.2f}")
-    logger.info(f"Total Lifecycle Cost (LCCA): ${lcc:,.2f}")
+    lcc, _ = calculate_LCCA_over_time(initial_cost, maintenance_costs, discount_rate, analysis_period)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Initial Cost: ${initial_cost:,.2f}")
+        logger.info(f"Total Lifecycle Cost (LCCA): ${lcc:,.2f}")
     return lcc
 
 
+def calculate_LCCA_batch(initial_cost: Union[float, np.ndarray], maintenance_costs: Dict[int, float],
+                         discount_rates: Union[float, np.ndarray], analysis_periods: Union[int, np.ndarray],
+                         with_gradients: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, Dict]]:
+    """
+    Vectorized LCCA over arrays of discount rates and analysis periods.
+
+    Inputs broadcast against each other, so a rate vector and a period vector of
+    different shapes (e.g. rates[:, None] and periods[None, :]) yield a full
+    sensitivity grid in one call. Work scales with the number of maintenance events,
+    not the length of the analysis period.
+
+    With with_gradients, the exact partial derivatives are accumulated from the same discount
+    factors: dLCC/dinitial_cost = 1, dLCC/dr = -sum y * cost_y * (1 + r) ** (-y - 1) and
+    dLCC/dcost_y is the discount factor of year y. The lifecycle cost is piecewise constant in
+    the analysis period, whose derivative is therefore zero and not reported.
+
+    :param initial_cost: Initial construction cost (scalar or array).
+    :param maintenance_costs: Maintenance costs with year as key, shared by all combinations.
+    :param discount_rates: Annual discount rates (decimal).
+    :param analysis_periods: Numbers of years to analyze.
+    :param with_gradients: Also return the partial derivatives.
+    :return: Array of present values of total lifecycle costs; with with_gradients, a tuple of that and
+             a mapping of 'initial_cost', 'discount_rate' and 'maintenance_costs' (year to array) to
+             partial derivatives.
+    """
+    initial_cost = np.asarray(initial_cost, dtype=float)
+    rates = np.asarray(discount_rates, dtype=float)
+    periods = np.asarray(analysis_periods, dtype=float)
+    shape = np.broadcast_shapes(initial_cost.shape, rates.shape, periods.shape)
+    lcc = np.broadcast_to(initial_cost, shape).copy()
+    d_rate = np.zeros(shape) if with_gradients else None
+    d_costs = {}
+    for year, cost in sorted(maintenance_costs.items()):
+        if year < 1 or not (cost or with_gradients):
+            continue
+        factor = np.where(year <= periods, (1 + rates) ** -float(year), 0.0)
+        if cost:
+            lcc += cost * factor
+        if with_gradients:
+            d_costs[year] = np.broadcast_to(factor, shape)
+            d_rate -= year * cost * factor / (1 + rates)
+    if not with_gradients:
+        return lcc
+    return lcc, {'initial_cost': np.ones(shape), 'discount_rate': d_rate, 'maintenance_costs': d_costs}
+
+
 def perform_LCCA(initial_cost: float, maintenance_costs: Dict[int, float], discount_rate: float, analysis_period: int) -> float:
     """
     Wrapper function to perform LCCA.
@@ -42,3 +133,22 @@ def perform_LCCA(initial_cost: float, maintenance_costs: Dict[int, float], disco
     """
     logger.info("Starting Life-Cycle Cost Analysis (LCCA).")
     return calculate_LCCA(initial_cost, maintenance_costs, discount_rate, analysis_period)
+
+
+def perform_LCCA_over_time(initial_cost: float, maintenance_costs: Dict[int, float], discount_rate: float,
+                           analysis_period: int) -> Tuple[float, np.ndarray]:
+    """
+    Wrapper function to perform LCCA and return the cumulative cost curve as well.
+
+    :param initial_cost: Initial construction cost.
+    :param maintenance_costs: Maintenance costs with year as key.
+    :param discount_rate: Annual discount rate.
+    :param analysis_period: Number of years to analyze.
+    :return: Tuple of (total lifecycle cost, cumulative lifecycle cost at the end of each year).
+    """
+    logger.info("Starting Life-Cycle Cost Analysis (LCCA).")
+    lcc, cumulative = calculate_LCCA_over_time(initial_cost, maintenance_costs, discount_rate, analysis_period)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Initial Cost: ${initial_cost:,.2f}")
+        logger.info(f"Total Lifecycle Cost (LCCA): ${lcc:,.2f}")
+    return lcc, cumulative
@@ -0,0 +1,316 @@
+# src/maintenance.py
+
+import itertools
+import time
+from typing import Dict, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from src.lcca import discount_factors, calculate_LCCA
+from src.models import TrafficData, ClimateData, SubgradeProperties, MaterialProperties
+from src.performance import compute_distress_arrays
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class Treatment(NamedTuple):
+    """
+    Maintenance or rehabilitation treatment.
+
+    reductions maps a distress name to the fraction of its accumulated value removed
+    by the treatment (1.0 resets it, 0.3 removes 30 %); distresses not listed are unchanged.
+    """
+    name: str
+    cost: float
+    reductions: Dict[str, float]
+
+
+# Pairs compared at once when removing dominated (condition, cost) pairs in the forward search.
+_DOMINANCE_BLOCK = 512
+
+DEFAULT_TREATMENTS = (
+    Treatment('Crack Sealing', 20000.0, {'Fatigue Cracking': 0.3}),
+    Treatment('Mill and Overlay', 150000.0, {'Fatigue Cracking': 1.0, 'Rutting': 0.8}),
+    Treatment('Reconstruction', 600000.0, {'Fatigue Cracking': 1.0, 'Rutting': 1.0})
+)
+
+
+def _interpolate(values: np.ndarray, steps: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Multilinear interpolation on a regular grid starting at zero over the finite corners only.
+
+    Infinite (infeasible) corners are left out and the weights of the finite corners are
+    renormalized, so a feasible point next to the feasibility boundary keeps a finite value;
+    a point is infinite only when all of its corners are.
+
+    :param values: Grid values, one axis per condition variable.
+    :param steps: Grid spacing of each axis.
+    :param points: Query points of shape (..., n_axes), inside the grid.
+    :return: Interpolated values of shape points.shape[:-1].
+    """
+    feasible = np.isfinite(values)
+    finite = np.where(feasible, values, 0.0)
+    position = points / steps
+    index = np.clip(np.floor(position).astype(int), 0, np.array(values.shape) - 2)
+    weight = position - index
+    result = np.zeros(points.shape[:-1])
+    support = np.zeros(points.shape[:-1])
+    for corner in itertools.product((0, 1), repeat=values.ndim):
+        corner_weight = np.ones(points.shape[:-1])
+        for axis, bit in enumerate(corner):
+            corner_weight = corner_weight * (weight[..., axis] if bit else 1 - weight[..., axis])
+        corner_index = tuple(index[..., axis] + bit for axis, bit in enumerate(corner))
+        result += corner_weight * finite[corner_index]
+        support += corner_weight * feasible[corner_index]
+    return _normalize(result, support)
+
+
+def _normalize(result: np.ndarray, support: np.ndarray) -> np.ndarray:
+    """
+    Divide interpolated finite values by the interpolation weight of the finite corners.
+
+    :param result: Interpolated values with infinite corners counted as zero.
+    :param support: Interpolated weight of the finite corners.
+    :return: Renormalized values, infinite where no finite corner carries weight.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(support > 1e-12, result / np.where(support > 1e-12, support, 1.0), np.inf)
+
+
+def _interpolation_matrices(position: np.ndarray) -> np.ndarray:
+    """
+    Linear interpolation along one grid axis as matrices, one per action.
+
+    :param position: Fractional grid positions of shape (n_actions, grid_size).
+    :return: Array W of shape (n_actions, grid_size, grid_size) with W[a] @ v interpolating v at position[a].
+    """
+    n_actions, grid_size = position.shape
+    index = np.clip(np.floor(position).astype(int), 0, grid_size - 2)
+    weight = position - index
+    matrices = np.zeros((n_actions, grid_size, grid_size))
+    actions, rows = np.indices(position.shape)
+    matrices[actions, rows, index] = 1 - weight
+    matrices[actions, rows, index + 1] = weight
+    return matrices
+
+
+def _interpolate_axes(values: np.ndarray, positions: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Interpolate a grid at the tensor product of per-axis positions, one set per action.
+
+    Condition transitions act on each distress separately, so the next state of grid point
+    (i, j, ...) under action a is (x_a[i], y_a[j], ...), and interpolation is a product of
+    one small matrix per axis applied with matmul. Infinite (infeasible) grid values are
+    left out and the remaining weights renormalized, as in _interpolate.
+
+    :param values: Grid values, one axis per condition variable.
+    :param positions: Per axis, fractional grid positions of shape (n_actions, grid_size) within the grid.
+    :return: Array of shape (n_actions,) + values.shape.
+    """
+    def _apply_along(array: np.ndarray, matrices: np.ndarray, axis: int) -> np.ndarray:
+        moved = np.moveaxis(array, axis, -1)
+        if values.ndim == 1:
+            return (moved[..., None, :] @ matrices)[..., 0, :]
+        return np.moveaxis(moved @ matrices, -1, axis)
+
+    feasible = np.isfinite(values)
+    result = np.where(feasible, values, 0.0)
+    support = None if feasible.all() else feasible.astype(float)
+    for axis, position in enumerate(positions):
+        matrices = np.swapaxes(_interpolation_matrices(position), 1, 2)
+        matrices = matrices.reshape((len(matrices),) + (1,) * max(values.ndim - 2, 0) + matrices.shape[1:])
+        result = _apply_along(result, matrices, axis - values.ndim)
+        if support is not None:
+            support = _apply_along(support, matrices, axis - values.ndim)
+    if support is None:
+        return np.broadcast_to(result, (len(positions[0]),) + values.shape)
+    return _normalize(result, support)
+
+
+def _non_dominated(conditions: np.ndarray, totals: np.ndarray) -> np.ndarray:
+    """
+    Indices of the (condition, cost) pairs not dominated by another pair.
+
+    A pair is dominated when an earlier pair in (cost, condition) order has a condition no
+    worse in every distress; of identical pairs only the first is kept.
+
+    :param conditions: Conditions of shape (n_pairs, n_distresses).
+    :param totals: Discounted cost of each pair.
+    :return: Sorted indices of the non-dominated pairs.
+    """
+    order = np.lexsort(list(conditions.T[::-1]) + [totals])
+    ordered = conditions[order]
+    if ordered.shape[1] == 1:
+        best = np.minimum.accumulate(ordered[:, 0])
+        return np.sort(order[np.r_[True, ordered[1:, 0] < best[:-1]]])
+    dominated = np.zeros(len(ordered), dtype=bool)
+    for start in range(0, len(ordered), _DOMINANCE_BLOCK):
+        stop = min(start + _DOMINANCE_BLOCK, len(ordered))
+        no_worse = np.all(ordered[:stop, None, :] <= ordered[None, start:stop, :], axis=-1)
+        dominated[start:stop] = np.triu(no_worse, 1 - start).any(axis=0)
+    return np.sort(order[~dominated])
+
+
+def optimize_maintenance_strategy(distress_per_year: Dict[str, np.ndarray], limits: Dict[str, float],
+                                  treatments: Sequence[Treatment] = DEFAULT_TREATMENTS, discount_rate: float = 0.03,
+                                  initial_cost: float = 0.0, initial_condition: Optional[Dict[str, float]] = None,
+                                  grid_size: int = 64, max_labels: int = 1024) -> Dict:
+    """
+    Minimum discounted-cost maintenance schedule by dynamic programming over (year, condition).
+
+    The condition is the accumulated value of each limited distress. At the start of every
+    year one treatment (or none) may be applied; it removes its reduction fraction of the
+    accumulated distress, then the year's damage from distress_per_year is added and must
+    stay within the limits. The value function is computed backwards on a regular grid of
+    grid_size levels per distress (0 .. limit) with multilinear interpolation, reusing the
+    precomputed per-year damage and discount_factors arrays, so the work is
+    years x grid states x treatments array operations. Infeasible grid states are left out
+    of the interpolation rather than making their feasible neighbours infeasible.
+
+    The schedule itself comes from a forward search from the exact condition that keeps
+    every non-dominated (condition, cost) pair, so feasibility is checked exactly and the
+    schedule is the optimum whenever at most max_labels pairs survive each year; beyond
+    that the grid values rank which pairs to keep.
+
+    :param distress_per_year: Damage added in each year per distress, e.g. the 'Rutting per Year'
+                              array of compute_distress_arrays stored under 'Rutting'.
+    :param limits: Maximum accumulated value per distress; only these distresses are tracked.
+    :param treatments: Candidate treatments.
+    :param discount_rate: Annual discount rate (decimal).
+    :param initial_cost: Initial construction cost added to the lifecycle cost.
+    :param initial_condition: Accumulated distress at the start (defaults to a new pavement).
+    :param grid_size: Condition levels per distress.
+    :param max_labels: Maximum (condition, cost) pairs kept per year by the forward search.
+    :return: Dictionary with 'Lifecycle Cost', 'maintenance_costs' (year: cost, as used by
+             perform_LCCA), 'treatments' (year: name), 'condition' (per-year accumulated distress
+             after each year), 'evaluations' and 'elapsed'.
+    """
+    start = time.perf_counter()
+    if not limits:
+        raise ValueError("At least one distress limit is required.")
+    if grid_size < 2:
+        raise ValueError("grid_size must be at least 2.")
+    if max_labels < 1:
+        raise ValueError("max_labels must be at least 1.")
+    names = list(limits)
+    missing = [name for name in names if name not in distress_per_year]
+    if missing:
+        logger.error(f"No per-year damage for limited distresses: {missing}")
+        raise ValueError(f"Missing per-year damage for {missing}.")
+    damage = np.stack([np.asarray(distress_per_year[name], dtype=float) for name in names], axis=-1)
+    n_years = damage.shape[0]
+    limit = np.array([float(limits[name]) for name in names])
+    if np.any(limit <= 0):
+        raise ValueError("Distress limits must be positive.")
+    condition = np.array([float((initial_condition or {}).get(name, 0.0)) for name in names])
+    if np.any(condition > limit):
+        raise ValueError("The initial condition already exceeds a limit.")
+
+    actions = [Treatment('None', 0.0, {})] + list(treatments)
+    keep = np.array([[1.0 - treatment.reductions.get(name, 0.0) for name in names] for treatment in actions])
+    costs = np.array([treatment.cost for treatment in actions])
+    factors = discount_factors(discount_rate, n_years)
+    steps = limit / (grid_size - 1)
+
+    # Backward pass: values[t] is the minimum discounted cost of years t+1 .. n_years from each grid state.
+    # All treatments are evaluated in one array operation per year.
+    levels = np.linspace(0.0, 1.0, grid_size)
+    action_shape = (len(actions),) + (1,) * len(names)
+    values = np.empty((n_years + 1,) + (grid_size,) * len(names))
+    values[n_years] = 0.0
+    for year in range(n_years - 1, -1, -1):
+        following = [levels * lim * keep[:, [axis]] + damage[year, axis] for axis, lim in enumerate(limit)]
+        candidate = (costs.reshape(action_shape) * factors[year]
+                     + _interpolate_axes(values[year + 1], [np.minimum(f, lim) / step for f, lim, step
+                                                            in zip(following, limit, steps)]))
+        for axis, (f, lim) in enumerate(zip(following, limit)):
+            shape = [len(actions)] + [1] * len(names)
+            shape[axis + 1] = grid_size
+            candidate = np.where((f > lim).reshape(shape), np.inf, candidate)
+        values[year] = candidate.min(axis=0)
+    evaluations = n_years * len(actions) * grid_size ** len(names)
+
+    # Forward pass from the exact condition: a search over (condition, cost) labels in which a label
+    # is dropped when another reaches a condition no worse in every distress at no higher cost, as
+    # anything feasible from the worse condition is feasible from the better one. Without the
+    # max_labels cap this is exact; beyond it the labels with the lowest cost plus grid estimate are kept.
+    label_conditions, label_costs = condition[None, :], np.zeros(1)
+    parents, choices, conditions = [], [], []
+    for year in range(n_years):
+        following = (label_conditions[:, None, :] * keep + damage[year]).reshape(-1, len(names))
+        totals = (label_costs[:, None] + costs * factors[year]).ravel()
+        feasible = np.flatnonzero(np.all(following <= limit, axis=-1))
+        if not feasible.size:
+            logger.error(f"No treatment keeps the distresses within limits in year {year + 1}.")
+            raise ValueError(f"Limits cannot be met in year {year + 1} with the given treatments.")
+        kept = _non_dominated(following[feasible], totals[feasible])
+        if kept.size > max_labels:
+            estimate = totals[feasible[kept]] + _interpolate(values[year + 1], steps, following[feasible[kept]])
+            kept = np.sort(kept[np.argsort(estimate, kind='stable')[:max_labels]])
+        labels = feasible[kept]
+        label_conditions, label_costs = following[labels], totals[labels]
+        parents.append(labels // len(actions))
+        choices.append(labels % len(actions))
+        conditions.append(label_conditions)
+        evaluations += labels.size * len(actions)
+
+    schedule, chosen, trajectory = {}, {}, np.empty((n_years, len(names)))
+    label = int(np.argmin(label_costs))
+    for year in range(n_years - 1, -1, -1):
+        trajectory[year] = conditions[year][label]
+        action = int(choices[year][label])
+        if action:
+            schedule[year + 1] = float(costs[action])
+            chosen[year + 1] = actions[action].name
+        label = int(parents[year][label])
+    schedule, chosen = dict(sorted(schedule.items())), dict(sorted(chosen.items()))
+
+    lcc = calculate_LCCA(initial_cost, schedule, discount_rate, n_years)
+    elapsed = time.perf_counter() - start
+    logger.info(f"Optimized maintenance over {n_years} years: {len(schedule)} treatment(s), "
+                f"lifecycle cost ${lcc:,.2f} in {elapsed * 1000:.1f} ms.")
+    return {
+        'Lifecycle Cost': lcc,
+        'maintenance_costs': schedule,
+        'treatments': chosen,
+        'condition': {name: trajectory[:, axis] for axis, name in enumerate(names)},
+        'evaluations': evaluations,
+        'elapsed': elapsed
+    }
+
+
+def optimize_maintenance_for_design(traffic_data: TrafficData, climate_data: ClimateData,
+                                    subgrade_props: SubgradeProperties, material_props: MaterialProperties,
+                                    limits: Dict[str, float], treatments: Sequence[Treatment] = DEFAULT_TREATMENTS,
+                                    discount_rate: float = 0.03, initial_cost: float = 0.0,
+                                    grid_size: int = 64, max_labels: int = 1024) -> Dict:
+    """
+    Optimize the maintenance strategy of a design using its per-year distress arrays.
+
+    :param traffic_data: Traffic data (its analysis period is the horizon).
+    :param climate_data: Climate data.
+    :param subgrade_props: Subgrade properties.
+    :param material_props: Material properties.
+    :param limits: Maximum accumulated 'Fatigue Cracking' and/or 'Rutting'.
+    :param treatments: Candidate treatments.
+    :param discount_rate: Annual discount rate (decimal).
+    :param initial_cost: Initial construction cost.
+    :param grid_size: Condition levels per distress.
+    :param max_labels: Maximum (condition, cost) pairs kept per year by the forward search.
+    :return: See optimize_maintenance_strategy.
+    """
+    arrays = compute_distress_arrays(traffic_data, climate_data, subgrade_props, material_props)
+    per_year = {'Fatigue Cracking': arrays['Fatigue Cracking per Year'], 'Rutting': arrays['Rutting per Year']}
+    return optimize_maintenance_strategy(per_year, limits, treatments, discount_rate, initial_cost,
+                                         grid_size=grid_size, max_labels=max_labels)
+
+
+def schedule_to_text(maintenance_costs: Dict[int, float]) -> str:
+    """
+    Format a maintenance schedule as the 'Year:Cost' text used by the app and CLI.
+
+    :param maintenance_costs: Maintenance costs with year as key.
+    :return: e.g. "5:100000, 10:150000".
+    """
+    return ", ".join(f"{year}:{cost:.2f}".rstrip('0').rstrip('.') for year, cost in sorted(maintenance_costs.items()))
@@ -1,54 +1,238 @@
 # src/models.py
 
+import itertools
+from collections import deque
+
 import numpy as np
-import pandas as pd
-from typing import List, Dict
+from dataclasses import MISSING, dataclass, fields
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, List, Dict, Optional, Sequence, Tuple
 import logging
 
+from src.utils.helpers import geometric_series_sum
 from src.utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = setup_logger(__name__)
 
 
-class TrafficData:
-    def __init__(self, axle_loads: List[float], traffic_growth_rate: float, analysis_period: int):
+@lru_cache(maxsize=256)
+def _growth_factor_vector(traffic_growth_rate: float, analysis_period: int) -> np.ndarray:
+    """
+    Cached, read-only vector of yearly growth factors (1 + r) ** year.
+
+    :param traffic_growth_rate: Annual traffic growth rate (decimal).
+    :param analysis_period: Number of years for analysis.
+    :return: Array of length analysis_period.
+    """
+    factors = (1 + traffic_growth_rate) ** np.arange(analysis_period, dtype=float)
+    factors.flags.writeable = False
+    return factors
+
+
+class _TrafficProjection:
+    """
+    Array-backed traffic projection shared by TrafficData and TrafficRecord.
+
+    Requires 'axle_loads', 'traffic_growth_rate' and 'analysis_period' attributes, and
+    optionally 'load_counts' (repetitions of each load) for binned load spectra.
+    """
+    __slots__ = ()
+
+    def growth_factors(self) -> np.ndarray:
+        """
+        Yearly growth factors for the analysis period, cached across calls and instances.
+
+        :return: Read-only array of (1 + growth_rate) ** year for each analysis year.
+        """
+        return _growth_factor_vector(float(self.traffic_growth_rate), int(self.analysis_period))
+
+    def load_array(self) -> np.ndarray:
+        """
+        Base-year axle loads as a NumPy array.
+
+        :return: Array of axle loads in kN.
+        """
+        return np.asarray(self.axle_loads, dtype=float)
+
+    def load_weights(self) -> np.ndarray:
+        """
+        Base-year repetitions of each axle load (one per entry when no counts are given).
+
+        :return: Array of repetitions aligned with load_array().
+        """
+        counts = getattr(self, 'load_counts', None)
+        if counts is None:
+            return np.ones(len(self.axle_loads))
+        return np.asarray(counts, dtype=float)
+
+    def load_moment(self, power: float = 1.0) -> float:
+        """
+        Base-year sum of repetitions * load ** power over the spectrum.
+
+        :param power: Exponent applied to every load.
+        :return: Weighted sum of load ** power.
+        """
+        loads = self.load_array()
+        counts = getattr(self, 'load_counts', None)
+        if counts is None:
+            return float(np.sum(loads ** power))
+        return float(np.dot(np.asarray(counts, dtype=float), loads ** power))
+
+    def get_load_matrix(self) -> np.ndarray:
+        """
+        Projected axle loads as a 2-D array (years x loads), computed on demand.
+
+        :return: Array where row i holds the loads of analysis year i + 1.
+        """
+        return np.outer(self.growth_factors(), self.load_array())
+
+    def total_load_moment(self, power: float = 1.0) -> float:
+        """
+        Sum of projected load ** power over all years and loads, in closed form.
+
+        Each year's loads are the base loads scaled by (1 + r) ** year, so the total is
+        load_moment(power) times a geometric series with ratio (1 + r) ** power.
+
+        :param power: Exponent applied to every projected load.
+        :return: Total of projected load ** power, weighted by repetitions.
+        """
+        ratio = (1 + self.traffic_growth_rate) ** power
+        return self.load_moment(power) * geometric_series_sum(ratio, self.analysis_period)
+
+    def get_total_axle_loads(self) -> List[List[float]]:
+        """
+        Project total axle loads over the analysis period considering growth rate.
+        Repetitions (load_counts) are not expanded; use total_load_moment for totals.
+
+        :return: A list of lists, each sublist represents axle loads for a year.
+        """
+        total_loads = self.get_load_matrix().tolist()
+        if logger.isEnabledFor(logging.DEBUG):
+            for year, projected_loads in enumerate(total_loads):
+                logger.debug("Year %d: %s", year + 1, projected_loads)
+        return total_loads
+
+
+# Number of axles in each axle group; a group load is shared equally by its axles.
+AXLES_PER_GROUP = {'single': 1, 'tandem': 2, 'tridem': 3}
+
+
+class LoadSpectrum:
+    def __init__(self, load_bins: List[float], counts: List[float], axle_type: str = 'single'):
+        """
+        Initialize a load spectrum: axle-group load bins with their repetitions.
+
+        :param load_bins: Representative group load of each bin in kN.
+        :param counts: Base-year repetitions of each bin.
+        :param axle_type: Axle group type ('single', 'tandem' or 'tridem').
+        """
+        if axle_type not in AXLES_PER_GROUP:
+            raise ValueError(f"Invalid axle type '{axle_type}'. Choose from {list(AXLES_PER_GROUP)}.")
+        if len(load_bins) != len(counts):
+            raise ValueError("A load spectrum needs one count per load bin.")
+        self.load_bins = load_bins
+        self.counts = counts
+        self.axle_type = axle_type
+
+    def per_axle(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Express the spectrum as individual axle loads and repetitions.
+
+        A group load P on an n-axle group becomes n repetitions of P / n per group pass.
+
+        :return: Tuple of (axle loads in kN, repetitions).
+        """
+        axles = AXLES_PER_GROUP[self.axle_type]
+        return np.asarray(self.load_bins, dtype=float) / axles, np.asarray(self.counts, dtype=float) * axles
+
+
+class TrafficData(_TrafficProjection):
+    def __init__(self, axle_loads: List[float], traffic_growth_rate: float, analysis_period: int,
+                 load_counts: Optional[List[float]] = None):
         """
         Initialize TrafficData with axle loads, growth rate, and analysis period.
 
-        :param axle_loads: List of axle loads in kN.
+        :param axle_loads: List of axle loads in kN (individual axles, or load bins when load_counts is given).
         :param traffic_growth_rate: Annual traffic growth rate (decimal, e.g., 0.02 for 2%).
         :param analysis_period: Number of years for analysis.
+        :param load_counts: Optional base-year repetitions of each entry in axle_loads.
         """
+        if load_counts is not None and len(load_counts) != len(axle_loads):
+            raise ValueError("load_counts must have one entry per axle load.")
         self.axle_loads = axle_loads
         self.traffic_growth_rate = traffic_growth_rate
         self.analysis_period = analysis_period
+        self.load_counts = load_counts
 
-    def get_total_axle_loads(self) -> List[List[float]]:
+    @staticmethod
+    def from_load_spectra(spectra: Sequence[LoadSpectrum], traffic_growth_rate: float,
+                          analysis_period: int) -> 'TrafficData':
         """
-        Project total axle loads over the analysis period considering growth rate.
+        Create binned TrafficData from one or more load spectra (e.g. one per axle type).
 
-        :return: A list of lists, each sublist represents axle loads for a year.
+        :param spectra: Load spectra to combine.
+        :param traffic_growth_rate: Annual traffic growth rate (decimal).
+        :param analysis_period: Number of years for analysis.
+        :return: TrafficData with one entry per axle-load bin and its repetitions.
         """
-        total_loads = []
-        for year in range(self.analysis_period):
-            growth_factor = (1 + self.traffic_growth_rate) ** year
-            projected_loads = [load * growth_factor for load in self.axle_loads]
-            total_loads.append(projected_loads)
-            logger.debug(f"Year {year + 1}: {projected_loads}")
-        return total_loads
+        parts = [spectrum.per_axle() for spectrum in spectra]
+        loads = np.concatenate([p[0] for p in parts]) if parts else np.zeros(0)
+        counts = np.concatenate([p[1] for p in parts]) if parts else np.zeros(0)
+        return TrafficData(loads.tolist(), traffic_growth_rate, analysis_period, load_counts=counts.tolist())
+
+    def to_load_spectrum(self, bin_width: Optional[float] = None) -> LoadSpectrum:
+        """
+        Collapse the axle loads into a single-axle load spectrum.
+
+        Without bin_width identical loads are merged, which leaves all distress predictions
+        unchanged. With bin_width loads are grouped into bins of that width (kN), each
+        represented by the repetition-weighted mean load of the bin.
+
+        :param bin_width: Optional load bin width in kN.
+        :return: LoadSpectrum instance.
+        """
+        loads = self.load_array()
+        weights = self.load_weights()
+        if bin_width is None:
+            keys = loads
+        elif bin_width > 0:
+            keys = np.floor(loads / bin_width)
+        else:
+            raise ValueError("bin_width must be positive.")
+        _, inverse = np.unique(keys, return_inverse=True)
+        counts = np.bincount(inverse, weights=weights)
+        load_bins = np.bincount(inverse, weights=weights * loads) / np.where(counts > 0, counts, 1)
+        logger.info(f"Collapsed {loads.size} axle loads into {counts.size} load bins.")
+        return LoadSpectrum(load_bins.tolist(), counts.tolist())
 
     @staticmethod
-    def from_dataframe(df: pd.DataFrame) -> 'TrafficData':
+    def from_dataframe(df: 'pd.DataFrame') -> 'TrafficData':
         """
         Create TrafficData instance from a pandas DataFrame.
 
-        :param df: DataFrame with columns 'Axle_Loads', 'Traffic_Growth_Rate', 'Analysis_Period'.
+        :param df: DataFrame with columns 'Axle_Loads', 'Traffic_Growth_Rate', 'Analysis_Period',
+                   and optionally 'Load_Counts' and 'Axle_Type' for a binned load spectrum.
         :return: TrafficData instance.
         """
         try:
-            axle_loads = df['Axle_Loads'].dropna().tolist()
             traffic_growth_rate = float(df['Traffic_Growth_Rate'].iloc[0])
             analysis_period = int(df['Analysis_Period'].iloc[0])
+            if 'Load_Counts' in df or 'Axle_Type' in df:
+                rows = df.dropna(subset=['Axle_Loads'])
+                counts = rows['Load_Counts'] if 'Load_Counts' in df else np.ones(len(rows))
+                types = rows['Axle_Type'].fillna('single') if 'Axle_Type' in df else ['single'] * len(rows)
+                by_type: Dict[str, Tuple[List[float], List[float]]] = {}
+                for load, count, axle_type in zip(rows['Axle_Loads'], counts, types):
+                    bins, reps = by_type.setdefault(str(axle_type).strip().lower(), ([], []))
+                    bins.append(float(load))
+                    reps.append(float(count))
+                spectra = [LoadSpectrum(bins, reps, axle_type) for axle_type, (bins, reps) in by_type.items()]
+                logger.info("TrafficData loaded successfully from DataFrame load spectrum.")
+                return TrafficData.from_load_spectra(spectra, traffic_growth_rate, analysis_period)
+            axle_loads = df['Axle_Loads'].dropna().tolist()
             logger.info("TrafficData loaded successfully from DataFrame.")
             return TrafficData(axle_loads, traffic_growth_rate, analysis_period)
         except Exception as e:
@@ -57,27 +241,84 @@ class TrafficData:
 
 
 class ClimateData:
-    def __init__(self, average_temperature: float, temperature_variation: float, rainfall: float):
+    def __init__(self, average_temperature: float, temperature_variation: float, rainfall: float,
+                 temperature_series: Optional[List[float]] = None, rainfall_series: Optional[List[float]] = None,
+                 steps_per_year: int = 12):
         """
         Initialize ClimateData with average temperature, temperature variation, and rainfall.
 
         :param average_temperature: Average temperature in °C.
         :param temperature_variation: Temperature variation in °C.
         :param rainfall: Annual rainfall in mm.
+        :param temperature_series: Optional temperature of each time step in °C (e.g. monthly or hourly).
+        :param rainfall_series: Optional rainfall of each time step in mm.
+        :param steps_per_year: Number of time steps per year in the series (12 monthly, 8760 hourly).
         """
+        if steps_per_year < 1:
+            raise ValueError("steps_per_year must be a positive integer.")
+        if (temperature_series is not None and rainfall_series is not None
+                and len(temperature_series) != len(rainfall_series)):
+            raise ValueError("temperature_series and rainfall_series must have the same length.")
         self.average_temperature = average_temperature
         self.temperature_variation = temperature_variation
         self.rainfall = rainfall
+        self.temperature_series = temperature_series
+        self.rainfall_series = rainfall_series
+        self.steps_per_year = steps_per_year
 
     @staticmethod
-    def from_dataframe(df: pd.DataFrame) -> 'ClimateData':
+    def from_series(temperature_series: List[float], rainfall_series: List[float],
+                    steps_per_year: int = 12) -> 'ClimateData':
+        """
+        Create ClimateData from a climate record, deriving the annual summary values.
+
+        The temperature variation is the mean over the record's years of each year's
+        temperature range, and rainfall is the mean annual total.
+
+        :param temperature_series: Temperature of each time step in °C.
+        :param rainfall_series: Rainfall of each time step in mm.
+        :param steps_per_year: Number of time steps per year.
+        :return: ClimateData instance carrying the series as read-only arrays.
+        """
+        temperatures = np.array(temperature_series, dtype=float)
+        rainfall = np.array(rainfall_series, dtype=float)
+        if temperatures.size == 0:
+            raise ValueError("A climate series needs at least one time step.")
+        if rainfall.size != temperatures.size:
+            logger.error(f"Climate series lengths differ: {temperatures.size} temperatures, {rainfall.size} rainfall")
+            raise ValueError(f"temperature_series and rainfall_series must have the same length, "
+                             f"got {temperatures.size} and {rainfall.size}.")
+        # Stored as read-only float arrays: a multi-year hourly record would otherwise box
+        # every step as a Python float.
+        temperatures.flags.writeable = False
+        rainfall.flags.writeable = False
+        years = np.arange(temperatures.size) // steps_per_year
+        n_years = int(years[-1]) + 1
+        yearly_max = np.full(n_years, -np.inf)
+        yearly_min = np.full(n_years, np.inf)
+        np.maximum.at(yearly_max, years, temperatures)
+        np.minimum.at(yearly_min, years, temperatures)
+        annual_rainfall = float(rainfall.sum()) * steps_per_year / temperatures.size
+        return ClimateData(float(temperatures.mean()), float(np.mean(yearly_max - yearly_min)), annual_rainfall,
+                           temperatures, rainfall, steps_per_year)
+
+    @staticmethod
+    def from_dataframe(df: 'pd.DataFrame') -> 'ClimateData':
         """
         Create ClimateData instance from a pandas DataFrame.
 
-        :param df: DataFrame with columns 'Average_Temperature', 'Temperature_Variation', 'Rainfall'.
+        :param df: DataFrame with columns 'Average_Temperature', 'Temperature_Variation', 'Rainfall',
+                   or a climate record with columns 'Temperature_Series', 'Rainfall_Series' and
+                   optionally 'Steps_Per_Year'.
         :return: ClimateData instance.
         """
         try:
+            if 'Temperature_Series' in df and 'Rainfall_Series' in df:
+                series = df[['Temperature_Series', 'Rainfall_Series']].dropna()
+                steps_per_year = int(df['Steps_Per_Year'].iloc[0]) if 'Steps_Per_Year' in df else 12
+                logger.info("ClimateData series loaded successfully from DataFrame.")
+                return ClimateData.from_series(series['Temperature_Series'].to_numpy(),
+                                               series['Rainfall_Series'].to_numpy(), steps_per_year)
             average_temperature = float(df['Average_Temperature'].iloc[0])
             temperature_variation = float(df['Temperature_Variation'].iloc[0])
             rainfall = float(df['Rainfall'].iloc[0])
@@ -100,7 +341,7 @@ class SubgradeProperties:
         self.CBR = CBR
 
     @staticmethod
-    def from_dataframe(df: pd.DataFrame) -> 'SubgradeProperties':
+    def from_dataframe(df: 'pd.DataFrame') -> 'SubgradeProperties':
         """
         Create SubgradeProperties instance from a pandas DataFrame.
 
@@ -131,7 +372,7 @@ class MaterialProperties:
         self.thermal_coeff = thermal_coeff
 
     @staticmethod
-    def from_dataframe(df: pd.DataFrame) -> 'MaterialProperties':
+    def from_dataframe(df: 'pd.DataFrame') -> 'MaterialProperties':
         """
         Create MaterialProperties instance from a pandas DataFrame.
 
@@ -167,7 +408,7 @@ class Pavement:
         :param thickness: Thickness of the new layer in mm.
         """
         self.layers.append(thickness)
-        logger.debug(f"Added layer: {thickness} mm. Total layers: {self.layers}")
+        logger.debug("Added layer: %s mm. Total layers: %s", thickness, self.layers)
 
     def remove_layer(self, index: int):
         """
@@ -177,7 +418,7 @@ class Pavement:
         """
         if 0 <= index < len(self.layers):
             removed = self.layers.pop(index)
-            logger.debug(f"Removed layer at index {index}: {removed} mm. Remaining layers: {self.layers}")
+            logger.debug("Removed layer at index %d: %s mm. Remaining layers: %s", index, removed, self.layers)
         else:
             logger.warning(f"Attempted to remove non-existent layer at index {index}.")
 
@@ -189,7 +430,162 @@ class Pavement:
         """
         if pavement_type in ['Flexible', 'Rigid', 'Composite']:
             self.pavement_type = pavement_type
-            logger.debug(f"Pavement type set to {pavement_type}.")
+            logger.debug("Pavement type set to %s.", pavement_type)
         else:
             logger.error(f"Invalid pavement type: {pavement_type}. Must be 'Flexible', 'Rigid', or 'Composite'.")
             raise ValueError("Invalid pavement type. Choose from 'Flexible', 'Rigid', or 'Composite'.")
+
+
+class _RecordMixin:
+    """
+    Shared helpers for the immutable, slotted record variants of the model classes.
+    """
+    __slots__ = ()
+    _model_class: ClassVar[type]
+    _sequence_fields: ClassVar[Tuple[str, ...]] = ()
+
+    def __post_init__(self):
+        for name in self._sequence_fields:
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value.tolist() if isinstance(value, np.ndarray) else value))
+
+    @classmethod
+    def from_columns(cls, **columns: Any) -> List[Any]:
+        """
+        Bulk-construct records from columnar arrays, one record per row.
+
+        Scalars are broadcast to every row, and a flat sequence given for a sequence
+        field (e.g. one axle-load spectrum) is shared by every row as a single tuple.
+        Each column is converted once and the slots are then filled field by field,
+        bypassing the per-row __init__ of the frozen dataclass.
+
+        :param columns: One array-like (or scalar) per record field.
+        :return: List of records.
+        """
+        record_fields = fields(cls)
+        missing = [f.name for f in record_fields if f.name not in columns and f.default is MISSING]
+        if missing:
+            raise ValueError(f"Missing columns for {cls.__name__}: {missing}")
+        values = [cls._column_values(f.name, columns[f.name]) if f.name in columns else f.default
+                  for f in record_fields]
+        lengths = {len(v) for v in values if isinstance(v, list)}
+        if len(lengths) > 1:
+            logger.error(f"Columns for {cls.__name__} have different lengths: {sorted(lengths)}")
+            raise ValueError(f"All columns for {cls.__name__} must have the same length, got {sorted(lengths)}.")
+        n_rows = lengths.pop() if lengths else 1
+        records = [object.__new__(cls) for _ in range(n_rows)]
+        for f, value in zip(record_fields, values):
+            # The slot descriptor sets the attribute without the frozen __setattr__ check.
+            set_slot = cls.__dict__[f.name].__set__
+            column = value if isinstance(value, list) else itertools.repeat(value, n_rows)
+            deque(map(set_slot, records, column), maxlen=0)
+        return records
+
+    @classmethod
+    def _column_values(cls, name: str, column: Any) -> Any:
+        """
+        Convert one column to a list of Python values, or return a value to broadcast.
+
+        :param name: Field name.
+        :param column: Array-like or scalar.
+        :return: List of row values, or a single value shared by every row.
+        """
+        if column is None:
+            return None
+        if name in cls._sequence_fields:
+            rows = column.tolist() if isinstance(column, np.ndarray) else list(column)
+            if rows and np.ndim(rows[0]) == 0:
+                return tuple(rows)
+            return [tuple(row) for row in rows]
+        if isinstance(column, list):
+            return column
+        if np.ndim(column) == 0:
+            return column.item() if isinstance(column, np.generic) else column
+        return np.asarray(column).tolist()
+
+    @classmethod
+    def from_model(cls, model: Any) -> Any:
+        """
+        Create a record from the corresponding mutable model instance.
+
+        :param model: Model instance with the same field names.
+        :return: Record instance.
+        """
+        return cls(*(getattr(model, f.name) for f in fields(cls)))
+
+    def to_model(self) -> Any:
+        """
+        Convert the record back into the mutable model class.
+
+        :return: Model instance (sequence fields become lists).
+        """
+        values = [getattr(self, f.name) for f in fields(self)]
+        values = [list(v) if f.name in self._sequence_fields and v is not None else v
+                  for f, v in zip(fields(self), values)]
+        return self._model_class(*values)
+
+
+@dataclass(frozen=True, slots=True)
+class TrafficRecord(_TrafficProjection, _RecordMixin):
+    """
+    Immutable, hashable counterpart of TrafficData; axle loads are stored as a tuple.
+    """
+    _sequence_fields: ClassVar[Tuple[str, ...]] = ('axle_loads', 'load_counts')
+
+    axle_loads: Tuple[float, ...]
+    traffic_growth_rate: float
+    analysis_period: int
+    load_counts: Optional[Tuple[float, ...]] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ClimateRecord(_RecordMixin):
+    """
+    Immutable, hashable counterpart of ClimateData; climate series are stored as tuples.
+    """
+    _sequence_fields: ClassVar[Tuple[str, ...]] = ('temperature_series', 'rainfall_series')
+
+    average_temperature: float
+    temperature_variation: float
+    rainfall: float
+    temperature_series: Optional[Tuple[float, ...]] = None
+    rainfall_series: Optional[Tuple[float, ...]] = None
+    steps_per_year: int = 12
+
+
+@dataclass(frozen=True, slots=True)
+class SubgradeRecord(_RecordMixin):
+    """
+    Immutable, hashable counterpart of SubgradeProperties.
+    """
+    modulus: float
+    CBR: float
+
+
+@dataclass(frozen=True, slots=True)
+class MaterialRecord(_RecordMixin):
+    """
+    Immutable, hashable counterpart of MaterialProperties.
+    """
+    asphalt_modulus: float
+    concrete_strength: float
+    thermal_coeff: float
+
+
+@dataclass(frozen=True, slots=True)
+class PavementRecord(_RecordMixin):
+    """
+    Immutable, hashable counterpart of Pavement; layers are stored as a tuple.
+    """
+    _sequence_fields: ClassVar[Tuple[str, ...]] = ('layers',)
+
+    layers: Tuple[Any, ...]
+    pavement_type: str = 'Flexible'
+
+
+TrafficRecord._model_class = TrafficData
+ClimateRecord._model_class = ClimateData
+SubgradeRecord._model_class = SubgradeProperties
+MaterialRecord._model_class = MaterialProperties
+PavementRecord._model_class = Pavement
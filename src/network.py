@@ -0,0 +1,178 @@
+# src/network.py
+
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+from src.ingestion import SCENARIO_NUMERIC_COLUMNS, iter_scenario_chunks, write_result_pages
+from src.parallel import iter_chunk_results
+from src.utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = setup_logger(__name__)
+
+NETWORK_RESULTS = ('Fatigue Cracking', 'Rutting', 'Thermal Cracking', 'Lifecycle Cost')
+
+
+class NetworkKPIs:
+    def __init__(self, limits: Optional[Dict[str, float]] = None, length_column: Optional[str] = 'length_km'):
+        """
+        Streaming aggregation of network-level indicators over per-section result chunks.
+
+        Only running sums, maxima and counts are kept, so memory does not depend on the
+        number of sections.
+
+        :param limits: Upper limit per result, e.g. {'Rutting': 12.5}; sections above it count as exceeding.
+        :param length_column: Optional section-length column used for length-weighted shares.
+        """
+        unknown = [key for key in (limits or {}) if key not in NETWORK_RESULTS]
+        if unknown:
+            logger.error(f"Unknown network limits: {unknown}")
+            raise ValueError(f"Unknown network limits {unknown}. Choose from {list(NETWORK_RESULTS)}.")
+        self.limits = dict(limits or {})
+        self.length_column = length_column
+        self.sections = 0
+        self.total_length = 0.0
+        self._sums: Dict[str, float] = {}
+        self._maxima: Dict[str, float] = {}
+        self._exceeding: Dict[str, int] = {key: 0 for key in self.limits}
+        self._exceeding_length: Dict[str, float] = {key: 0.0 for key in self.limits}
+
+    def update(self, columns: Dict[str, Any], results: Dict[str, np.ndarray]):
+        """
+        Add one chunk of sections.
+
+        :param columns: Section input columns of the chunk.
+        :param results: Result arrays of the chunk.
+        """
+        n_sections = len(next(iter(results.values()))) if results else 0
+        lengths = None
+        if self.length_column and self.length_column in columns:
+            lengths = np.asarray(columns[self.length_column], dtype=float)
+            self.total_length += float(lengths.sum())
+        self.sections += n_sections
+        for key, values in results.items():
+            values = np.asarray(values, dtype=float)
+            self._sums[key] = self._sums.get(key, 0.0) + float(values.sum())
+            if values.size:
+                self._maxima[key] = max(self._maxima.get(key, -np.inf), float(values.max()))
+        for key, limit in self.limits.items():
+            if key not in results:
+                logger.error(f"Network results have no '{key}' to check against its limit.")
+                raise ValueError(f"Cannot apply the {key} limit: the sections table yields no '{key}'.")
+            exceeding = np.asarray(results[key], dtype=float) > limit
+            self._exceeding[key] += int(exceeding.sum())
+            if lengths is not None:
+                self._exceeding_length[key] += float(lengths[exceeding].sum())
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Network-level indicators of the sections seen so far.
+
+        :return: Section count and length, mean and maximum of every result, total discounted
+                 lifecycle cost and, per limit, the share of sections (and of length) exceeding it.
+        """
+        kpis: Dict[str, float] = {'Sections': float(self.sections)}
+        if self.total_length:
+            kpis['Total Length'] = self.total_length
+        for key, total in self._sums.items():
+            kpis[f"Mean {key}"] = total / self.sections if self.sections else 0.0
+            kpis[f"Max {key}"] = self._maxima.get(key, 0.0)
+        if 'Lifecycle Cost' in self._sums:
+            kpis['Total Discounted Cost'] = self._sums['Lifecycle Cost']
+        for key, count in self._exceeding.items():
+            kpis[f"Share Exceeding {key} Limit"] = count / self.sections if self.sections else 0.0
+            if self.total_length:
+                kpis[f"Length Share Exceeding {key} Limit"] = self._exceeding_length[key] / self.total_length
+        return kpis
+
+
+def _section_chunks(sections: Union[str, 'pd.DataFrame', Dict[str, Sequence[Any]], Iterable[Dict[str, Any]]],
+                    chunk_size: int, length_column: Optional[str] = None) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Normalize the supported sections inputs to a stream of column chunks.
+
+    :param sections: Path to a CSV/Parquet file, an in-memory table, or an iterable of column chunks.
+    :param chunk_size: Sections per chunk for files and tables.
+    :param length_column: Optional section-length column, read as numbers from CSV files.
+    :return: Iterator of column mappings.
+    """
+    if isinstance(sections, str):
+        numeric_columns = SCENARIO_NUMERIC_COLUMNS + ((length_column,) if length_column else ())
+        yield from iter_scenario_chunks(sections, chunk_size, numeric_columns)
+    elif hasattr(sections, 'columns') or isinstance(sections, dict):
+        columns = {name: np.asarray(sections[name]) for name in (sections.columns if hasattr(sections, 'columns')
+                                                                  else sections)}
+        n_sections = len(next(iter(columns.values()))) if columns else 0
+        for start in range(0, n_sections, chunk_size):
+            yield {name: values[start:start + chunk_size] for name, values in columns.items()}
+    else:
+        yield from sections
+
+
+def run_network_analysis(sections: Union[str, 'pd.DataFrame', Dict[str, Sequence[Any]], Iterable[Dict[str, Any]]],
+                         output_path: Optional[str] = None,
+                         axle_loads: Optional[Sequence[float]] = None,
+                         maintenance_costs: Optional[Dict[int, float]] = None,
+                         limits: Optional[Dict[str, float]] = None,
+                         max_workers: Optional[int] = 1,
+                         chunk_size: int = 10000,
+                         load_counts: Optional[Sequence[float]] = None,
+                         length_column: Optional[str] = 'length_km') -> Dict[str, float]:
+    """
+    Run the performance and LCCA pipeline for every section of a road network.
+
+    Each section is one row of the sections table, with its own traffic, climate, subgrade
+    and material columns (see BATCH_INPUT_COLUMNS, plus initial_cost and discount_rate for
+    LCCA). Sections are read, evaluated in vectorized chunks (iter_chunk_results) and written
+    to output_path chunk by chunk, so memory is bounded by the chunk size rather than the
+    network size. Network KPIs are aggregated on the fly (NetworkKPIs).
+
+    :param sections: Path to a CSV/Parquet sections file, an in-memory table, or an iterable of column chunks.
+    :param output_path: Optional CSV/Parquet file receiving the section inputs and results.
+    :param axle_loads: Optional base-year axle loads in kN shared by every section; otherwise the
+                       table provides axle_load_sum and axle_load_cube_sum per section.
+    :param maintenance_costs: Optional maintenance costs with year as key, shared by every section.
+    :param limits: Upper limit per result used for the exceedance shares, e.g. {'Rutting': 12.5}.
+    :param max_workers: Number of worker processes (None uses the CPU count).
+    :param chunk_size: Sections per chunk.
+    :param load_counts: Optional repetitions of each shared axle load (binned spectrum).
+    :param length_column: Optional section-length column for length-weighted KPIs.
+    :return: Network KPIs.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    start = time.perf_counter()
+    kpis = NetworkKPIs(limits, length_column)
+    # Input chunks are kept until their results arrive; results come back in input order.
+    in_flight = deque()
+
+    def remember(chunks: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for chunk in chunks:
+            in_flight.append(chunk)
+            yield chunk
+
+    def section_results() -> Iterator[Dict[str, np.ndarray]]:
+        chunks = remember(_section_chunks(sections, chunk_size, length_column))
+        results_stream = iter_chunk_results(chunks, axle_loads, maintenance_costs, max_workers, load_counts)
+        for results in results_stream:
+            columns = in_flight.popleft()
+            kpis.update(columns, results)
+            yield {**columns, **results}
+
+    if output_path:
+        write_result_pages(output_path, section_results())
+    else:
+        for _ in section_results():
+            pass
+
+    summary = kpis.summary()
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Network analysis of {kpis.sections} section(s) completed in "
+                    f"{time.perf_counter() - start:.2f} s.")
+    return summary
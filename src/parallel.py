@@ -0,0 +1,146 @@
+# src/parallel.py
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+from src.lcca import calculate_LCCA_batch
+from src.performance import design_new_pavement_batch, BATCH_INPUT_COLUMNS, BATCH_SPECTRUM_COLUMNS
+from src.utils.helpers import as_input_table
+from src.utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = setup_logger(__name__)
+
+# Optional per-scenario LCCA columns; lcca_period falls back to analysis_period.
+LCCA_INPUT_COLUMNS = ('initial_cost', 'discount_rate', 'lcca_period')
+
+
+def _to_columns(scenarios: Union['pd.DataFrame', Dict[str, Sequence[float]]]) -> Dict[str, np.ndarray]:
+    """
+    Convert scenario input into contiguous float64 arrays for the columns the runner uses.
+
+    :param scenarios: DataFrame or mapping of column name to array-like.
+    :return: Mapping of column name to NumPy array.
+    """
+    wanted = BATCH_INPUT_COLUMNS + BATCH_SPECTRUM_COLUMNS + LCCA_INPUT_COLUMNS
+    return {column: np.ascontiguousarray(scenarios[column], dtype=float)
+            for column in wanted if column in scenarios}
+
+
+def _run_chunk(columns: Dict[str, np.ndarray], axle_loads: Optional[np.ndarray], load_counts: Optional[np.ndarray],
+               maintenance_costs: Dict[int, float]) -> Dict[str, np.ndarray]:
+    """
+    Worker entry point: distresses and, when LCCA inputs are present, lifecycle cost for one chunk.
+
+    :param columns: Scenario columns for this chunk.
+    :param axle_loads: Shared axle-load spectrum or None for per-row moments.
+    :param load_counts: Repetitions of each shared axle load, or None.
+    :param maintenance_costs: Maintenance costs with year as key.
+    :return: Mapping of result name to array.
+    """
+    results = design_new_pavement_batch(columns, axle_loads, load_counts)
+    if 'initial_cost' in columns and 'discount_rate' in columns:
+        periods = columns.get('lcca_period', columns['analysis_period'])
+        results['Lifecycle Cost'] = calculate_LCCA_batch(columns['initial_cost'], maintenance_costs,
+                                                         columns['discount_rate'], periods)
+    return results
+
+
+def iter_parallel_sweep(scenarios: Union['pd.DataFrame', Dict[str, Sequence[float]]],
+                        axle_loads: Optional[Sequence[float]] = None,
+                        maintenance_costs: Optional[Dict[int, float]] = None,
+                        max_workers: Optional[int] = None,
+                        chunk_size: int = 10000,
+                        load_counts: Optional[Sequence[float]] = None) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Evaluate a scenario sweep across worker processes, yielding chunk results in input order.
+
+    Scenarios are sharded into chunks of contiguous float arrays, so only compact NumPy
+    buffers cross process boundaries. At most two chunks per worker are in flight at once,
+    which bounds memory for very large sweeps.
+
+    :param scenarios: DataFrame or mapping of column name to array-like, one entry per scenario.
+    :param axle_loads: Optional base-year axle loads in kN shared by every scenario.
+    :param maintenance_costs: Optional maintenance costs with year as key, shared by every scenario.
+    :param max_workers: Number of worker processes (defaults to the CPU count); 1 runs in-process.
+    :param chunk_size: Number of scenarios per chunk.
+    :param load_counts: Optional repetitions of each shared axle load (binned spectrum).
+    :return: Iterator of per-chunk result mappings.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    columns = _to_columns(scenarios)
+    n_scenarios = len(next(iter(columns.values()))) if columns else 0
+    chunks = ({column: values[start:start + chunk_size] for column, values in columns.items()}
+              for start in range(0, n_scenarios, chunk_size))
+    logger.info(f"Running sweep of {n_scenarios} scenarios, chunk size {chunk_size}.")
+    yield from iter_chunk_results(chunks, axle_loads, maintenance_costs, max_workers, load_counts)
+
+
+def iter_chunk_results(chunks: Iterable[Dict[str, Sequence[float]]],
+                       axle_loads: Optional[Sequence[float]] = None,
+                       maintenance_costs: Optional[Dict[int, float]] = None,
+                       max_workers: Optional[int] = None,
+                       load_counts: Optional[Sequence[float]] = None) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Evaluate a stream of scenario chunks across worker processes, yielding results in input order.
+
+    Chunks are consumed lazily and at most two chunks per worker are in flight at once,
+    so memory is bounded by the chunk size, not by the length of the stream.
+
+    :param chunks: Iterable of column mappings (e.g. read chunk by chunk from a file).
+    :param axle_loads: Optional base-year axle loads in kN shared by every scenario.
+    :param maintenance_costs: Optional maintenance costs with year as key, shared by every scenario.
+    :param max_workers: Number of worker processes (defaults to the CPU count); 1 runs in-process.
+    :param load_counts: Optional repetitions of each shared axle load (binned spectrum).
+    :return: Iterator of per-chunk result mappings.
+    """
+    loads = None if axle_loads is None else np.asarray(axle_loads, dtype=float)
+    counts = None if load_counts is None else np.asarray(load_counts, dtype=float)
+    maintenance = dict(maintenance_costs or {})
+    chunks = (_to_columns(chunk) for chunk in chunks)
+    workers = max_workers or os.cpu_count() or 1
+    logger.info(f"Evaluating scenario chunks with {workers} worker(s).")
+
+    if workers == 1:
+        for chunk in chunks:
+            yield _run_chunk(chunk, loads, counts, maintenance)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_run_chunk, chunk, loads, counts, maintenance))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_parallel_sweep(scenarios: Union['pd.DataFrame', Dict[str, Sequence[float]]],
+                       axle_loads: Optional[Sequence[float]] = None,
+                       maintenance_costs: Optional[Dict[int, float]] = None,
+                       max_workers: Optional[int] = None,
+                       chunk_size: int = 10000,
+                       load_counts: Optional[Sequence[float]] = None) -> Union['pd.DataFrame', Dict[str, np.ndarray]]:
+    """
+    Evaluate a scenario sweep in parallel and merge the chunk results.
+
+    :param scenarios: DataFrame or mapping of column name to array-like, one entry per scenario.
+    :param axle_loads: Optional base-year axle loads in kN shared by every scenario.
+    :param maintenance_costs: Optional maintenance costs with year as key, shared by every scenario.
+    :param max_workers: Number of worker processes (defaults to the CPU count).
+    :param chunk_size: Number of scenarios per chunk.
+    :param load_counts: Optional repetitions of each shared axle load (binned spectrum).
+    :return: DataFrame (for DataFrame input) or dict of arrays, in input order.
+    """
+    parts = list(iter_parallel_sweep(scenarios, axle_loads, maintenance_costs, max_workers, chunk_size, load_counts))
+    merged = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]} if parts else {}
+    logger.info("Parallel sweep completed.")
+    return as_input_table(scenarios, merged)
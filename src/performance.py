@@ -1,13 +1,102 @@
 # src/performance.py
 
 import logging
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from src.models import Pavement, TrafficData, ClimateData, SubgradeProperties, MaterialProperties
+from src.utils.helpers import geometric_series_gradient, geometric_series_sum, as_input_table
 from src.utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = setup_logger(__name__)
 
+# Columns expected by design_new_pavement_batch, one row per scenario.
+BATCH_INPUT_COLUMNS = ('traffic_growth_rate', 'analysis_period', 'rainfall', 'temperature_variation',
+                       'subgrade_modulus', 'asphalt_modulus', 'thermal_coeff')
+# Per-scenario load spectrum moments, required when no shared axle_loads are given.
+BATCH_SPECTRUM_COLUMNS = ('axle_load_sum', 'axle_load_cube_sum')
+
+
+def batch_scenario(traffic_data: TrafficData, climate_data: ClimateData, subgrade_props: SubgradeProperties,
+                   material_props: MaterialProperties, spectrum_moments: bool = False) -> Dict[str, float]:
+    """
+    Batch column values of one design, read from its model objects.
+
+    :param traffic_data: Traffic data.
+    :param climate_data: Climate data.
+    :param subgrade_props: Subgrade properties.
+    :param material_props: Material properties.
+    :param spectrum_moments: Also include the BATCH_SPECTRUM_COLUMNS moments of the traffic spectrum.
+    :return: Mapping of each BATCH_INPUT_COLUMNS name (and optionally BATCH_SPECTRUM_COLUMNS name) to its value.
+    """
+    values = {
+        'traffic_growth_rate': traffic_data.traffic_growth_rate,
+        'analysis_period': traffic_data.analysis_period,
+        'rainfall': climate_data.rainfall,
+        'temperature_variation': climate_data.temperature_variation,
+        'subgrade_modulus': subgrade_props.modulus,
+        'asphalt_modulus': material_props.asphalt_modulus,
+        'thermal_coeff': material_props.thermal_coeff
+    }
+    if spectrum_moments:
+        values['axle_load_sum'] = traffic_data.load_moment(1)
+        values['axle_load_cube_sum'] = traffic_data.load_moment(3)
+    return {column: float(value) for column, value in values.items()}
+
+
+def fatigue_damage_per_year(traffic_data: TrafficData, material_props: MaterialProperties) -> np.ndarray:
+    """
+    Vectorized fatigue damage for every analysis year.
+
+    Since every projected load is the base load scaled by the year's growth factor,
+    sum((load * g / E) ** 3) over the spectrum equals g ** 3 * sum((load / E) ** 3),
+    so the spectrum is reduced once and combined with the growth vector.
+
+    :param traffic_data: Traffic data.
+    :param material_props: Material properties.
+    :return: Array of fatigue damage per year.
+    """
+    spectrum_damage = traffic_data.load_moment(3) / material_props.asphalt_modulus ** 3  # Simplified relationship
+    return traffic_data.growth_factors() ** 3 * spectrum_damage
+
+
+def rutting_per_year(traffic_data: TrafficData, climate_data: ClimateData, subgrade_props: SubgradeProperties) -> np.ndarray:
+    """
+    Vectorized rutting depth for every analysis year.
+
+    :param traffic_data: Traffic data.
+    :param climate_data: Climate data.
+    :param subgrade_props: Subgrade properties.
+    :return: Array of rutting depth (mm) per year.
+    """
+    spectrum_rut = traffic_data.load_moment(1) / subgrade_props.modulus * (climate_data.rainfall / 1000)  # Simplified relationship
+    return traffic_data.growth_factors() * spectrum_rut
+
+
+def compute_distress_arrays(traffic_data: TrafficData, climate_data: ClimateData, subgrade_props: SubgradeProperties,
+                            material_props: MaterialProperties) -> Dict[str, Union[float, np.ndarray]]:
+    """
+    Compute load-related distresses as totals and per-year arrays in one pass.
+
+    :param traffic_data: Traffic data.
+    :param climate_data: Climate data.
+    :param subgrade_props: Subgrade properties.
+    :param material_props: Material properties.
+    :return: Dictionary with total fatigue and rutting plus their per-year arrays.
+    """
+    fatigue_yearly = fatigue_damage_per_year(traffic_data, material_props)
+    rutting_yearly = rutting_per_year(traffic_data, climate_data, subgrade_props)
+    return {
+        'Fatigue Cracking': float(fatigue_yearly.sum()),
+        'Rutting': float(rutting_yearly.sum()),
+        'Fatigue Cracking per Year': fatigue_yearly,
+        'Rutting per Year': rutting_yearly
+    }
+
 
 def predict_fatigue_cracking(pavement: Pavement, traffic_data: TrafficData, material_props: MaterialProperties) -> float:
     """
@@ -18,14 +107,8 @@ def predict_fatigue_cracking(pavement: Pavement, traffic_data: TrafficData, mate
     :param material_props: Material properties.
     :return: Total fatigue damage.
     """
-    total_damage = 0
-    axle_loads = traffic_data.get_total_axle_loads()
-    for year, loads in enumerate(axle_loads):
-        for load in loads:
-            damage = (load / material_props.asphalt_modulus) ** 3  # Simplified relationship
-            total_damage += damage
-            logger.debug(f"Year {year + 1}, Load {load} kN: Damage {damage}")
-    logger.info(f"Total Fatigue Damage: {total_damage}")
+    total_damage = traffic_data.total_load_moment(3) / material_props.asphalt_modulus ** 3  # Simplified relationship
+    logger.info("Total Fatigue Damage: %s", total_damage)
     return total_damage
 
 
@@ -39,14 +122,8 @@ def predict_rutting(pavement: Pavement, traffic_data: TrafficData, climate_data:
     :param subgrade_props: Subgrade properties.
     :return: Total rutting depth.
     """
-    total_rut = 0
-    axle_loads = traffic_data.get_total_axle_loads()
-    for year, loads in enumerate(axle_loads):
-        for load in loads:
-            rut = (load / subgrade_props.modulus) * (climate_data.rainfall / 1000)  # Simplified relationship
-            total_rut += rut
-            logger.debug(f"Year {year + 1}, Load {load} kN: Rut {rut} mm")
-    logger.info(f"Total Rutting: {total_rut} mm")
+    total_rut = traffic_data.total_load_moment(1) / subgrade_props.modulus * (climate_data.rainfall / 1000)  # Simplified relationship
+    logger.info("Total Rutting: %s mm", total_rut)
     return total_rut
 
 
@@ -60,7 +137,7 @@ def predict_thermal_cracking(pavement: Pavement, climate_data: ClimateData, mate
     :return: Thermal cracking index.
     """
     thermal_crack = material_props.thermal_coeff * climate_data.temperature_variation
-    logger.info(f"Thermal Cracking Index: {thermal_crack}")
+    logger.info("Thermal Cracking Index: %s", thermal_crack)
     return thermal_crack
 
 
@@ -101,3 +178,94 @@ def evaluate_performance(pavement: Pavement, traffic_data: TrafficData, climate_
     """
     logger.info("Evaluating pavement performance.")
     return design_new_pavement(pavement, traffic_data, climate_data, subgrade_props, material_props)
+
+
+def design_new_pavement_batch(scenarios: Union['pd.DataFrame', Dict[str, Sequence[float]]],
+                              axle_loads: Optional[Sequence[float]] = None,
+                              load_counts: Optional[Sequence[float]] = None,
+                              with_gradients: bool = False) -> Union['pd.DataFrame', Dict[str, np.ndarray], Tuple]:
+    """
+    Predict distresses for many scenarios in a single vectorized pass.
+
+    Each scenario is one row of columnar input holding BATCH_INPUT_COLUMNS. The axle-load
+    spectrum is either shared by all scenarios (axle_loads) or given per row through the
+    BATCH_SPECTRUM_COLUMNS moments sum(load) and sum(load ** 3). Totals use the same
+    closed-form geometric series as TrafficData.total_load_moment. Nothing is logged per scenario.
+
+    With with_gradients, the exact partial derivatives of every output are derived from the
+    same intermediate arrays, so the values are identical to a call without gradients. With a
+    shared spectrum the gradients include 'axle_loads' and 'load_counts' arrays of shape
+    (n_scenarios, n_loads); otherwise they are taken with respect to the BATCH_SPECTRUM_COLUMNS.
+    analysis_period is treated as continuous.
+
+    :param scenarios: DataFrame or mapping of column name to array-like, one entry per scenario.
+    :param axle_loads: Optional base-year axle loads in kN shared by every scenario.
+    :param load_counts: Optional repetitions of each shared axle load (binned spectrum).
+    :param with_gradients: Also return the partial derivatives of each output.
+    :return: DataFrame (for DataFrame input) or dict of arrays with 'Fatigue Cracking', 'Rutting' and 'Thermal Cracking';
+             with with_gradients, a tuple of that and a mapping of output name to input name to partial derivatives.
+    """
+    required = BATCH_INPUT_COLUMNS if axle_loads is not None else BATCH_INPUT_COLUMNS + BATCH_SPECTRUM_COLUMNS
+    missing = [column for column in required if column not in scenarios]
+    if missing:
+        logger.error(f"Batch scenarios are missing columns: {missing}")
+        raise ValueError(f"Invalid batch scenarios, missing columns: {missing}")
+    cols = {column: np.asarray(scenarios[column], dtype=float) for column in required}
+
+    if axle_loads is not None:
+        loads = np.asarray(axle_loads, dtype=float)
+        counts = np.ones_like(loads) if load_counts is None else np.asarray(load_counts, dtype=float)
+        load_sum = np.dot(counts, loads)
+        load_cube_sum = np.dot(counts, loads ** 3)
+    else:
+        load_sum = cols['axle_load_sum']
+        load_cube_sum = cols['axle_load_cube_sum']
+
+    growth = 1 + cols['traffic_growth_rate']
+    period = cols['analysis_period']
+    fatigue_series = geometric_series_sum(growth ** 3, period)
+    rutting_series = geometric_series_sum(growth, period)
+    fatigue_scale = load_cube_sum / cols['asphalt_modulus'] ** 3
+    rutting_scale = load_sum / cols['subgrade_modulus'] * (cols['rainfall'] / 1000)
+    fatigue = fatigue_scale * fatigue_series
+    rutting = rutting_scale * rutting_series
+    thermal = cols['thermal_coeff'] * cols['temperature_variation']
+
+    results = {
+        'Fatigue Cracking': np.asarray(fatigue, dtype=float),
+        'Rutting': np.asarray(rutting, dtype=float),
+        'Thermal Cracking': np.asarray(thermal, dtype=float)
+    }
+    if not with_gradients:
+        return as_input_table(scenarios, results)
+
+    d_fatigue_series, d_fatigue_period = geometric_series_gradient(growth ** 3, period)
+    d_rutting_series, d_rutting_period = geometric_series_gradient(growth, period)
+    fatigue_per_moment = fatigue_series / cols['asphalt_modulus'] ** 3
+    rutting_per_moment = cols['rainfall'] / 1000 / cols['subgrade_modulus'] * rutting_series
+    fatigue_gradients = {
+        'traffic_growth_rate': fatigue_scale * d_fatigue_series * 3 * growth ** 2,
+        'analysis_period': fatigue_scale * d_fatigue_period,
+        'asphalt_modulus': -3 * results['Fatigue Cracking'] / cols['asphalt_modulus']
+    }
+    rutting_gradients = {
+        'traffic_growth_rate': rutting_scale * d_rutting_series,
+        'analysis_period': rutting_scale * d_rutting_period,
+        'subgrade_modulus': -results['Rutting'] / cols['subgrade_modulus'],
+        'rainfall': load_sum / cols['subgrade_modulus'] * rutting_series / 1000
+    }
+    thermal_gradients = {
+        'thermal_coeff': cols['temperature_variation'],
+        'temperature_variation': cols['thermal_coeff']
+    }
+    if axle_loads is not None:
+        fatigue_gradients['axle_loads'] = np.outer(fatigue_per_moment, 3 * counts * loads ** 2)
+        fatigue_gradients['load_counts'] = np.outer(fatigue_per_moment, loads ** 3)
+        rutting_gradients['axle_loads'] = np.outer(rutting_per_moment, counts)
+        rutting_gradients['load_counts'] = np.outer(rutting_per_moment, loads)
+    else:
+        fatigue_gradients['axle_load_cube_sum'] = fatigue_per_moment
+        rutting_gradients['axle_load_sum'] = rutting_per_moment
+    gradients = {'Fatigue Cracking': fatigue_gradients, 'Rutting': rutting_gradients,
+                 'Thermal Cracking': thermal_gradients}
+    return as_input_table(scenarios, results), gradients
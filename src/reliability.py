@@ -0,0 +1,198 @@
+# src/reliability.py
+
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models import Pavement, TrafficData, ClimateData, SubgradeProperties, MaterialProperties
+from src.performance import batch_scenario, design_new_pavement_batch
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Default coefficients of variation for the sampled inputs. 'axle_loads' scales the
+# whole spectrum by one lognormal factor per sample.
+DEFAULT_COEFFICIENTS_OF_VARIATION = {
+    'traffic_growth_rate': 0.20,
+    'axle_loads': 0.10,
+    'subgrade_modulus': 0.25,
+    'asphalt_modulus': 0.15,
+    'rainfall': 0.20,
+    'temperature_variation': 0.15
+}
+
+DISTRESS_KEYS = ('Fatigue Cracking', 'Rutting', 'Thermal Cracking')
+
+
+def _lognormal(rng: np.random.Generator, mean: float, cov: float, size: int) -> np.ndarray:
+    """
+    Draw lognormal samples with the given arithmetic mean and coefficient of variation.
+
+    :param rng: NumPy random generator.
+    :param mean: Mean of the distribution (must be positive unless cov is 0).
+    :param cov: Coefficient of variation.
+    :param size: Number of samples.
+    :return: Array of samples.
+    """
+    if cov <= 0 or mean <= 0:
+        return np.full(size, float(mean))
+    sigma2 = np.log1p(cov ** 2)
+    return rng.lognormal(np.log(mean) - sigma2 / 2, np.sqrt(sigma2), size)
+
+
+def _sample_chunk(rng: np.random.Generator, size: int, base: Dict[str, float],
+                  covs: Dict[str, float]) -> Dict[str, np.ndarray]:
+    """
+    Sample one chunk of scenario columns for design_new_pavement_batch.
+
+    :param rng: NumPy random generator.
+    :param size: Number of samples in the chunk.
+    :param base: Mean value of every input.
+    :param covs: Coefficient of variation of every input.
+    :return: Mapping of batch column name to sampled array.
+    """
+    growth_sd = covs.get('traffic_growth_rate', 0.0) * abs(base['traffic_growth_rate'])
+    load_scale = _lognormal(rng, 1.0, covs.get('axle_loads', 0.0), size)
+    return {
+        'traffic_growth_rate': np.maximum(rng.normal(base['traffic_growth_rate'], growth_sd, size), -0.99),
+        'analysis_period': np.full(size, base['analysis_period']),
+        'rainfall': _lognormal(rng, base['rainfall'], covs.get('rainfall', 0.0), size),
+        'temperature_variation': _lognormal(rng, base['temperature_variation'], covs.get('temperature_variation', 0.0), size),
+        'subgrade_modulus': _lognormal(rng, base['subgrade_modulus'], covs.get('subgrade_modulus', 0.0), size),
+        'asphalt_modulus': _lognormal(rng, base['asphalt_modulus'], covs.get('asphalt_modulus', 0.0), size),
+        'thermal_coeff': np.full(size, base['thermal_coeff']),
+        'axle_load_sum': base['axle_load_sum'] * load_scale,
+        'axle_load_cube_sum': base['axle_load_cube_sum'] * load_scale ** 3
+    }
+
+
+def _merge_moments(moments: Tuple[int, float, float], values: np.ndarray) -> Tuple[int, float, float]:
+    """
+    Merge a chunk into running (count, mean, sum of squared deviations) statistics.
+
+    :param moments: Running statistics.
+    :param values: Chunk values.
+    :return: Updated statistics.
+    """
+    count, mean, m2 = moments
+    chunk_count = len(values)
+    chunk_mean = float(values.mean())
+    chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+    total = count + chunk_count
+    delta = chunk_mean - mean
+    return total, mean + delta * chunk_count / total, m2 + chunk_m2 + delta ** 2 * count * chunk_count / total
+
+
+def _histogram_edges(low: float, high: float, n_bins: int) -> np.ndarray:
+    """
+    Bin edges covering [low, high]: logarithmic for positive values, linear otherwise.
+
+    :param low: Smallest sample.
+    :param high: Largest sample.
+    :param n_bins: Number of bins.
+    :return: Array of n_bins + 1 edges.
+    """
+    if high <= low:
+        high = low + max(abs(low), 1.0) * 1e-12
+    if low > 0:
+        return np.geomspace(low, high, n_bins + 1)
+    return np.linspace(low, high, n_bins + 1)
+
+
+def _histogram_percentiles(counts: np.ndarray, edges: np.ndarray, percentiles: Sequence[float]) -> np.ndarray:
+    """
+    Percentiles from a histogram, with samples spread evenly inside each bin.
+
+    Ranks follow np.percentile's default (linear) definition, so the result differs from
+    the exact percentile by less than one bin width.
+
+    :param counts: Samples per bin.
+    :param edges: Bin edges.
+    :param percentiles: Percentiles between 0 and 100.
+    :return: Array of percentile values.
+    """
+    cumulative = np.cumsum(counts)
+    ranks = np.asarray(percentiles, dtype=float) / 100 * (cumulative[-1] - 1)
+    bins = np.minimum(np.searchsorted(cumulative, ranks, side='right'), len(counts) - 1)
+    before = cumulative[bins] - counts[bins]
+    fraction = np.clip((ranks - before + 0.5) / np.maximum(counts[bins], 1), 0.0, 1.0)
+    return edges[bins] + fraction * (edges[bins + 1] - edges[bins])
+
+
+def run_reliability_analysis(pavement: Pavement, traffic_data: TrafficData, climate_data: ClimateData,
+                             subgrade_props: SubgradeProperties, material_props: MaterialProperties,
+                             reliability: float = 0.90, n_samples: int = 100000, chunk_size: int = 100000,
+                             seed: Optional[int] = None,
+                             coefficients_of_variation: Optional[Dict[str, float]] = None,
+                             percentiles: Sequence[float] = (50, 90, 95, 99),
+                             n_bins: int = 65536) -> Dict[str, Dict[str, float]]:
+    """
+    Monte Carlo reliability analysis of the distress predictions.
+
+    Inputs are sampled around the given deterministic values with a seeded NumPy Generator
+    and evaluated in fixed-size chunks through design_new_pavement_batch. Samples are never
+    kept: a first pass accumulates the mean, standard deviation and range of every distress,
+    and a second pass regenerates the same samples (same seed) into a fixed-size histogram
+    (logarithmic bins for positive distresses) from which the percentiles are read. Peak
+    working memory therefore depends on chunk_size and n_bins, not on n_samples, at the
+    cost of evaluating every sample twice. Percentiles are within one bin width of the
+    exact sample percentiles. Results are reproducible for a given seed and chunk size.
+
+    :param pavement: Pavement structure.
+    :param traffic_data: Traffic data (mean values).
+    :param climate_data: Climate data (mean values).
+    :param subgrade_props: Subgrade properties (mean values).
+    :param material_props: Material properties (mean values).
+    :param reliability: Design reliability level (e.g., 0.90 or 0.95).
+    :param n_samples: Number of Monte Carlo samples.
+    :param chunk_size: Number of samples evaluated per vectorized chunk.
+    :param seed: Seed for the random generator.
+    :param coefficients_of_variation: Overrides for DEFAULT_COEFFICIENTS_OF_VARIATION.
+    :param percentiles: Percentiles to report for each distress.
+    :param n_bins: Histogram bins per distress used for the percentiles.
+    :return: For each distress, its mean, standard deviation, requested percentiles and
+             the design value at the reliability level.
+    """
+    if not 0 < reliability < 1:
+        raise ValueError("Reliability must be between 0 and 1 (e.g., 0.90 for 90%).")
+    if n_samples < 1 or chunk_size < 1 or n_bins < 1:
+        raise ValueError("n_samples, chunk_size and n_bins must be positive integers.")
+
+    covs = dict(DEFAULT_COEFFICIENTS_OF_VARIATION)
+    covs.update(coefficients_of_variation or {})
+    base = batch_scenario(traffic_data, climate_data, subgrade_props, material_props, spectrum_moments=True)
+    # Both passes must draw the same samples, so an unseeded run fixes its entropy up front.
+    seed = np.random.SeedSequence(seed)
+
+    def chunks() -> Iterator[Dict[str, np.ndarray]]:
+        rng = np.random.default_rng(seed)
+        for start in range(0, n_samples, chunk_size):
+            yield design_new_pavement_batch(_sample_chunk(rng, min(chunk_size, n_samples - start), base, covs))
+
+    moments = {key: (0, 0.0, 0.0) for key in DISTRESS_KEYS}
+    lows = {key: np.inf for key in DISTRESS_KEYS}
+    highs = {key: -np.inf for key in DISTRESS_KEYS}
+    for results in chunks():
+        for key in DISTRESS_KEYS:
+            values = results[key]
+            moments[key] = _merge_moments(moments[key], values)
+            lows[key] = min(lows[key], float(values.min()))
+            highs[key] = max(highs[key], float(values.max()))
+
+    edges = {key: _histogram_edges(lows[key], highs[key], n_bins) for key in DISTRESS_KEYS}
+    counts = {key: np.zeros(n_bins, dtype=np.int64) for key in DISTRESS_KEYS}
+    for results in chunks():
+        for key in DISTRESS_KEYS:
+            bins = np.clip(np.searchsorted(edges[key], results[key], side='right') - 1, 0, n_bins - 1)
+            counts[key] += np.bincount(bins, minlength=n_bins)
+
+    summary = {}
+    for key in DISTRESS_KEYS:
+        count, mean, m2 = moments[key]
+        values = _histogram_percentiles(counts[key], edges[key], list(percentiles) + [reliability * 100])
+        stats = {'Mean': mean, 'Std': float(np.sqrt(m2 / count))}
+        stats.update({f"P{p:g}": float(v) for p, v in zip(percentiles, values[:-1])})
+        stats['Design Value'] = float(values[-1])
+        summary[key] = stats
+    logger.info(f"Reliability analysis completed: {n_samples} samples at {reliability:.0%} reliability.")
+    return summary
@@ -1,13 +1,33 @@
 # src/reporting.py
 
-from typing import Dict
+import io
+import zipfile
+from functools import lru_cache
+from typing import IO, Any, Dict, Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple, Union
 import logging
 
+import numpy as np
+
 from src.utils.logger import setup_logger
-from src.utils.helpers import save_pdf
 
 logger = setup_logger(__name__)
 
+REPORT_TITLE = "Mechanistic-Empirical Pavement Design Report"
+RESULT_KEYS = ('Fatigue Cracking', 'Rutting', 'Thermal Cracking')
+
+
+class PageTemplate(NamedTuple):
+    """
+    Page geometry and fonts shared by every report page.
+    """
+    width: float
+    height: float
+    margin: float
+    font: str
+    font_size: float
+    leading: float
+    lines_per_page: int
+
 
 def generate_report(simulation_results: Dict[str, float], lcc: float) -> str:
     """
@@ -36,33 +56,185 @@ def generate_report(simulation_results: Dict[str, float], lcc: float) -> str:
     return report
 
 
-def export_report_to_pdf(report_content: str, file_path: str):
+@lru_cache(maxsize=None)
+def _reportlab():
     """
-    Export the report content to a PDF file.
+    Import ReportLab once and resolve the page template.
 
-    :param report_content: The content of the report as a string.
-    :param file_path: The path where the PDF will be saved.
+    :return: Tuple of (canvas module, PageTemplate).
     """
     try:
         from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
         from reportlab.lib.units import inch
+        from reportlab.pdfgen import canvas
+    except ImportError:
+        logger.error("ReportLab is not installed. Please install it using 'pip install reportlab'")
+        raise
+    width, height = letter
+    font_size = 12
+    leading = font_size * 1.2
+    # The first line sits one margin below the top edge; the footer band takes one more line.
+    lines_per_page = int((height - 2 * inch) // leading) - 1
+    return canvas, PageTemplate(width, height, inch, "Helvetica", font_size, leading, lines_per_page)
+
 
-        c = canvas.Canvas(file_path, pagesize=letter)
-        width, height = letter
-        textobject = c.beginText()
-        textobject.setTextOrigin(inch, height - inch)
-        textobject.setFont("Helvetica", 12)
+def _new_canvas(target: Union[str, IO[bytes]], title: str):
+    """
+    Canvas with the page template's header and footer registered once as a reusable form.
 
-        for line in report_content.split('\n'):
+    :param target: File path or binary file-like object.
+    :param title: Document title.
+    :return: Tuple of (canvas, PageTemplate).
+    """
+    canvas, template = _reportlab()
+    c = canvas.Canvas(target, pagesize=(template.width, template.height), pageCompression=1)
+    c.setTitle(title)
+    # Page decoration is stored once in the PDF and referenced from every page.
+    c.beginForm('page_template')
+    c.setFont(template.font, 8)
+    c.drawString(template.margin, template.height - template.margin / 2, REPORT_TITLE)
+    c.line(template.margin, template.margin * 0.75, template.width - template.margin, template.margin * 0.75)
+    c.endForm()
+    return c, template
+
+
+def _draw_report(c, template: PageTemplate, report_content: str):
+    """
+    Draw one report onto the canvas, continuing on new pages when it is longer than a page.
+
+    :param c: ReportLab canvas.
+    :param template: Page template.
+    :param report_content: Report text.
+    """
+    lines = report_content.split('\n')
+    for start in range(0, max(len(lines), 1), template.lines_per_page):
+        c.doForm('page_template')
+        textobject = c.beginText(template.margin, template.height - template.margin)
+        textobject.setFont(template.font, template.font_size, template.leading)
+        for line in lines[start:start + template.lines_per_page]:
             textobject.textLine(line)
         c.drawText(textobject)
         c.showPage()
-        c.save()
+
+
+def render_report_pdf(report_content: str, title: str = REPORT_TITLE) -> bytes:
+    """
+    Render a report to PDF bytes in memory (nothing is written to disk).
+
+    :param report_content: The content of the report as a string.
+    :param title: Document title.
+    :return: PDF bytes.
+    """
+    buffer = io.BytesIO()
+    c, template = _new_canvas(buffer, title)
+    _draw_report(c, template, report_content)
+    c.save()
+    return buffer.getvalue()
+
+
+def export_report_to_pdf(report_content: str, file_path: Union[str, IO[bytes]]):
+    """
+    Export the report content to a PDF file.
+
+    :param report_content: The content of the report as a string.
+    :param file_path: The path where the PDF will be saved, or a binary file-like object.
+    """
+    try:
+        pdf = render_report_pdf(report_content)
+        if isinstance(file_path, str):
+            with open(file_path, 'wb') as fh:
+                fh.write(pdf)
+        else:
+            file_path.write(pdf)
         logger.info(f"Report exported to PDF at {file_path}")
     except ImportError:
-        logger.error("ReportLab is not installed. Please install it using 'pip install reportlab'")
         raise
     except Exception as e:
         logger.error(f"Failed to export report to PDF: {e}")
         raise
+
+
+def export_reports_to_pdf(reports: Iterable[Tuple[str, str]], target: Union[str, IO[bytes]],
+                          title: str = REPORT_TITLE) -> int:
+    """
+    Export many reports into one multi-page PDF with an outline entry per report.
+
+    Reports are consumed lazily and drawn with the shared page template. ReportLab keeps the
+    compressed page streams (a few KB per text page) until the document is saved; use
+    export_reports_to_zip when memory must not grow with the number of reports.
+
+    :param reports: Iterable of (name, report text), e.g. from section_reports().
+    :param target: Output path or binary file-like object (e.g. a BytesIO or an HTTP response stream).
+    :param title: Document title.
+    :return: Number of reports written.
+    """
+    c, template = _new_canvas(target, title)
+    count = 0
+    for name, report_content in reports:
+        key = f"report_{count}"
+        c.bookmarkPage(key)
+        c.addOutlineEntry(str(name), key, level=0)
+        _draw_report(c, template, report_content)
+        count += 1
+    c.save()
+    logger.info(f"Exported {count} report(s) to one PDF.")
+    return count
+
+
+def export_reports_to_zip(reports: Iterable[Tuple[str, str]], target: Union[str, IO[bytes]]) -> int:
+    """
+    Export many reports as one PDF each inside a zip archive, streaming report by report.
+
+    Only one rendered report is held in memory at a time; target may be a path or any
+    writable binary stream.
+
+    :param reports: Iterable of (name, report text), e.g. from section_reports().
+    :param target: Output path or binary file-like object.
+    :return: Number of reports written.
+    """
+    count = 0
+    with zipfile.ZipFile(target, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, report_content in reports:
+            archive.writestr(f"{name}.pdf", render_report_pdf(report_content, title=f"{REPORT_TITLE} - {name}"))
+            count += 1
+    logger.info(f"Exported {count} report(s) to a zip archive.")
+    return count
+
+
+def section_reports(chunks: Iterable[Dict[str, Any]], id_column: str = 'section_id',
+                    result_keys: Sequence[str] = RESULT_KEYS) -> Iterator[Tuple[str, str]]:
+    """
+    Per-section (name, report text) pairs from chunks of result columns, e.g. network results.
+
+    :param chunks: Iterable of column mappings with the result columns and optionally id_column.
+    :param id_column: Column naming each section (rows are numbered when it is missing).
+    :param result_keys: Result columns listed in each report.
+    :return: Iterator of (name, report text).
+    """
+    row = 0
+    for columns in chunks:
+        n_rows = len(next(iter(columns.values()))) if columns else 0
+        names = columns.get(id_column)
+        lcc = columns.get('Lifecycle Cost', np.zeros(n_rows))
+        for i in range(n_rows):
+            results = {key: float(columns[key][i]) for key in result_keys if key in columns}
+            name = str(names[i]) if names is not None else f"section_{row + 1}"
+            yield name, generate_report(results, float(lcc[i]))
+            row += 1
+
+
+def export_reports(reports: Iterable[Tuple[str, str]], target: Union[str, IO[bytes]],
+                   archive: Optional[bool] = None) -> int:
+    """
+    Export many reports to a multi-page PDF or a zip archive.
+
+    :param reports: Iterable of (name, report text).
+    :param target: Output path or binary file-like object.
+    :param archive: Write a zip archive; defaults to True when target is a path ending in .zip.
+    :return: Number of reports written.
+    """
+    if archive is None:
+        archive = isinstance(target, str) and target.lower().endswith('.zip')
+    if archive:
+        return export_reports_to_zip(reports, target)
+    return export_reports_to_pdf(reports, target)
@@ -0,0 +1,398 @@
+# src/response.py
+
+import logging
+import os
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.models import Pavement, TrafficData, MaterialProperties, SubgradeProperties
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Reference load: one dual-tire half of an 80 kN single axle as a circular load.
+REFERENCE_AXLE_LOAD = 80.0  # kN
+TIRE_PRESSURE = 0.7  # MPa
+# Moduli (MPa) of unbound layers; asphalt and concrete moduli come from MaterialProperties.
+DEFAULT_LAYER_MODULI = {'Base': 300.0, 'Sub-base': 150.0}
+# Poisson's ratios of the pavement layers and the subgrade in the response table.
+TABLE_POISSON_RATIOS = (0.35, 0.45)
+# Odemark correction factor for transforming multi-layer systems to equivalent thickness.
+ODEMARK_FACTOR = 0.9
+# Asphalt Institute transfer functions (strains in mm/mm, asphalt modulus in psi).
+FATIGUE_COEFFICIENTS = (0.0796, 3.291, 0.854)
+RUTTING_COEFFICIENTS = (1.365e-9, 4.477)
+MPA_TO_PSI = 145.038
+
+# Grid of the normalized response table (thickness / load radius, top / bottom modulus ratio).
+TABLE_THICKNESS_RATIOS = np.geomspace(0.05, 40.0, 64)
+TABLE_MODULUS_RATIOS = np.geomspace(0.5, 5000.0, 48)
+
+
+def load_radius(axle_load: float = REFERENCE_AXLE_LOAD, tire_pressure: float = TIRE_PRESSURE) -> float:
+    """
+    Radius of the circular contact area of one half of an axle.
+
+    :param axle_load: Axle load in kN.
+    :param tire_pressure: Contact pressure in MPa.
+    :return: Radius in mm.
+    """
+    return float(np.sqrt(axle_load * 1000 / 2 / (np.pi * tire_pressure)))
+
+
+def concrete_modulus(concrete_strength: float) -> float:
+    """
+    Elastic modulus of concrete, E = 4700 * sqrt(f'c) (ACI 318).
+
+    :param concrete_strength: Compressive strength in MPa.
+    :return: Modulus in MPa.
+    """
+    return 4700.0 * float(np.sqrt(concrete_strength))
+
+
+def subgrade_elastic_modulus(subgrade_props: SubgradeProperties) -> float:
+    """
+    Resilient modulus of the subgrade from its CBR, E = 10 * CBR.
+
+    SubgradeProperties.modulus is a modulus of subgrade reaction (kPa/m), not an elastic modulus.
+
+    :param subgrade_props: Subgrade properties.
+    :return: Modulus in MPa.
+    """
+    return 10.0 * subgrade_props.CBR
+
+
+def layer_moduli(layer_types: Sequence[str], material_props: MaterialProperties,
+                 overrides: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """
+    Elastic modulus of each layer type.
+
+    :param layer_types: Type of each layer.
+    :param material_props: Material properties (asphalt modulus and concrete strength).
+    :param overrides: Optional moduli (MPa) replacing DEFAULT_LAYER_MODULI.
+    :return: Array of moduli in MPa.
+    """
+    moduli = dict(DEFAULT_LAYER_MODULI)
+    moduli['Asphalt'] = material_props.asphalt_modulus
+    moduli['Concrete'] = concrete_modulus(material_props.concrete_strength)
+    moduli.update(overrides or {})
+    unknown = [layer_type for layer_type in layer_types if layer_type not in moduli]
+    if unknown:
+        raise ValueError(f"No modulus for layer types: {sorted(set(unknown))}")
+    return np.array([moduli[layer_type] for layer_type in layer_types], dtype=float)
+
+
+def _bessel_j1(x: np.ndarray) -> np.ndarray:
+    """
+    Bessel function J1 from its integral form, (1 / pi) * integral of cos(t - x sin t) over [0, pi].
+
+    The integrand is smooth and periodic, so the trapezoid rule converges once the number
+    of points exceeds x.
+
+    :param x: Non-negative arguments.
+    :return: J1(x).
+    """
+    x = np.asarray(x, dtype=float)
+    n_points = int(x.max(initial=0.0)) + 64
+    t = np.linspace(0.0, np.pi, n_points + 1)
+    weights = np.full(t.size, 1.0)
+    weights[[0, -1]] = 0.5
+    result = np.empty(x.size)
+    flat = x.ravel()
+    for start in range(0, flat.size, 512):
+        chunk = flat[start:start + 512, None]
+        result[start:start + 512] = np.cos(t - chunk * np.sin(t)) @ weights / n_points
+    return result.reshape(x.shape)
+
+
+@lru_cache(maxsize=128)
+def _integration_nodes(min_depth: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Composite Gauss-Legendre nodes for the Hankel integrals of responses at min_depth or deeper.
+
+    :param min_depth: Smallest evaluation depth divided by the load radius.
+    :return: Tuple of (wavenumbers, weights already multiplied by J1).
+    """
+    upper = 30.0 / max(min_depth, 1e-3)
+    edges = np.arange(0.0, upper + np.pi / 2, np.pi / 2)
+    nodes, weights = np.polynomial.legendre.leggauss(8)
+    half = np.diff(edges)[:, None] / 2
+    m = (edges[:-1, None] + half * (nodes + 1)).ravel()
+    w = (half * weights).ravel()
+    return m, w * _bessel_j1(m)
+
+
+def _basis_rows(m: np.ndarray, depth: float, top: float, bottom: Optional[float]) -> np.ndarray:
+    """
+    Normalized derivatives g_k = f^(k) / m^k of the four Love-function basis terms of a layer.
+
+    The basis is exp(m s1), s1 exp(m s1), exp(-m s2), s2 exp(-m s2) with s1 = depth - bottom
+    and s2 = depth - top, which stay bounded inside the layer. A half-space (bottom None)
+    only has the two decaying terms.
+
+    :param m: Wavenumbers (normalized by the load radius), any shape.
+    :param depth: Evaluation depth.
+    :param top: Depth of the top of the layer.
+    :param bottom: Depth of the bottom of the layer, or None for the half-space.
+    :return: Array of shape m.shape + (4 derivatives, n terms).
+    """
+    s2 = depth - top
+    e2 = np.exp(-m * s2)
+    terms = []
+    if bottom is not None:
+        s1 = depth - bottom
+        e1 = np.exp(m * s1)
+        terms.append([e1] * 4)
+        terms.append([(s1 + k / m) * e1 for k in range(4)])
+    terms.append([(-1) ** k * e2 for k in range(4)])
+    terms.append([((-1) ** k * s2 + k * (-1) ** (k - 1) / m) * e2 for k in range(4)])
+    values = np.broadcast_arrays(*(value for term in terms for value in term))
+    return np.stack(values, axis=-1).reshape(values[0].shape + (len(terms), 4)).swapaxes(-1, -2)
+
+
+def _brackets(g: np.ndarray, modulus: np.ndarray, nu: float) -> Dict[str, np.ndarray]:
+    """
+    Hankel-space stresses and displacements (on the load axis) as rows over the basis terms.
+
+    Compressive stresses are negative. Common powers of m are dropped; they cancel in the
+    continuity conditions and are absorbed in the scaled unknowns.
+
+    :param g: Normalized basis derivatives from _basis_rows.
+    :param modulus: Layer modulus, broadcastable against g[..., 0, :].
+    :param nu: Poisson's ratio of the layer.
+    :return: Rows for 'sz', 'tau', 'w', 'u' and 'sr'.
+    """
+    g0, g1, g2, g3 = (g[..., k, :] for k in range(4))
+    return {
+        'sz': (1 - nu) * g3 - (2 - nu) * g1,
+        'tau': nu * g2 + (1 - nu) * g0,
+        'w': (1 + nu) / modulus * ((1 - 2 * nu) * g2 - 2 * (1 - nu) * g0),
+        'u': (1 + nu) / modulus * g1,
+        'sr': nu * (g3 - g1) + g1 / 2
+    }
+
+
+def layered_strains(thicknesses: np.ndarray, moduli: np.ndarray, poisson_ratios: Sequence[float],
+                    radius: float = 1.0) -> Dict[str, np.ndarray]:
+    """
+    Multi-layer (Burmister) elastic solution for a uniform circular load, fully bonded layers.
+
+    Solves the Love stress-function coefficients of every layer for each wavenumber and
+    integrates the Hankel transform numerically. Strains are under the load centre, per
+    unit contact pressure (multiply by the pressure in MPa for MPa moduli). This is the
+    exact but slow solver behind the cached response table.
+
+    :param thicknesses: Layer thicknesses above the subgrade, shape (systems, layers - 1).
+    :param moduli: Moduli of all layers including the subgrade, shape (systems, layers).
+    :param poisson_ratios: Poisson's ratio of each layer (shared by all systems).
+    :param radius: Load radius, in the same unit as thicknesses.
+    :return: 'tensile_strain' at the bottom of the top layer and 'compressive_strain' on top of the subgrade.
+    """
+    h = np.atleast_2d(np.asarray(thicknesses, dtype=float)) / radius
+    moduli = np.atleast_2d(np.asarray(moduli, dtype=float))
+    n_systems, n_layers = moduli.shape
+    if h.shape != (n_systems, n_layers - 1) or len(poisson_ratios) != n_layers:
+        raise ValueError("Need one thickness per layer above the subgrade and one modulus and Poisson's ratio per layer.")
+    if np.any(h <= 0):
+        raise ValueError("Layer thicknesses must be positive.")
+    depths = np.concatenate([np.zeros((n_systems, 1)), np.cumsum(h, axis=1)], axis=1)
+    n_unknowns = 4 * n_layers - 2
+    tensile = np.empty(n_systems)
+    compressive = np.empty(n_systems)
+    # Systems with the same top-layer thickness share wavenumbers and are solved together.
+    for top_thickness in np.unique(h[:, 0]):
+        group = np.flatnonzero(h[:, 0] == top_thickness)
+        m, weights = _integration_nodes(float(top_thickness))
+        m = m[None, :]
+        z = depths[group][:, None, :]
+        E = moduli[group][:, None, None, :]
+        matrix = np.zeros((group.size, m.shape[1], n_unknowns, n_unknowns))
+        rhs = np.zeros((group.size, m.shape[1], n_unknowns))
+        top = _brackets(_basis_rows(m, 0.0, 0.0, z[..., 1]), E[..., 0], poisson_ratios[0])
+        matrix[..., 0, :4] = top['sz']
+        matrix[..., 1, :4] = top['tau']
+        rhs[..., 0] = -1.0
+        row = 2
+        for i in range(n_layers - 1):
+            interface = z[..., i + 1]
+            above = _brackets(_basis_rows(m, interface, z[..., i], interface), E[..., i], poisson_ratios[i])
+            below_bottom = z[..., i + 2] if i + 2 < n_layers else None
+            below = _brackets(_basis_rows(m, interface, interface, below_bottom), E[..., i + 1], poisson_ratios[i + 1])
+            width = 4 if below_bottom is not None else 2
+            for key in ('sz', 'tau', 'w', 'u'):
+                matrix[..., row, 4 * i:4 * i + 4] = above[key]
+                matrix[..., row, 4 * i + 4:4 * i + 4 + width] = -below[key]
+                row += 1
+        coefficients = np.linalg.solve(matrix, rhs[..., None])[..., 0]
+
+        first = _brackets(_basis_rows(m, z[..., 1], 0.0, z[..., 1]), E[..., 0], poisson_ratios[0])
+        sz, sr = (np.sum(first[key] * coefficients[..., :4], axis=-1) for key in ('sz', 'sr'))
+        nu = poisson_ratios[0]
+        tensile[group] = ((1 - nu) * sr - nu * sz) @ weights / moduli[group, 0]
+
+        last = _brackets(_basis_rows(m, z[..., -1], z[..., -1], None), E[..., -1], poisson_ratios[-1])
+        sz, sr = (np.sum(last[key] * coefficients[..., -2:], axis=-1) for key in ('sz', 'sr'))
+        nu = poisson_ratios[-1]
+        compressive[group] = -((sz - 2 * nu * sr) @ weights) / moduli[group, -1]
+    return {'tensile_strain': tensile, 'compressive_strain': compressive}
+
+
+def _build_response_table(top_poisson: float, bottom_poisson: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Normalized two-layer responses over TABLE_THICKNESS_RATIOS x TABLE_MODULUS_RATIOS.
+
+    :param top_poisson: Poisson's ratio of the top layer.
+    :param bottom_poisson: Poisson's ratio of the bottom half-space.
+    :return: Tuple of (tensile strain * E_top, compressive strain * E_bottom) per unit pressure.
+    """
+    h, ratio = np.meshgrid(TABLE_THICKNESS_RATIOS, TABLE_MODULUS_RATIOS, indexing='ij')
+    moduli = np.column_stack([ratio.ravel(), np.ones(ratio.size)])
+    strains = layered_strains(h.reshape(-1, 1), moduli, (top_poisson, bottom_poisson))
+    tensile = (strains['tensile_strain'] * moduli[:, 0]).reshape(h.shape)
+    compressive = strains['compressive_strain'].reshape(h.shape)
+    return tensile, compressive
+
+
+@lru_cache(maxsize=8)
+def response_table(top_poisson: float = 0.35, bottom_poisson: float = 0.45) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cached normalized two-layer response table.
+
+    Built once per Poisson's ratio pair with layered_strains (a few seconds) and kept in
+    memory; when ME_PAVEMENT_CACHE_DIR is set it is also stored there as .npz.
+
+    :param top_poisson: Poisson's ratio of the top layer.
+    :param bottom_poisson: Poisson's ratio of the bottom half-space.
+    :return: Read-only (tensile, compressive) tables, see _build_response_table.
+    """
+    directory = os.environ.get('ME_PAVEMENT_CACHE_DIR')
+    path = None
+    if directory:
+        path = os.path.join(directory, f"response_table_{top_poisson:g}_{bottom_poisson:g}_"
+                                       f"{TABLE_THICKNESS_RATIOS.size}x{TABLE_MODULUS_RATIOS.size}.npz")
+        if os.path.exists(path):
+            with np.load(path) as stored:
+                tables = stored['tensile'], stored['compressive']
+            logger.info(f"Response table loaded from {path}")
+            for table in tables:
+                table.flags.writeable = False
+            return tables
+    tables = _build_response_table(top_poisson, bottom_poisson)
+    logger.info(f"Response table built for Poisson's ratios {top_poisson}/{bottom_poisson}.")
+    if path:
+        os.makedirs(directory, exist_ok=True)
+        np.savez(path, tensile=tables[0], compressive=tables[1])
+    for table in tables:
+        table.flags.writeable = False
+    return tables
+
+
+def _interpolate(table: np.ndarray, thickness_ratio: np.ndarray, modulus_ratio: np.ndarray) -> np.ndarray:
+    """
+    Bilinear interpolation of a response table in log-log coordinates, clamped to the grid.
+
+    :param table: Table over TABLE_THICKNESS_RATIOS x TABLE_MODULUS_RATIOS.
+    :param thickness_ratio: Thickness / load radius.
+    :param modulus_ratio: Top / bottom modulus.
+    :return: Interpolated values.
+    """
+    values = []
+    for grid, query in ((TABLE_THICKNESS_RATIOS, thickness_ratio), (TABLE_MODULUS_RATIOS, modulus_ratio)):
+        position = np.interp(np.log(query), np.log(grid), np.arange(grid.size, dtype=float))
+        index = np.minimum(position.astype(int), grid.size - 2)
+        values.append((index, position - index))
+    (i, fi), (j, fj) = values
+    return ((1 - fi) * (1 - fj) * table[i, j] + fi * (1 - fj) * table[i + 1, j]
+            + (1 - fi) * fj * table[i, j + 1] + fi * fj * table[i + 1, j + 1])
+
+
+def critical_strains(thicknesses: np.ndarray, moduli: np.ndarray, subgrade_modulus: Union[float, np.ndarray],
+                     radius: Optional[float] = None, tire_pressure: float = TIRE_PRESSURE,
+                     thin_layer_envelope: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Critical strains of many structures from the cached response table.
+
+    The tensile strain at the bottom of the top layer uses the two-layer solution of the
+    top layer over the first layer beneath it. The compressive strain on the subgrade uses
+    the two-layer solution of an Odemark equivalent thickness of the lowest layer's material
+    over the subgrade. Layers of zero thickness are skipped. Against the full multi-layer
+    solution (layered_strains) both are typically within 10% for asphalt / granular / subgrade
+    structures.
+
+    :param thicknesses: Layer thicknesses in mm, shape (structures, layers) or (layers,).
+    :param moduli: Layer moduli in MPa, shape (layers,) or (structures, layers).
+    :param subgrade_modulus: Subgrade modulus in MPa (scalar or one per structure).
+    :param radius: Load radius in mm (defaults to the reference load).
+    :param tire_pressure: Contact pressure in MPa.
+    :param thin_layer_envelope: Replace the tensile strain of a thin top layer by the largest strain
+                                of any thicker one. Below roughly half the load radius the strain
+                                grows with thickness; the envelope makes it non-increasing, as
+                                required by optimize_pavement_structure, and errs on the safe side.
+    :return: 'tensile_strain' and 'compressive_strain' (mm/mm) per structure.
+    """
+    radius = load_radius() if radius is None else radius
+    h = np.atleast_2d(np.asarray(thicknesses, dtype=float))
+    moduli = np.broadcast_to(np.asarray(moduli, dtype=float), h.shape)
+    tensile_table, compressive_table = response_table(*TABLE_POISSON_RATIOS)
+    if thin_layer_envelope:
+        tensile_table = np.maximum.accumulate(tensile_table[::-1], axis=0)[::-1]
+
+    subgrade_modulus = np.broadcast_to(np.asarray(subgrade_modulus, dtype=float), (len(h),))
+    below = subgrade_modulus
+    for j in range(h.shape[1] - 1, 0, -1):
+        below = np.where(h[:, j] > 0, moduli[:, j], below)
+    top = moduli[:, 0]
+    tensile = _interpolate(tensile_table, h[:, 0] / radius, top / below) * tire_pressure / top
+
+    lowest = moduli[:, 0]
+    for j in range(1, h.shape[1]):
+        lowest = np.where(h[:, j] > 0, moduli[:, j], lowest)
+    equivalent = ODEMARK_FACTOR * np.sum(h * np.cbrt(moduli / lowest[:, None]), axis=1)
+    compressive = (_interpolate(compressive_table, equivalent / radius, lowest / subgrade_modulus)
+                   * tire_pressure / subgrade_modulus)
+    return {'tensile_strain': tensile, 'compressive_strain': compressive}
+
+
+def pavement_strains(pavement: Pavement, layer_types: Sequence[str], material_props: MaterialProperties,
+                     subgrade_props: SubgradeProperties) -> Dict[str, float]:
+    """
+    Critical strains of one pavement under the reference axle load.
+
+    :param pavement: Pavement structure (layer thicknesses in mm, top to bottom).
+    :param layer_types: Type of each layer in pavement.layers.
+    :param material_props: Material properties.
+    :param subgrade_props: Subgrade properties.
+    :return: 'tensile_strain' and 'compressive_strain' (mm/mm).
+    """
+    if len(layer_types) != len(pavement.layers):
+        raise ValueError("Need one layer type per pavement layer.")
+    strains = critical_strains(np.asarray(pavement.layers, dtype=float), layer_moduli(layer_types, material_props),
+                               subgrade_elastic_modulus(subgrade_props))
+    return {key: float(values[0]) for key, values in strains.items()}
+
+
+def mechanistic_damage(strains: Dict[str, np.ndarray], top_modulus: np.ndarray,
+                       traffic_data: TrafficData) -> Dict[str, np.ndarray]:
+    """
+    Miner's damage of fatigue and subgrade rutting over the analysis period.
+
+    Strains scale linearly with the axle load, so the damage of the whole projected spectrum
+    is the reference-load damage times total_load_moment(exponent) / REFERENCE_AXLE_LOAD ** exponent.
+
+    :param strains: Reference-load strains from critical_strains.
+    :param top_modulus: Modulus of the top layer in MPa.
+    :param traffic_data: Traffic data.
+    :return: 'Fatigue Damage' and 'Rutting Damage' (1.0 = end of service life).
+    """
+    k1, k2, k3 = FATIGUE_COEFFICIENTS
+    r1, r2 = RUTTING_COEFFICIENTS
+    fatigue_repetitions = traffic_data.total_load_moment(k2) / REFERENCE_AXLE_LOAD ** k2
+    rutting_repetitions = traffic_data.total_load_moment(r2) / REFERENCE_AXLE_LOAD ** r2
+    tensile = np.maximum(strains['tensile_strain'], 0.0)  # A top layer in compression does not crack
+    fatigue = fatigue_repetitions * tensile ** k2 * (np.asarray(top_modulus) * MPA_TO_PSI) ** k3 / k1
+    rutting = rutting_repetitions * strains['compressive_strain'] ** r2 / r1
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Mechanistic damage: fatigue %s, rutting %s", fatigue, rutting)
+    return {'Fatigue Damage': fatigue, 'Rutting Damage': rutting}
@@ -0,0 +1,307 @@
+# src/sensitivity.py
+
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models import TrafficData, ClimateData, SubgradeProperties, MaterialProperties
+from src.parallel import iter_chunk_results
+from src.performance import batch_scenario
+from src.reliability import DISTRESS_KEYS
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Inputs varied by default. 'axle_loads' scales the whole load spectrum by one factor
+# (base 1.0); 'initial_cost' and 'discount_rate' are only available with LCCA inputs.
+SENSITIVITY_PARAMETERS = ('traffic_growth_rate', 'axle_loads', 'subgrade_modulus', 'asphalt_modulus', 'rainfall',
+                          'temperature_variation', 'thermal_coeff', 'discount_rate', 'initial_cost')
+LCCA_PARAMETERS = ('initial_cost', 'discount_rate')
+
+
+def _first_primes(count: int) -> List[int]:
+    """
+    The first count prime numbers.
+
+    :param count: Number of primes.
+    :return: List of primes in increasing order.
+    """
+    primes: List[int] = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % prime for prime in primes if prime * prime <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def halton_sequence(n_points: int, dimensions: int, skip: int = 0, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Points of the Halton low-discrepancy sequence in the unit hypercube.
+
+    Dimension k uses the radical inverse in the k-th prime base. The point at index 0
+    (the origin) is never returned, and consecutive calls with skip advanced by n_points
+    continue the same sequence, so large designs can be generated chunk by chunk. With a
+    seed, every dimension is shifted by one random offset modulo 1 (Cranley-Patterson
+    rotation), which keeps the low discrepancy while allowing replicate studies.
+
+    :param n_points: Number of points.
+    :param dimensions: Number of dimensions.
+    :param skip: Number of sequence points to skip.
+    :param seed: Optional seed of the random shift.
+    :return: Array of shape (n_points, dimensions) with values in [0, 1).
+    """
+    if n_points < 0 or dimensions < 1 or skip < 0:
+        raise ValueError("n_points and skip must be non-negative and dimensions positive.")
+    points = np.empty((n_points, dimensions))
+    for axis, base in enumerate(_first_primes(dimensions)):
+        index = np.arange(skip + 1, skip + n_points + 1, dtype=np.int64)
+        scale = 1.0
+        values = np.zeros(n_points)
+        while index.any():
+            scale /= base
+            index, digit = np.divmod(index, base)
+            values += scale * digit
+        points[:, axis] = values
+    if seed is not None:
+        points = (points + np.random.default_rng(seed).random(dimensions)) % 1.0
+    return points
+
+
+def _base_values(traffic_data: TrafficData, climate_data: ClimateData, subgrade_props: SubgradeProperties,
+                 material_props: MaterialProperties, lcca_inputs: Optional[Dict]) -> Dict[str, float]:
+    """
+    Deterministic scenario columns of the design, as used by design_new_pavement_batch.
+
+    :param traffic_data: Traffic data.
+    :param climate_data: Climate data.
+    :param subgrade_props: Subgrade properties.
+    :param material_props: Material properties.
+    :param lcca_inputs: Optional initial_cost, discount_rate (decimal) and lcca_period.
+    :return: Mapping of batch column name to value.
+    """
+    base = batch_scenario(traffic_data, climate_data, subgrade_props, material_props, spectrum_moments=True)
+    if lcca_inputs:
+        base['initial_cost'] = lcca_inputs['initial_cost']
+        base['discount_rate'] = lcca_inputs['discount_rate']
+        base['lcca_period'] = lcca_inputs.get('lcca_period', traffic_data.analysis_period)
+    return {key: float(value) for key, value in base.items()}
+
+
+def parameter_ranges(base: Dict[str, float], parameters: Optional[Sequence[str]] = None,
+                     relative_range: float = 0.2,
+                     ranges: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict[str, Tuple[float, float]]:
+    """
+    Low and high value of every varied input.
+
+    :param base: Base scenario columns (see _base_values).
+    :param parameters: Inputs to vary (defaults to SENSITIVITY_PARAMETERS available in base).
+    :param relative_range: Default range as a fraction of the base value (0.2 gives base +/- 20 %).
+    :param ranges: Explicit (low, high) overrides per input.
+    :return: Mapping of input name to (low, high).
+    """
+    if not 0 < relative_range < 1:
+        raise ValueError("relative_range must be between 0 and 1.")
+    if parameters is None:
+        parameters = [name for name in SENSITIVITY_PARAMETERS if name not in LCCA_PARAMETERS or name in base]
+    unavailable = [name for name in parameters if name not in SENSITIVITY_PARAMETERS
+                   or (name in LCCA_PARAMETERS and name not in base)]
+    if unavailable:
+        logger.error(f"Cannot vary inputs: {unavailable}")
+        raise ValueError(f"Unknown or unavailable sensitivity inputs {unavailable}. Choose from "
+                         f"{list(SENSITIVITY_PARAMETERS)}; LCCA inputs require lcca_inputs.")
+    if not parameters:
+        raise ValueError("At least one input must be varied.")
+    result = {}
+    for name in parameters:
+        if ranges and name in ranges:
+            low, high = (float(value) for value in ranges[name])
+        else:
+            value = 1.0 if name == 'axle_loads' else base[name]
+            low, high = sorted((value * (1 - relative_range), value * (1 + relative_range)))
+        if low > high:
+            raise ValueError(f"Invalid range for {name}: low {low} is above high {high}.")
+        if low == high:
+            logger.warning(f"The range of {name} is empty; its sensitivity will be zero.")
+        result[name] = (low, high)
+    return result
+
+
+def _scenario_columns(base: Dict[str, float], samples: Dict[str, np.ndarray], size: int) -> Dict[str, np.ndarray]:
+    """
+    Scenario columns with the sampled inputs replacing their base values.
+
+    :param base: Base scenario columns.
+    :param samples: Sampled values per varied input.
+    :param size: Number of scenarios.
+    :return: Mapping of batch column name to array.
+    """
+    columns = {key: np.full(size, value) for key, value in base.items()}
+    for name, values in samples.items():
+        if name == 'axle_loads':
+            columns['axle_load_sum'] = base['axle_load_sum'] * values
+            columns['axle_load_cube_sum'] = base['axle_load_cube_sum'] * values ** 3
+        else:
+            columns[name] = values
+    return columns
+
+
+def _outputs(base: Dict[str, float]) -> Tuple[str, ...]:
+    """
+    Results produced for scenarios built from base.
+    """
+    return DISTRESS_KEYS + (('Lifecycle Cost',) if 'initial_cost' in base else ())
+
+
+def run_oat_sensitivity(traffic_data: TrafficData, climate_data: ClimateData, subgrade_props: SubgradeProperties,
+                        material_props: MaterialProperties, lcca_inputs: Optional[Dict] = None,
+                        parameters: Optional[Sequence[str]] = None, relative_range: float = 0.2,
+                        ranges: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict:
+    """
+    One-at-a-time sensitivity (tornado chart data) of the distresses and lifecycle cost.
+
+    Every input is moved to its low and high value with all others at their base value.
+    The base scenario and all 2 x inputs variations are evaluated in one vectorized call
+    of design_new_pavement_batch (and calculate_LCCA_batch, the vectorized perform_LCCA).
+
+    :param traffic_data: Traffic data (base values).
+    :param climate_data: Climate data (base values).
+    :param subgrade_props: Subgrade properties (base values).
+    :param material_props: Material properties (base values).
+    :param lcca_inputs: Optional initial_cost, maintenance_costs, discount_rate (decimal) and lcca_period;
+                        adds 'Lifecycle Cost' to the outputs.
+    :param parameters: Inputs to vary (see SENSITIVITY_PARAMETERS).
+    :param relative_range: Default range as a fraction of each base value.
+    :param ranges: Explicit (low, high) overrides per input.
+    :return: Dictionary with 'base' (output values of the base scenario), 'tornado' (per output, rows
+             with Parameter, Low, High, Output at Low, Output at High and Swing, largest swing first),
+             'evaluations' and 'elapsed'.
+    """
+    start = time.perf_counter()
+    base = _base_values(traffic_data, climate_data, subgrade_props, material_props, lcca_inputs)
+    bounds = parameter_ranges(base, parameters, relative_range, ranges)
+    names = list(bounds)
+    size = 2 * len(names) + 1
+    samples = {}
+    for position, name in enumerate(names):
+        values = np.full(size, 1.0 if name == 'axle_loads' else base[name])
+        values[2 * position + 1:2 * position + 3] = bounds[name]
+        samples[name] = values
+    maintenance_costs = (lcca_inputs or {}).get('maintenance_costs', {})
+    results = next(iter_chunk_results([_scenario_columns(base, samples, size)], None, maintenance_costs, 1))
+
+    tornado = {}
+    for output in _outputs(base):
+        values = results[output]
+        rows = [{'Parameter': name, 'Low': bounds[name][0], 'High': bounds[name][1],
+                 'Output at Low': float(values[2 * position + 1]), 'Output at High': float(values[2 * position + 2]),
+                 'Swing': float(abs(values[2 * position + 2] - values[2 * position + 1]))}
+                for position, name in enumerate(names)]
+        tornado[output] = sorted(rows, key=lambda row: row['Swing'], reverse=True)
+    elapsed = time.perf_counter() - start
+    logger.info(f"One-at-a-time sensitivity of {len(names)} input(s): {size} evaluations in {elapsed * 1000:.1f} ms.")
+    return {
+        'base': {output: float(results[output][0]) for output in _outputs(base)},
+        'tornado': tornado,
+        'evaluations': size,
+        'elapsed': elapsed
+    }
+
+
+def run_sobol_analysis(traffic_data: TrafficData, climate_data: ClimateData, subgrade_props: SubgradeProperties,
+                       material_props: MaterialProperties, lcca_inputs: Optional[Dict] = None,
+                       parameters: Optional[Sequence[str]] = None, relative_range: float = 0.2,
+                       ranges: Optional[Dict[str, Tuple[float, float]]] = None, n_samples: int = 4096,
+                       chunk_size: int = 100000, seed: Optional[int] = None, max_workers: Optional[int] = 1,
+                       progress: Optional[Callable[[float, str], None]] = None) -> Dict:
+    """
+    Variance-based (Sobol) sensitivity indices of the distresses and lifecycle cost.
+
+    Inputs are uniform over their ranges. Two quasi-random sample matrices A and B are
+    taken from one Halton sequence of twice the input dimension, and for every input i the
+    matrix AB_i (A with column i from B) is added, giving n_samples x (inputs + 2) model
+    evaluations (Saltelli design). First-order indices use the Saltelli (2010) estimator and
+    total-order indices the Jansen estimator. Sample matrices are generated and evaluated
+    chunk by chunk through iter_chunk_results, so memory holds only the output vectors.
+
+    :param traffic_data: Traffic data (base values).
+    :param climate_data: Climate data (base values).
+    :param subgrade_props: Subgrade properties (base values).
+    :param material_props: Material properties (base values).
+    :param lcca_inputs: Optional initial_cost, maintenance_costs, discount_rate (decimal) and lcca_period;
+                        adds 'Lifecycle Cost' to the outputs.
+    :param parameters: Inputs to vary (see SENSITIVITY_PARAMETERS).
+    :param relative_range: Default range as a fraction of each base value.
+    :param ranges: Explicit (low, high) overrides per input.
+    :param n_samples: Rows of each sample matrix (a power of two balances the Halton strata well).
+    :param chunk_size: Rows per evaluated chunk.
+    :param seed: Optional seed of the random shift of the Halton sequence.
+    :param max_workers: Number of worker processes (None uses the CPU count).
+    :param progress: Optional callback(fraction, message).
+    :return: Dictionary with 'first_order' and 'total_order' (per output, index per input), 'variance'
+             (per output), 'ranges', 'evaluations' and 'elapsed'.
+    """
+    if n_samples < 2 or chunk_size < 1:
+        raise ValueError("n_samples must be at least 2 and chunk_size a positive integer.")
+    start = time.perf_counter()
+    base = _base_values(traffic_data, climate_data, subgrade_props, material_props, lcca_inputs)
+    bounds = parameter_ranges(base, parameters, relative_range, ranges)
+    names = list(bounds)
+    n_inputs = len(names)
+    low = np.array([bounds[name][0] for name in names])
+    width = np.array([bounds[name][1] for name in names]) - low
+    outputs = _outputs(base)
+    n_blocks = n_inputs + 2
+    # Row r of block 0 is A, of block 1 is B and of block 2 + i is AB_i.
+    values = {output: np.empty((n_blocks, n_samples)) for output in outputs}
+    blocks: List[Tuple[int, int, int]] = []
+
+    def chunks() -> Iterator[Dict[str, np.ndarray]]:
+        for first in range(0, n_samples, chunk_size):
+            size = min(chunk_size, n_samples - first)
+            points = low + halton_sequence(size, 2 * n_inputs, skip=first, seed=seed).reshape(
+                size, 2, n_inputs) * width
+            a, b = points[:, 0], points[:, 1]
+            for block in range(n_blocks):
+                if block < 2:
+                    matrix = (a, b)[block]
+                else:
+                    matrix = a.copy()
+                    matrix[:, block - 2] = b[:, block - 2]
+                blocks.append((block, first, size))
+                yield _scenario_columns(base, {name: matrix[:, axis] for axis, name in enumerate(names)}, size)
+
+    maintenance_costs = (lcca_inputs or {}).get('maintenance_costs', {})
+    n_chunks = -(-n_samples // chunk_size) * n_blocks
+    for done, results in enumerate(iter_chunk_results(chunks(), None, maintenance_costs, max_workers), start=1):
+        block, first, size = blocks[done - 1]
+        for output in outputs:
+            values[output][block, first:first + size] = results[output]
+        if progress is not None:
+            progress(done / n_chunks, f"Evaluated {done} of {n_chunks} sample chunk(s)")
+
+    first_order, total_order, variance = {}, {}, {}
+    for output in outputs:
+        f_a, f_b, f_ab = values[output][0], values[output][1], values[output][2:]
+        total_variance = float(np.var(np.concatenate([f_a, f_b])))
+        variance[output] = total_variance
+        if total_variance > 0:
+            first = np.mean(f_b * (f_ab - f_a), axis=1) / total_variance
+            total = 0.5 * np.mean((f_a - f_ab) ** 2, axis=1) / total_variance
+        else:
+            first = total = np.zeros(n_inputs)
+        first_order[output] = {name: float(first[axis]) for axis, name in enumerate(names)}
+        total_order[output] = {name: float(total[axis]) for axis, name in enumerate(names)}
+
+    evaluations = n_samples * n_blocks
+    elapsed = time.perf_counter() - start
+    logger.info(f"Sobol analysis of {n_inputs} input(s): {evaluations} evaluations in {elapsed:.2f} s.")
+    return {
+        'first_order': first_order,
+        'total_order': total_order,
+        'variance': variance,
+        'ranges': bounds,
+        'evaluations': evaluations,
+        'elapsed': elapsed
+    }
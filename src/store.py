@@ -0,0 +1,389 @@
+# src/store.py
+
+import datetime
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models import TrafficRecord, ClimateRecord, SubgradeRecord, MaterialRecord, PavementRecord
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_STORE_PATH = os.environ.get('ME_PAVEMENT_STORE', 'me_pavement_design.db')
+# Result entries stored as indexed-filterable REAL columns; everything else goes into the details JSON.
+RESULT_COLUMNS = {
+    'Fatigue Cracking': 'fatigue_cracking',
+    'Rutting': 'rutting',
+    'Thermal Cracking': 'thermal_cracking',
+    'Lifecycle Cost': 'lifecycle_cost'
+}
+# Record class used to store (and restore) each model group of the inputs.
+INPUT_RECORDS = {
+    'traffic': TrafficRecord,
+    'climate': ClimateRecord,
+    'subgrade': SubgradeRecord,
+    'material': MaterialRecord,
+    'pavement': PavementRecord
+}
+SUMMARY_COLUMNS = ('id', 'project', 'section', 'run_date', 'name') + tuple(RESULT_COLUMNS.values())
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenarios (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL,
+    section TEXT NOT NULL DEFAULT '',
+    run_date TEXT NOT NULL,
+    name TEXT,
+    inputs TEXT,
+    design TEXT,
+    fatigue_cracking REAL,
+    rutting REAL,
+    thermal_cracking REAL,
+    lifecycle_cost REAL,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_scenarios_project_section_date ON scenarios (project, section, run_date);
+CREATE INDEX IF NOT EXISTS idx_scenarios_section ON scenarios (section);
+CREATE INDEX IF NOT EXISTS idx_scenarios_run_date ON scenarios (run_date);
+"""
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    JSON encoder fallback for NumPy values, records and model objects.
+
+    :param obj: Object the json module cannot encode.
+    :return: Encodable equivalent.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if is_dataclass(obj):
+        return asdict(obj)
+    if hasattr(obj, '__dict__'):
+        return {k: v for k, v in vars(obj).items() if not k.startswith('_')}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(value: Any) -> Optional[str]:
+    """
+    Encode a value as JSON, keeping None as SQL NULL.
+
+    :param value: Value to encode.
+    :return: JSON text or None.
+    """
+    return None if value is None else json.dumps(value, default=_json_default)
+
+
+def _encode_inputs(inputs: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Encode scenario inputs, storing model objects of known groups as their record fields.
+
+    :param inputs: Mapping such as {'traffic': TrafficData, 'discount_rate': 0.03}.
+    :return: JSON text or None.
+    """
+    if inputs is None:
+        return None
+    encoded = {}
+    for key, value in inputs.items():
+        record_class = INPUT_RECORDS.get(key)
+        if record_class is not None and value is not None and not isinstance(value, (dict, record_class)):
+            value = record_class.from_model(value)
+        encoded[key] = value
+    return _dumps(encoded)
+
+
+def _as_date(value: Optional[Any]) -> str:
+    """
+    ISO timestamp for a run date given as a date, datetime, string or None (now).
+
+    :param value: Run date.
+    :return: ISO 8601 string, which sorts chronologically.
+    """
+    if value is None:
+        return datetime.datetime.now().isoformat(timespec='seconds')
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def restore_models(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuild the model objects of stored scenario inputs.
+
+    :param inputs: Decoded 'inputs' of a stored scenario.
+    :return: Same mapping with the known groups converted back to model instances.
+    """
+    restored = dict(inputs)
+    for key, record_class in INPUT_RECORDS.items():
+        if isinstance(restored.get(key), dict):
+            restored[key] = record_class(**restored[key]).to_model()
+    return restored
+
+
+class ProjectStore:
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        """
+        Persistent SQLite store of scenario inputs, designs and results.
+
+        Scenarios are indexed by project, section and run date, and the headline results
+        are plain columns, so filtering, counting and paging are done by SQLite without
+        loading the stored scenarios into memory. Inputs, designs and any further result
+        entries (e.g. the LCC curve) are kept as JSON.
+
+        :param path: Database file (':memory:' for a temporary store).
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path)) if path != ':memory:' else None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Streamlit reruns the script on different threads; access is serialized by the lock.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            if path != ':memory:':
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+        logger.info(f"Project store opened: {path}")
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> 'ProjectStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def save_scenario(self, project: str, section: str = '', inputs: Optional[Dict[str, Any]] = None,
+                      design: Optional[Any] = None, results: Optional[Dict[str, Any]] = None,
+                      name: Optional[str] = None, run_date: Optional[Any] = None) -> int:
+        """
+        Store one scenario.
+
+        :param project: Project name.
+        :param section: Section identifier within the project.
+        :param inputs: Inputs; 'traffic', 'climate', 'subgrade', 'material' and 'pavement' may be model objects.
+        :param design: Pavement design, e.g. a list of (layer type, thickness) pairs.
+        :param results: Results; the entries of RESULT_COLUMNS become filterable columns.
+        :param name: Optional scenario name.
+        :param run_date: Run date (defaults to now).
+        :return: ID of the stored scenario.
+        """
+        results = dict(results or {})
+        values = [results.pop(key, None) for key in RESULT_COLUMNS]
+        row = (project, section, _as_date(run_date), name, _encode_inputs(inputs), _dumps(design),
+               *(None if value is None else float(value) for value in values), _dumps(results or None))
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO scenarios (project, section, run_date, name, inputs, design, "
+                f"{', '.join(RESULT_COLUMNS.values())}, details) VALUES ({', '.join('?' * len(row))})", row)
+        logger.info(f"Stored scenario {cursor.lastrowid} for project '{project}', section '{section}'.")
+        return cursor.lastrowid
+
+    def bulk_insert(self, columns: Dict[str, Any], project: str = 'default', section: str = '',
+                    run_date: Optional[Any] = None, batch_size: int = 10000) -> int:
+        """
+        Store the rows of a columnar batch run in one transaction.
+
+        Columns named 'project', 'section', 'run_date' or 'name' override the arguments per
+        row, the RESULT_COLUMNS entries become result columns and every other column is
+        stored in the row's inputs.
+
+        :param columns: Mapping of column name to equal-length arrays (e.g. the CLI sweep output).
+        :param project: Project of rows without a 'project' column.
+        :param section: Section of rows without a 'section' column.
+        :param run_date: Run date of rows without a 'run_date' column (defaults to now).
+        :param batch_size: Rows passed to SQLite per executemany call.
+        :return: Number of rows inserted.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        columns = {name: np.asarray(values) for name, values in columns.items()}
+        n_rows = len(next(iter(columns.values()))) if columns else 0
+        if any(len(values) != n_rows for values in columns.values()):
+            logger.error("Bulk insert columns have different lengths.")
+            raise ValueError("All columns must have the same length.")
+        meta = {'project': project, 'section': section, 'run_date': _as_date(run_date), 'name': None}
+        meta_columns = [columns[key].tolist() if key in columns else [value] * n_rows for key, value in meta.items()]
+        meta_columns[2] = [_as_date(value) for value in meta_columns[2]]
+        result_columns = [columns[key].astype(float).tolist() if key in columns else [None] * n_rows
+                          for key in RESULT_COLUMNS]
+        input_names = [name for name in columns if name not in meta and name not in RESULT_COLUMNS]
+        input_columns = [columns[name].tolist() for name in input_names]
+
+        sql = ("INSERT INTO scenarios (project, section, run_date, name, inputs, "
+               f"{', '.join(RESULT_COLUMNS.values())}) VALUES ({', '.join('?' * (5 + len(RESULT_COLUMNS)))})")
+        with self._lock, self._connection:
+            for start in range(0, n_rows, batch_size):
+                stop = min(start + batch_size, n_rows)
+                rows = (
+                    (*(column[i] for column in meta_columns),
+                     json.dumps({name: column[i] for name, column in zip(input_names, input_columns)}),
+                     *(column[i] for column in result_columns))
+                    for i in range(start, stop)
+                )
+                self._connection.executemany(sql, rows)
+        logger.info(f"Bulk-inserted {n_rows} scenario(s) into {self.path}.")
+        return n_rows
+
+    @staticmethod
+    def _where(project: Optional[str] = None, section: Optional[str] = None, date_from: Optional[Any] = None,
+               date_to: Optional[Any] = None,
+               result_ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None
+               ) -> Tuple[str, List[Any]]:
+        """
+        SQL filter clause and parameters shared by the query methods.
+
+        :return: Tuple of (WHERE clause or '', parameters).
+        """
+        clauses, params = [], []
+        if project is not None:
+            clauses.append("project = ?")
+            params.append(project)
+        if section is not None:
+            clauses.append("section = ?")
+            params.append(section)
+        if date_from is not None:
+            clauses.append("run_date >= ?")
+            params.append(_as_date(date_from))
+        if date_to is not None:
+            clauses.append("run_date < ?")
+            params.append(_as_date(date_to))
+        for key, (low, high) in (result_ranges or {}).items():
+            if key not in RESULT_COLUMNS:
+                logger.error(f"Unknown result filter '{key}'.")
+                raise ValueError(f"Unknown result filter '{key}'. Choose from {list(RESULT_COLUMNS)}.")
+            if low is not None:
+                clauses.append(f"{RESULT_COLUMNS[key]} >= ?")
+                params.append(float(low))
+            if high is not None:
+                clauses.append(f"{RESULT_COLUMNS[key]} <= ?")
+                params.append(float(high))
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def count(self, **filters: Any) -> int:
+        """
+        Number of stored scenarios matching the filters.
+
+        :param filters: project, section, date_from (inclusive), date_to (exclusive) and
+                        result_ranges ({result name: (min, max)}, either bound may be None).
+        :return: Scenario count.
+        """
+        where, params = self._where(**filters)
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM scenarios{where}", params).fetchone()[0]
+
+    def query(self, limit: int = 100, offset: int = 0, descending: bool = True,
+              **filters: Any) -> List[Dict[str, Any]]:
+        """
+        One page of scenario summaries (IDs, keys and headline results; no inputs).
+
+        :param limit: Page size.
+        :param offset: Number of matching scenarios to skip.
+        :param descending: Newest scenarios first.
+        :param filters: See count().
+        :return: List of summary dictionaries.
+        """
+        where, params = self._where(**filters)
+        order = "DESC" if descending else "ASC"
+        sql = (f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM scenarios{where} "
+               f"ORDER BY run_date {order}, id {order} LIMIT ? OFFSET ?")
+        with self._lock:
+            rows = self._connection.execute(sql, params + [int(limit), int(offset)]).fetchall()
+        return [dict(row) for row in rows]
+
+    def iter_scenarios(self, page_size: int = 1000, include_inputs: bool = False,
+                       **filters: Any) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream matching scenarios page by page in ID order.
+
+        Pages are fetched by keyset (id > last id), so the cost per page does not grow with
+        the position in the table and only one page is held in memory.
+
+        :param page_size: Scenarios per page.
+        :param include_inputs: Also decode the stored inputs of each scenario.
+        :param filters: See count().
+        :return: Iterator of pages (lists of dictionaries).
+        """
+        where, params = self._where(**filters)
+        columns = SUMMARY_COLUMNS + (('inputs',) if include_inputs else ())
+        sql = (f"SELECT {', '.join(columns)} FROM scenarios{where}{' AND' if where else ' WHERE'} id > ? "
+               f"ORDER BY id LIMIT ?")
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._connection.execute(sql, params + [last_id, int(page_size)]).fetchall()
+            if not rows:
+                return
+            page = [dict(row) for row in rows]
+            if include_inputs:
+                for scenario in page:
+                    scenario['inputs'] = json.loads(scenario['inputs']) if scenario['inputs'] else {}
+            last_id = page[-1]['id']
+            yield page
+
+    def get(self, scenario_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Full stored scenario with decoded inputs, design and results.
+
+        :param scenario_id: Scenario ID.
+        :return: Dictionary with 'inputs', 'design' and 'results', or None if not found.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT * FROM scenarios WHERE id = ?", (int(scenario_id),)).fetchone()
+        if row is None:
+            return None
+        scenario = {key: row[key] for key in ('id', 'project', 'section', 'run_date', 'name')}
+        scenario['inputs'] = json.loads(row['inputs']) if row['inputs'] else {}
+        scenario['design'] = json.loads(row['design']) if row['design'] else None
+        results = {key: row[column] for key, column in RESULT_COLUMNS.items() if row[column] is not None}
+        results.update(json.loads(row['details']) if row['details'] else {})
+        scenario['results'] = results
+        return scenario
+
+    def projects(self) -> List[str]:
+        """
+        Names of the stored projects.
+
+        :return: Sorted project names.
+        """
+        with self._lock:
+            return [row[0] for row in self._connection.execute("SELECT DISTINCT project FROM scenarios ORDER BY project")]
+
+    def sections(self, project: str) -> List[str]:
+        """
+        Section identifiers stored for a project.
+
+        :param project: Project name.
+        :return: Sorted section identifiers.
+        """
+        with self._lock:
+            return [row[0] for row in self._connection.execute(
+                "SELECT DISTINCT section FROM scenarios WHERE project = ? ORDER BY section", (project,))]
+
+    def delete(self, scenario_ids: Sequence[int]) -> int:
+        """
+        Delete scenarios by ID.
+
+        :param scenario_ids: IDs to delete.
+        :return: Number of deleted scenarios.
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.executemany("DELETE FROM scenarios WHERE id = ?",
+                                                  [(int(i),) for i in scenario_ids])
+        logger.info(f"Deleted {cursor.rowcount} scenario(s) from {self.path}.")
+        return cursor.rowcount
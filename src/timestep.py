@@ -0,0 +1,166 @@
+# src/timestep.py
+
+import logging
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.models import Pavement, TrafficData, ClimateData, SubgradeProperties, MaterialProperties
+from src.response import (FATIGUE_COEFFICIENTS, RUTTING_COEFFICIENTS, MPA_TO_PSI, REFERENCE_AXLE_LOAD,
+                          critical_strains, layer_moduli, subgrade_elastic_modulus)
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Drop of log10(asphalt modulus) per °C above the reference (average) temperature.
+ASPHALT_TEMPERATURE_SENSITIVITY = 0.02
+# Subgrade modulus factor exp(-s * (w - 1)), w = step rainfall relative to the mean step rainfall.
+SUBGRADE_MOISTURE_SENSITIVITY = 0.3
+# Relative wetness is capped so a single storm step cannot soften the subgrade without bound.
+MAX_RELATIVE_WETNESS = 3.0
+
+
+def climate_series(climate_data: ClimateData) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Per-step temperature and rainfall of a climate, synthesizing one year if it has no series.
+
+    Without a series, a monthly year is built with a sinusoidal temperature of the given
+    average and variation (peak to peak) and the annual rainfall spread evenly.
+
+    :param climate_data: Climate data.
+    :return: Tuple of (temperatures in °C, rainfall in mm, steps per year).
+    """
+    steps_per_year = getattr(climate_data, 'steps_per_year', 12)
+    temperatures = getattr(climate_data, 'temperature_series', None)
+    rainfall = getattr(climate_data, 'rainfall_series', None)
+    if temperatures is None and rainfall is None:
+        steps_per_year = 12
+    if temperatures is not None and rainfall is not None and len(temperatures) != len(rainfall):
+        logger.error(f"Climate series lengths differ: {len(temperatures)} temperatures, {len(rainfall)} rainfall")
+        raise ValueError(f"temperature_series and rainfall_series must have the same length, "
+                         f"got {len(temperatures)} and {len(rainfall)}.")
+    n_steps = len(temperatures) if temperatures is not None else len(rainfall) if rainfall is not None else steps_per_year
+    if temperatures is None:
+        phase = 2 * np.pi * (np.arange(n_steps) + 0.5) / steps_per_year
+        temperatures = climate_data.average_temperature + climate_data.temperature_variation / 2 * np.sin(phase)
+    if rainfall is None:
+        rainfall = np.full(n_steps, climate_data.rainfall / steps_per_year)
+    return np.asarray(temperatures, dtype=float), np.asarray(rainfall, dtype=float), steps_per_year
+
+
+def modulus_factors(temperatures: np.ndarray, rainfall: np.ndarray, reference_temperature: float,
+                    mean_rainfall: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stiffness multipliers of the asphalt (temperature) and subgrade (moisture) for each step.
+
+    :param temperatures: Step temperatures in °C.
+    :param rainfall: Step rainfall in mm.
+    :param reference_temperature: Temperature at which the given asphalt modulus applies.
+    :param mean_rainfall: Mean step rainfall at which the given subgrade modulus applies.
+    :return: Tuple of (asphalt factors, subgrade factors).
+    """
+    asphalt = 10.0 ** (-ASPHALT_TEMPERATURE_SENSITIVITY * (temperatures - reference_temperature))
+    wetness = np.minimum(rainfall / mean_rainfall, MAX_RELATIVE_WETNESS) if mean_rainfall > 0 \
+        else np.ones_like(rainfall)
+    subgrade = np.exp(-SUBGRADE_MOISTURE_SENSITIVITY * (wetness - 1))
+    return asphalt, subgrade
+
+
+def simulate_time_steps(traffic_data: TrafficData, climate_data: ClimateData, subgrade_props: SubgradeProperties,
+                        material_props: MaterialProperties, pavement: Optional[Pavement] = None,
+                        layer_types: Optional[Sequence[str]] = None, chunk_size: int = 100000,
+                        return_steps: bool = False) -> Dict[str, Union[float, np.ndarray]]:
+    """
+    Time-stepped damage accumulation with per-step climate modulation.
+
+    The analysis period is split into steps_per_year steps per year; a climate series
+    shorter than the period is repeated. In every step the asphalt modulus follows the
+    temperature and the subgrade modulus the rainfall (see modulus_factors), and each
+    step adds 1 / steps_per_year of its year's traffic. Because every load bin sees the
+    same stiffness in a step, the (steps x load bins) damage sum factorizes into the
+    spectrum moments times a per-step stiffness term, so the work is linear in steps and
+    is done in chunks of chunk_size steps.
+
+    With a constant climate equal to the annual values the totals equal compute_distress_arrays.
+    Thermal cracking is thermal_coeff times the mean annual temperature range of the steps.
+    When pavement and layer_types are given, Miner's damage of the layered-elastic model
+    (src.response) is accumulated per step as well.
+
+    :param traffic_data: Traffic data.
+    :param climate_data: Climate data, optionally with temperature and rainfall series.
+    :param subgrade_props: Subgrade properties.
+    :param material_props: Material properties.
+    :param pavement: Optional pavement structure for mechanistic damage.
+    :param layer_types: Type of each layer of pavement (required with pavement).
+    :param chunk_size: Number of steps evaluated per vectorized chunk.
+    :param return_steps: Also return the per-step increments (memory grows with the number of steps).
+    :return: Totals and per-year arrays of 'Fatigue Cracking' and 'Rutting', 'Thermal Cracking',
+             and 'Fatigue Damage' / 'Rutting Damage' for mechanistic runs.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    if pavement is not None and (layer_types is None or len(layer_types) != len(pavement.layers)):
+        raise ValueError("Need one layer type per pavement layer for mechanistic damage.")
+    temperatures, rainfall, steps_per_year = climate_series(climate_data)
+    n_years = int(traffic_data.analysis_period)
+    n_steps = n_years * steps_per_year
+    growth = traffic_data.growth_factors()
+    mean_rainfall = float(rainfall.mean()) if rainfall.size else 0.0
+    fatigue_moment = traffic_data.load_moment(3) / steps_per_year
+    rutting_moment = traffic_data.load_moment(1) / steps_per_year
+
+    mechanistic = pavement is not None
+    if mechanistic:
+        thicknesses = np.asarray(pavement.layers, dtype=float)
+        moduli = layer_moduli(layer_types, material_props)
+        temperature_sensitive = np.array([layer_type == 'Asphalt' for layer_type in layer_types])
+        subgrade_modulus = subgrade_elastic_modulus(subgrade_props)
+        k1, k2, k3 = FATIGUE_COEFFICIENTS
+        r1, r2 = RUTTING_COEFFICIENTS
+        fatigue_repetitions = traffic_data.load_moment(k2) / REFERENCE_AXLE_LOAD ** k2 / steps_per_year
+        rutting_repetitions = traffic_data.load_moment(r2) / REFERENCE_AXLE_LOAD ** r2 / steps_per_year
+
+    keys = ['Fatigue Cracking', 'Rutting'] + (['Fatigue Damage', 'Rutting Damage'] if mechanistic else [])
+    per_year = {key: np.zeros(n_years) for key in keys}
+    steps = {key: np.empty(n_steps) for key in keys} if return_steps else None
+    yearly_max = np.full(n_years, -np.inf)
+    yearly_min = np.full(n_years, np.inf)
+
+    for start in range(0, n_steps, chunk_size):
+        index = np.arange(start, min(start + chunk_size, n_steps))
+        year = index // steps_per_year
+        position = index % temperatures.size
+        temperature = temperatures[position]
+        step_rainfall = rainfall[position]
+        asphalt_factor, subgrade_factor = modulus_factors(temperature, step_rainfall,
+                                                          climate_data.average_temperature, mean_rainfall)
+        g = growth[year]
+        increments = {
+            'Fatigue Cracking': g ** 3 * fatigue_moment / (material_props.asphalt_modulus * asphalt_factor) ** 3,
+            'Rutting': g * rutting_moment / (subgrade_props.modulus * subgrade_factor)
+            * (step_rainfall * steps_per_year / 1000)
+        }
+        if mechanistic:
+            step_moduli = np.where(temperature_sensitive, moduli * asphalt_factor[:, None], moduli)
+            strains = critical_strains(np.broadcast_to(thicknesses, step_moduli.shape), step_moduli,
+                                       subgrade_modulus * subgrade_factor)
+            tensile = np.maximum(strains['tensile_strain'], 0.0)
+            increments['Fatigue Damage'] = (g ** k2 * fatigue_repetitions * tensile ** k2
+                                            * (step_moduli[:, 0] * MPA_TO_PSI) ** k3 / k1)
+            increments['Rutting Damage'] = g ** r2 * rutting_repetitions * strains['compressive_strain'] ** r2 / r1
+        for key, values in increments.items():
+            per_year[key] += np.bincount(year, weights=values, minlength=n_years)
+            if steps is not None:
+                steps[key][index] = values
+        np.maximum.at(yearly_max, year, temperature)
+        np.minimum.at(yearly_min, year, temperature)
+
+    results: Dict[str, Union[float, np.ndarray]] = {key: float(values.sum()) for key, values in per_year.items()}
+    results['Thermal Cracking'] = (float(material_props.thermal_coeff * np.mean(yearly_max - yearly_min))
+                                   if n_years else 0.0)
+    results.update({f"{key} per Year": values for key, values in per_year.items()})
+    if steps is not None:
+        results.update({f"{key} per Step": values for key, values in steps.items()})
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Time-stepped simulation completed: {n_steps} steps ({steps_per_year} per year).")
+    return results
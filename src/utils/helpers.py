@@ -1,19 +1,32 @@
 # src/utils/helpers.py
 
-import pandas as pd
+import sys
 import logging
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+import numpy as np
+
 from src.utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = setup_logger(__name__)
 
+# Below this distance from 1 the growth-series derivatives use their Taylor expansions,
+# where the closed forms would lose precision to cancellation.
+_SERIES_TOLERANCE = 1e-5
+
 
-def read_excel(file_path: str) -> pd.DataFrame:
+def read_excel(file_path: str) -> Dict[str, 'pd.DataFrame']:
     """
     Reads an Excel file and returns a pandas DataFrame.
 
     :param file_path: Path to the Excel file.
     :return: pandas DataFrame.
     """
+    import pandas as pd
+
     try:
         df = pd.read_excel(file_path, sheet_name=None)  # Read all sheets
         logger.info(f"Excel file '{file_path}' read successfully.")
@@ -27,27 +40,87 @@ def save_pdf(file_path: str, content: str):
     """
     Saves content to a PDF file using ReportLab.
 
+    Rendering is shared with src.reporting (in-memory, cached page template).
+
     :param file_path: Path to save the PDF.
     :param content: Content to write into the PDF.
     """
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-
-        c = canvas.Canvas(file_path, pagesize=letter)
-        width, height = letter
-        textobject = c.beginText(50, height - 50)
-        textobject.setFont("Helvetica", 12)
-
-        for line in content.split('\n'):
-            textobject.textLine(line)
-        c.drawText(textobject)
-        c.showPage()
-        c.save()
-        logger.info(f"PDF saved successfully at {file_path}.")
-    except ImportError:
-        logger.error("ReportLab library is not installed.")
-        raise
-    except Exception as e:
-        logger.error(f"Failed to save PDF: {e}")
-        raise
+    from src.reporting import export_report_to_pdf
+
+    export_report_to_pdf(content, file_path)
+    logger.info(f"PDF saved successfully at {file_path}.")
+
+
+def geometric_series_sum(ratio, n_terms):
+    """
+    Closed-form sum of ratio ** k for k = 0 .. n_terms - 1.
+
+    Works element-wise on NumPy arrays; a ratio of exactly 1 yields n_terms. For positive
+    ratios the sum is evaluated as expm1(n * log1p(ratio - 1)) / (ratio - 1), which avoids
+    the cancellation of (ratio ** n - 1) / (ratio - 1) for ratios close to 1.
+
+    :param ratio: Common ratio (scalar or array).
+    :param n_terms: Number of terms (scalar or array).
+    :return: Sum of the series (scalar or array).
+    """
+    ratio = np.asarray(ratio, dtype=float)
+    n_terms = np.asarray(n_terms, dtype=float)
+    delta = ratio - 1.0
+    is_one = delta == 0.0
+    positive = ratio > 0.0
+    safe_delta = np.where(is_one, 1.0, delta)
+    growth = np.where(positive, np.expm1(n_terms * np.log1p(np.where(positive, safe_delta, 0.0))),
+                      (1.0 + safe_delta) ** n_terms - 1.0)
+    total = np.where(is_one, n_terms, growth / safe_delta)
+    return total if total.ndim else float(total)
+
+
+def geometric_series_gradient(ratio, n_terms) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Partial derivatives of geometric_series_sum with respect to ratio and n_terms.
+
+    With S = (ratio ** n - 1) / (ratio - 1), dS/dratio = (n * ratio ** (n - 1) * (ratio - 1) - (ratio ** n - 1))
+    / (ratio - 1) ** 2 and dS/dn = ratio ** n * ln(ratio) / (ratio - 1). Within _SERIES_TOLERANCE of
+    ratio 1, where the closed forms lose precision to cancellation, first-order Taylor expansions
+    around the limits n (n - 1) / 2 and 1 are used. n is treated as continuous.
+
+    :param ratio: Common ratio (scalar or array, positive).
+    :param n_terms: Number of terms (scalar or array).
+    :return: Tuple of (d sum / d ratio, d sum / d n_terms) as arrays.
+    """
+    ratio, n = np.broadcast_arrays(np.asarray(ratio, dtype=float), np.asarray(n_terms, dtype=float))
+    delta = ratio - 1.0
+    near_one = np.abs(delta) < _SERIES_TOLERANCE
+    safe_delta = np.where(near_one, 1.0, delta)
+    safe_ratio = 1.0 + safe_delta
+    power = safe_ratio ** n
+    d_ratio = np.where(near_one, n * (n - 1) / 2 + delta * n * (n - 1) * (n - 2) / 3,
+                       (n * power / safe_ratio * safe_delta - (power - 1.0)) / safe_delta ** 2)
+    d_n = np.where(near_one, 1.0 + delta * (n - 0.5), power * np.log(safe_ratio) / safe_delta)
+    return d_ratio, d_n
+
+
+def is_dataframe(obj: Any) -> bool:
+    """
+    Check whether obj is a pandas DataFrame without importing pandas.
+
+    If pandas has not been imported yet, obj cannot be one of its DataFrames.
+
+    :param obj: Object to check.
+    :return: True for pandas DataFrames.
+    """
+    pd = sys.modules.get('pandas')
+    return pd is not None and isinstance(obj, pd.DataFrame)
+
+
+def as_input_table(source: Any, columns: Dict[str, np.ndarray]) -> Any:
+    """
+    Return result columns in the same container type as the columnar input.
+
+    :param source: Original columnar input (DataFrame or mapping).
+    :param columns: Mapping of result name to array.
+    :return: DataFrame sharing the source index for DataFrame input, otherwise the mapping itself.
+    """
+    if is_dataframe(source):
+        return type(source)(columns, index=source.index)
+    return columns
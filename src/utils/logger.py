@@ -1,9 +1,67 @@
 # src/utils/logger.py
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
 
-def setup_logger(name: str, log_file: str = 'me_pavement_design.log', level: int = logging.INFO) -> logging.Logger:
+DEFAULT_LOG_FILE = 'me_pavement_design.log'
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Loggers created by setup_logger, with the log file and level they were created with.
+_registry: Dict[str, Tuple[str, int]] = {}
+_queue_handler: Optional['_DeferredQueueHandler'] = None
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+# Overrides set by configure_logging, also applied to loggers created afterwards.
+_log_file_override: Optional[str] = None
+_console_enabled = True
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that only merges the message arguments before enqueueing and leaves
+    timestamp and layout formatting to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Make the record safe to hand to another thread without formatting it.
+
+        :param record: Log record emitted on the compute thread.
+        :return: Record with its message merged and exception text rendered.
+        """
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _build_handlers(log_file: str, level: int, console: bool = True) -> List[logging.Handler]:
+    """
+    Create the file (and optionally console) handlers used by every logger.
+
+    :param log_file: File where logs will be saved.
+    :param level: Logging level.
+    :param console: Whether to also log to stderr.
+    :return: List of configured handlers.
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler(log_file)]
+    if console:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+    return handlers
+
+
+def setup_logger(name: str, log_file: str = DEFAULT_LOG_FILE, level: int = logging.INFO) -> logging.Logger:
     """
     Sets up a logger with the specified name and log file.
 
@@ -14,22 +72,95 @@ def setup_logger(name: str, log_file: str = 'me_pavement_design.log', level: int
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    _registry[name] = (log_file, level)
 
     # Avoid adding multiple handlers to the logger
     if not logger.handlers:
-        # Create handlers
-        fh = logging.FileHandler(log_file)
-        fh.setLevel(level)
-        ch = logging.StreamHandler()
-        ch.setLevel(level)
+        if _queue_handler is not None:
+            logger.addHandler(_queue_handler)
+        else:
+            for handler in _build_handlers(_log_file_override or log_file, level, _console_enabled):
+                logger.addHandler(handler)
 
-        # Create formatter and add it to handlers
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        fh.setFormatter(formatter)
-        ch.setFormatter(formatter)
+    return logger
 
-        # Add handlers to the logger
-        logger.addHandler(fh)
-        logger.addHandler(ch)
 
-    return logger
+def _stop_listener():
+    """
+    Flush and stop the shared queue listener, closing its handlers.
+    """
+    global _queue_handler, _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+    _queue_handler = None
+    _queue_listener = None
+
+
+def configure_logging(use_queue: bool = False, log_file: Optional[str] = None, console: bool = True,
+                      level: int = logging.INFO):
+    """
+    Rebuild the handlers of every logger created by setup_logger; loggers created
+    later pick up the same settings.
+
+    With use_queue=True all loggers share one QueueHandler, and a single QueueListener
+    thread owns the file and console handlers, so formatting and file I/O happen off the
+    compute thread. Otherwise every logger gets its own direct handlers as before.
+
+    :param use_queue: Route records through a shared QueueHandler/QueueListener.
+    :param log_file: File where logs will be saved (defaults to each logger's original file).
+    :param console: Whether to also log to stderr.
+    :param level: Handler logging level.
+    """
+    global _queue_handler, _queue_listener, _log_file_override, _console_enabled
+    _stop_listener()
+    _log_file_override = log_file
+    _console_enabled = console
+    for name in _registry:
+        logger = logging.getLogger(name)
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+
+    if use_queue:
+        records = queue.SimpleQueue()
+        _queue_handler = _DeferredQueueHandler(records)
+        _queue_listener = logging.handlers.QueueListener(
+            records, *_build_handlers(log_file or DEFAULT_LOG_FILE, level, console), respect_handler_level=True)
+        _queue_listener.start()
+
+    for name, (original_file, _) in _registry.items():
+        logger = logging.getLogger(name)
+        if _queue_handler is not None:
+            logger.addHandler(_queue_handler)
+        else:
+            for handler in _build_handlers(log_file or original_file, level, console):
+                logger.addHandler(handler)
+
+
+@contextmanager
+def simulation_logging_disabled(level: int = logging.INFO):
+    """
+    Context manager that suppresses the package's log records up to level, e.g. for batch
+    runs that call the per-scenario functions many times.
+
+    Only loggers created by setup_logger are raised above level (and restored afterwards);
+    other libraries' loggers and records above level, such as errors, still get through.
+
+    :param level: Highest level to suppress.
+    """
+    previous = {name: logging.getLogger(name).level for name in list(_registry)}
+    for name in previous:
+        logging.getLogger(name).setLevel(max(previous[name], level + 1))
+    try:
+        yield
+    finally:
+        for name, original in previous.items():
+            logging.getLogger(name).setLevel(original)
+
+
+if os.environ.get('ME_PAVEMENT_QUEUE_LOGGING'):
+    configure_logging(use_queue=True)
+
+atexit.register(_stop_listener)
@@ -0,0 +1,213 @@
+# src/visualization.py
+
+import io
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.cache import fingerprint
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Long per-year or per-step series are reduced to about this many points before charting.
+MAX_CHART_POINTS = 500
+
+_cache: "OrderedDict[str, Any]" = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_size = 64
+
+
+def _memoize(kind: str, build: Callable[[], Any], *inputs: Any) -> Any:
+    """
+    Return the cached object built from inputs, building it on a miss.
+
+    Entries are keyed by a fingerprint of kind and inputs; the least recently used
+    entries are evicted beyond the cache size.
+
+    :param kind: Name of the chart or table.
+    :param build: Callable producing the object.
+    :param inputs: Values the object depends on.
+    :return: Cached or newly built object.
+    """
+    key = fingerprint(kind, *inputs)
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+    value = build()
+    with _cache_lock:
+        _cache[key] = value
+        while len(_cache) > _cache_size:
+            _cache.popitem(last=False)
+    logger.debug("Rendered %s (%d cached chart(s)).", kind, len(_cache))
+    return value
+
+
+def clear_chart_cache(maxsize: Optional[int] = None):
+    """
+    Drop all cached charts and tables, optionally resizing the cache.
+
+    :param maxsize: New maximum number of cached entries.
+    """
+    global _cache_size
+    with _cache_lock:
+        _cache.clear()
+        if maxsize is not None:
+            if maxsize < 1:
+                raise ValueError("maxsize must be a positive integer.")
+            _cache_size = maxsize
+
+
+def downsample_series(values: Sequence[float], max_points: int = MAX_CHART_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a long series to at most max_points points for charting.
+
+    The series is split into equal buckets and the minimum and maximum of each bucket are
+    kept in their original order, together with the first and last points, so peaks and
+    steps (e.g. maintenance years) stay visible.
+    Series that are already short are returned unchanged.
+
+    :param values: Series values, one per year or time step.
+    :param max_points: Maximum number of points returned.
+    :return: Tuple of (1-based positions, values).
+    """
+    if max_points < 4:
+        raise ValueError("max_points must be at least 4.")
+    y = np.asarray(values, dtype=float)
+    x = np.arange(1, len(y) + 1)
+    if len(y) <= max_points:
+        return x, y
+    n_buckets = (max_points - 2) // 2
+    edges = np.linspace(0, len(y), n_buckets + 1).astype(int)
+    index = np.empty(2 * n_buckets + 2, dtype=int)
+    index[0], index[-1] = 0, len(y) - 1
+    for bucket, (start, stop) in enumerate(zip(edges[:-1], edges[1:])):
+        segment = y[start:stop]
+        index[2 * bucket + 1] = start + int(np.argmin(segment))
+        index[2 * bucket + 2] = start + int(np.argmax(segment))
+    index = np.unique(index)
+    logger.debug("Downsampled series of %d points to %d.", len(y), len(index))
+    return x[index], y[index]
+
+
+def _render(draw: Callable[[Any], None], figsize: Tuple[float, float]) -> bytes:
+    """
+    Draw on a fresh figure and return it as PNG bytes; the figure is released afterwards.
+
+    Figures are created without pyplot, so they are never registered with its global
+    figure manager and cannot accumulate across app reruns.
+
+    :param draw: Callable drawing on the figure's axes.
+    :param figsize: Figure size in inches.
+    :return: PNG image bytes.
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    try:
+        draw(fig.subplots())
+        fig.tight_layout()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png')
+        return buffer.getvalue()
+    finally:
+        fig.clear()
+
+
+def distress_pie_png(simulation_results: Dict[str, float]) -> bytes:
+    """
+    Pie chart of the predicted distresses.
+
+    :param simulation_results: Distress name to predicted value.
+    :return: PNG image bytes.
+    """
+    def draw(ax):
+        ax.pie(list(simulation_results.values()), labels=list(simulation_results), autopct='%1.1f%%')
+        ax.set_ylabel('Value')
+
+    return _memoize('distress_pie', lambda: _render(draw, (6, 6)), simulation_results)
+
+
+def maintenance_pie_png(maintenance_costs: Dict[int, float]) -> bytes:
+    """
+    Pie chart of the maintenance cost share of each year.
+
+    :param maintenance_costs: Maintenance costs with year as key.
+    :return: PNG image bytes.
+    """
+    years = sorted(maintenance_costs)
+
+    def draw(ax):
+        ax.pie([maintenance_costs[year] for year in years], labels=years, autopct='%1.1f%%')
+        ax.set_ylabel('Maintenance Cost ($)')
+
+    return _memoize('maintenance_pie', lambda: _render(draw, (6, 6)), maintenance_costs)
+
+
+def layer_structure_png(design_summary: Sequence[Tuple[str, float]]) -> bytes:
+    """
+    Horizontal stacked bar of the pavement layers.
+
+    :param design_summary: (layer type, thickness in mm) per layer, top to bottom.
+    :return: PNG image bytes.
+    """
+    def draw(ax):
+        current_y = 0
+        for layer_type, thickness in design_summary:
+            ax.barh(1, thickness, left=current_y, height=0.5, label=layer_type)
+            current_y += thickness
+        ax.set_xlabel("Thickness (mm)")
+        ax.set_yticks([])
+        ax.legend()
+
+    return _memoize('layer_structure', lambda: _render(draw, (6, 3)), [tuple(layer) for layer in design_summary])
+
+
+def results_table(simulation_results: Dict[str, float]):
+    """
+    Table of the predicted distresses.
+
+    :param simulation_results: Distress name to predicted value.
+    :return: DataFrame with 'Distress Type' and 'Value' columns.
+    """
+    import pandas as pd
+
+    return _memoize('results_table', lambda: pd.DataFrame(list(simulation_results.items()),
+                                                          columns=["Distress Type", "Value"]), simulation_results)
+
+
+def maintenance_table(maintenance_costs: Dict[int, float]):
+    """
+    Table of the maintenance costs sorted by year.
+
+    :param maintenance_costs: Maintenance costs with year as key.
+    :return: DataFrame with 'Year' and 'Maintenance Cost ($)' columns.
+    """
+    import pandas as pd
+
+    def build():
+        years = sorted(maintenance_costs)
+        return pd.DataFrame({'Year': years, 'Maintenance Cost ($)': [maintenance_costs[year] for year in years]})
+
+    return _memoize('maintenance_table', build, maintenance_costs)
+
+
+def cost_series(lcc_over_time: Sequence[float], max_points: int = MAX_CHART_POINTS):
+    """
+    Cumulative lifecycle cost per year, downsampled for charting.
+
+    :param lcc_over_time: Cumulative lifecycle cost after each year.
+    :param max_points: Maximum number of chart points.
+    :return: DataFrame indexed by 'Year' with a 'Cumulative LCC' column.
+    """
+    import pandas as pd
+
+    def build():
+        years, costs = downsample_series(lcc_over_time, max_points)
+        return pd.DataFrame({'Cumulative LCC': costs}, index=pd.Index(years, name='Year'))
+
+    return _memoize('cost_series', build, np.asarray(lcc_over_time, dtype=float), max_points)
+
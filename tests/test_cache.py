@@ -0,0 +1,25 @@
+# tests/test_cache.py
+
+import time
+
+import numpy as np
+
+from src.cache import fingerprint
+
+
+def test_numeric_sequences_keep_distinct_encodings():
+    loads = [80.0, 100.0, 120.0]
+    assert fingerprint(loads) == fingerprint([np.float64(load) for load in loads])
+    assert fingerprint(loads) != fingerprint(tuple(loads))
+    assert fingerprint(loads) != fingerprint(np.array(loads))
+    assert fingerprint([80, 100]) != fingerprint([80.0, 100.0])
+    assert fingerprint([80.0, 100.0]) != fingerprint([80.0, 100.5])
+    assert fingerprint([True, 1]) != fingerprint([1, 1])
+    assert fingerprint(['80', 1.0]) != fingerprint([80.0, 1.0])
+
+
+def test_large_load_list_hashes_quickly():
+    loads = np.random.default_rng(0).uniform(10, 200, 1_000_000).tolist()
+    start = time.perf_counter()
+    fingerprint(loads)
+    assert time.perf_counter() - start < 1.0
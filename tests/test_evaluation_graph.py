@@ -0,0 +1,80 @@
+# tests/test_evaluation_graph.py
+
+import numpy as np
+import pytest
+
+from src.cache import SimulationCache
+from src.evaluation_graph import EvaluationGraph
+from src.lcca import calculate_LCCA
+from src.models import ClimateData, MaterialProperties, SubgradeProperties, TrafficData
+from src.performance import design_new_pavement
+
+LCCA_INPUTS = {'initial_cost': 1e6, 'maintenance_costs': {5: 1e5, 15: 2e5}, 'discount_rate': 0.03, 'lcca_period': 20}
+
+
+def _graph(cache=None):
+    graph = EvaluationGraph(cache=cache)
+    graph.set_models(None, TrafficData([80.0, 100.0, 120.0], 0.03, 20, [3.0, 2.0, 1.0]), ClimateData(20.0, 10.0, 800.0),
+                     SubgradeProperties(50.0, 5.0), MaterialProperties(3000.0, 30.0, 0.5))
+    graph.set_inputs(**LCCA_INPUTS)
+    graph.evaluate()
+    graph.evaluations.clear()
+    return graph
+
+
+def test_results_match_direct_calculation():
+    results = _graph().evaluate()
+    traffic = TrafficData([80.0, 100.0, 120.0], 0.03, 20, [3.0, 2.0, 1.0])
+    expected = design_new_pavement(None, traffic, ClimateData(20.0, 10.0, 800.0), SubgradeProperties(50.0, 5.0),
+                                   MaterialProperties(3000.0, 30.0, 0.5))
+    for name, value in expected.items():
+        assert results[name] == pytest.approx(value, rel=1e-12)
+    assert results['Lifecycle Cost'] == pytest.approx(calculate_LCCA(1e6, {5: 1e5, 15: 2e5}, 0.03, 20))
+
+
+def test_rainfall_change_recomputes_rutting_only():
+    graph = _graph()
+    assert graph.set_inputs(rainfall=900.0) == ['rainfall']
+    graph.evaluate()
+    assert set(graph.evaluations) == {'rutting_per_year', 'Rutting'}
+
+
+def test_unchanged_models_recompute_nothing():
+    graph = _graph()
+    assert graph.set_models(None, TrafficData([80.0, 100.0, 120.0], 0.03, 20, [3.0, 2.0, 1.0])) == []
+    graph.evaluate()
+    assert not graph.evaluations
+
+
+def test_period_change_reuses_yearly_arrays():
+    graph = _graph()
+    stored = graph.value('fatigue_per_year')
+    full = stored.copy()
+    graph.set_inputs(analysis_period=10)
+    shortened = graph.value('fatigue_per_year')
+    assert np.shares_memory(shortened, stored)
+    np.testing.assert_array_equal(shortened, full[:10])
+    graph.set_inputs(analysis_period=30)
+    extended = graph.value('fatigue_per_year')
+    np.testing.assert_array_equal(extended[:20], full)
+    assert extended.size == 30
+    assert 'load_moment_3' not in graph.evaluations
+
+
+def test_discount_rate_change_reuses_maintenance_per_year():
+    graph = _graph()
+    graph.set_inputs(discount_rate=0.05)
+    cost = graph.evaluate()['Lifecycle Cost']
+    assert set(graph.evaluations) == {'discount_factors', 'lcc_over_time', 'Lifecycle Cost'}
+    assert cost == pytest.approx(calculate_LCCA(1e6, {5: 1e5, 15: 2e5}, 0.05, 20))
+
+
+def test_shared_cache_serves_a_new_graph():
+    cache = SimulationCache()
+    _graph(cache)
+    graph = _graph(cache)
+    graph.set_inputs(rainfall=900.0)
+    graph.evaluate()
+    graph.set_inputs(rainfall=800.0)
+    graph.evaluate()
+    assert graph.evaluations == {'rutting_per_year': 1, 'Rutting': 1}
@@ -0,0 +1,69 @@
+# tests/test_gradients.py
+
+import numpy as np
+import pytest
+
+from src.gradients import calculate_LCCA_batch_with_gradients, design_new_pavement_batch_with_gradients
+from src.lcca import calculate_LCCA_batch
+from src.performance import design_new_pavement_batch
+
+AXLE_LOADS = np.array([80.0, 100.0, 120.0])
+LOAD_COUNTS = np.array([3.0, 2.0, 1.0])
+
+
+def _scenarios():
+    rng = np.random.default_rng(0)
+    n = 50
+    return {
+        'traffic_growth_rate': rng.uniform(-0.02, 0.08, n),
+        'analysis_period': rng.integers(5, 40, n).astype(float),
+        'rainfall': rng.uniform(300, 1500, n),
+        'temperature_variation': rng.uniform(5, 30, n),
+        'subgrade_modulus': rng.uniform(30, 150, n),
+        'asphalt_modulus': rng.uniform(1500, 5000, n),
+        'thermal_coeff': rng.uniform(0.1, 1.0, n)
+    }
+
+
+def test_values_equal_plain_batch():
+    scenarios = _scenarios()
+    plain = design_new_pavement_batch(scenarios, AXLE_LOADS, LOAD_COUNTS)
+    batch = design_new_pavement_batch_with_gradients(scenarios, AXLE_LOADS, LOAD_COUNTS)
+    for output, values in plain.items():
+        np.testing.assert_array_equal(batch['values'][output], values)
+
+
+def test_growth_gradients_are_continuous_at_zero_growth():
+    scenarios = {column: np.full(4, values[0]) for column, values in _scenarios().items()}
+    scenarios['traffic_growth_rate'] = np.array([0.0, 1e-7, -1e-7, 1e-4])
+    gradients = design_new_pavement_batch_with_gradients(scenarios, AXLE_LOADS, LOAD_COUNTS)['gradients']
+    for output in ('Fatigue Cracking', 'Rutting'):
+        for column in ('traffic_growth_rate', 'analysis_period'):
+            partials = gradients[output][column]
+            np.testing.assert_allclose(partials[1:3], partials[0], rtol=1e-5)
+            np.testing.assert_allclose(partials[3], partials[0], rtol=0.05)
+
+
+@pytest.mark.parametrize('column', ['traffic_growth_rate', 'analysis_period', 'rainfall', 'temperature_variation',
+                                    'subgrade_modulus', 'asphalt_modulus', 'thermal_coeff'])
+def test_gradients_match_finite_differences(column):
+    scenarios = _scenarios()
+    gradients = design_new_pavement_batch_with_gradients(scenarios, AXLE_LOADS, LOAD_COUNTS)['gradients']
+    step = 1e-6 * np.maximum(np.abs(scenarios[column]), 1e-2)
+    upper = design_new_pavement_batch({**scenarios, column: scenarios[column] + step}, AXLE_LOADS, LOAD_COUNTS)
+    lower = design_new_pavement_batch({**scenarios, column: scenarios[column] - step}, AXLE_LOADS, LOAD_COUNTS)
+    for output, partials in gradients.items():
+        expected = (upper[output] - lower[output]) / (2 * step)
+        np.testing.assert_allclose(partials.get(column, np.zeros_like(expected)), expected, rtol=1e-5, atol=1e-12)
+
+
+def test_lcca_gradients_share_the_batch_values():
+    rates = np.linspace(0.01, 0.08, 8)
+    costs = {5: 100000.0, 10: 150000.0, 25: 0.0}
+    lcc, gradients = calculate_LCCA_batch_with_gradients(1e6, costs, rates, 20)
+    np.testing.assert_array_equal(lcc, calculate_LCCA_batch(1e6, costs, rates, 20))
+    step = 1e-7
+    expected = (calculate_LCCA_batch(1e6, costs, rates + step, 20)
+                - calculate_LCCA_batch(1e6, costs, rates - step, 20)) / (2 * step)
+    np.testing.assert_allclose(gradients['discount_rate'], expected, rtol=1e-6)
+    np.testing.assert_array_equal(gradients['maintenance_costs'][25], np.zeros_like(rates))
@@ -0,0 +1,85 @@
+# tests/test_ingestion.py
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from src.ingestion import LoadSpectrumAccumulator, iter_scenario_chunks, read_scenarios, stream_load_spectrum
+
+
+def test_accumulator_matches_dense_binning():
+    rng = np.random.default_rng(0)
+    chunks = [rng.uniform(10, 200, 5000) for _ in range(4)]
+    accumulator = LoadSpectrumAccumulator(bin_width=2.0)
+    for chunk in chunks:
+        accumulator.add(chunk)
+    loads = np.concatenate(chunks)
+    bins = (loads // 2.0).astype(int)
+    expected_counts = np.bincount(bins)
+    occupied = expected_counts > 0
+    expected_loads = np.bincount(bins, weights=loads)[occupied] / expected_counts[occupied]
+    spectrum_loads, spectrum_counts = accumulator.spectrum()
+    np.testing.assert_allclose(spectrum_loads, expected_loads)
+    np.testing.assert_array_equal(spectrum_counts, expected_counts[occupied])
+    assert accumulator.n_axles == loads.size
+
+
+def test_outlier_load_does_not_grow_memory():
+    accumulator = LoadSpectrumAccumulator(bin_width=1.0)
+    accumulator.add(np.array([80.0, 100.0]))
+    tracemalloc.start()
+    accumulator.add(np.array([120.0, 5e7, 1e15]))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < 1_000_000
+    loads, counts = accumulator.spectrum()
+    assert loads.size == 5
+    assert counts.sum() == 5
+
+
+def test_max_load_rejects_outliers():
+    accumulator = LoadSpectrumAccumulator(bin_width=1.0, max_load=500.0)
+    accumulator.add(np.array([80.0, 5e7, np.nan, -3.0, 100.0]))
+    loads, counts = accumulator.spectrum()
+    np.testing.assert_allclose(loads, [80.0, 100.0])
+    assert accumulator.n_rejected == 3
+
+
+def test_stream_load_spectrum_skips_outlier_record(tmp_path):
+    path = tmp_path / "wim.csv"
+    path.write_text("Axle_Load\n80\n100\n50000000\n100.5\n")
+    loads, counts = stream_load_spectrum(str(path), bin_width=1.0, chunk_size=2, max_load=1000.0)
+    np.testing.assert_allclose(loads, [80.0, 100.25])
+    np.testing.assert_array_equal(counts, [1, 2])
+
+
+def test_invalid_max_load():
+    with pytest.raises(ValueError):
+        LoadSpectrumAccumulator(max_load=0.0)
+
+
+def _write_sections(path, ids, rainfall='800'):
+    rows = ["section_id,traffic_growth_rate,analysis_period,rainfall,temperature_variation,subgrade_modulus,"
+            "asphalt_modulus,thermal_coeff,length_km"]
+    rows += [f"{section},0.03,20,{rainfall if i == len(ids) - 1 else '800'},10,50,3000,0.5,1.5"
+             for i, section in enumerate(ids)]
+    path.write_text("\n".join(rows) + "\n")
+
+
+def test_scenario_chunks_keep_identifiers_as_text(tmp_path):
+    path = tmp_path / 'sections.csv'
+    _write_sections(path, ['0012', '1', '2', 'S0', 'S1'])
+    chunks = list(iter_scenario_chunks(str(path), chunk_size=3))
+    assert [list(chunk['section_id']) for chunk in chunks] == [['0012', '1', '2'], ['S0', 'S1']]
+    assert all(chunk['rainfall'].dtype == float for chunk in chunks)
+    assert read_scenarios(str(path))['section_id'][0] == '0012'
+
+
+def test_blank_model_cell_names_column_and_line(tmp_path):
+    path = tmp_path / 'sections.csv'
+    _write_sections(path, ['A', 'B', 'C', 'D'], rainfall='')
+    chunks = iter_scenario_chunks(str(path), chunk_size=2)
+    next(chunks)
+    with pytest.raises(ValueError, match="'rainfall'.*line 5"):
+        next(chunks)
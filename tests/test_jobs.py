@@ -0,0 +1,61 @@
+# tests/test_jobs.py
+
+import os
+
+import numpy as np
+import pytest
+
+from src.jobs import JobManager
+
+
+def test_finished_results_are_bounded_by_bytes():
+    manager = JobManager(max_workers=1, max_result_bytes=2500)
+    job_ids = []
+    for _ in range(4):
+        job_ids.append(manager.submit(bytes, 1000))
+        manager.result(job_ids[-1])
+    manager.shutdown()
+    kept = [job['id'] for job in manager.jobs()]
+    assert kept == job_ids[-2:]
+    with pytest.raises(KeyError):
+        manager.result(job_ids[0])
+
+
+def test_latest_result_is_kept_and_evicted_results_are_released(tmp_path):
+    released = []
+    manager = JobManager(max_workers=1, max_result_bytes=10)
+    first = manager.submit(str, tmp_path / 'first.pdf', cleanup=released.append)
+    manager.result(first)
+    second = manager.submit(bytes, 100)
+    assert manager.result(second) == bytes(100)
+    manager.shutdown()
+    assert released == [str(tmp_path / 'first.pdf')]
+
+
+def test_poll_returns_result_with_status_until_evicted():
+    manager = JobManager(max_workers=1, max_finished=1)
+    first = manager.submit(dict, a=1)
+    manager.result(first)
+    status = manager.poll(first)
+    assert status['status'] == 'done' and status['result'] == {'a': 1}
+    manager.result(manager.submit(dict, b=2))
+    manager.shutdown()
+    assert status['result'] == {'a': 1}
+    with pytest.raises(KeyError):
+        manager.poll(first)
+
+
+def _write_file(path, n_bytes):
+    path.write_bytes(bytes(n_bytes))
+    return str(path)
+
+
+def test_file_and_container_results_count_toward_the_byte_bound(tmp_path):
+    manager = JobManager(max_workers=1, max_result_bytes=150_000)
+    first = manager.submit(_write_file, tmp_path / 'first.zip', 100_000, size=os.path.getsize, cleanup=os.remove)
+    manager.result(first)
+    second = manager.submit(lambda: {'values': np.zeros(10_000), 'name': 'sweep'})
+    manager.result(second)
+    manager.shutdown()
+    assert [job['id'] for job in manager.jobs()] == [second]
+    assert not (tmp_path / 'first.zip').exists()
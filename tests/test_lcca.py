@@ -0,0 +1,48 @@
+# tests/test_lcca.py
+
+import numpy as np
+import pytest
+
+from src.lcca import calculate_LCCA, calculate_LCCA_batch, calculate_LCCA_over_time
+
+MAINTENANCE_COSTS = {0: 5e4, 3: 1e5, 10: 1.5e5, 25: 2e5, 60: 9e5}
+
+
+def _baseline(initial_cost, maintenance_costs, discount_rate, analysis_period):
+    """
+    Year-by-year discounting loop of the original implementation, with the running total kept.
+    """
+    lcc = initial_cost
+    cumulative = []
+    for year in range(1, analysis_period + 1):
+        lcc += maintenance_costs.get(year, 0) / ((1 + discount_rate) ** year)
+        cumulative.append(lcc)
+    return lcc, np.array(cumulative)
+
+
+@pytest.mark.parametrize('period', [0, 1, 3, 20, 40])
+@pytest.mark.parametrize('rate', [0.0, 0.03, 0.12])
+def test_lcca_over_time_matches_discounting_loop(rate, period):
+    expected, expected_curve = _baseline(1e6, MAINTENANCE_COSTS, rate, period)
+    lcc, curve = calculate_LCCA_over_time(1e6, MAINTENANCE_COSTS, rate, period)
+    assert lcc == pytest.approx(expected, rel=1e-12)
+    assert curve.shape == (period,)
+    np.testing.assert_allclose(curve, expected_curve, rtol=1e-12)
+    assert calculate_LCCA(1e6, MAINTENANCE_COSTS, rate, period) == pytest.approx(expected, rel=1e-12)
+
+
+def test_lcca_batch_broadcasts_a_rate_by_period_grid():
+    rates = np.array([0.0, 0.01, 0.03, 0.07, 0.12])
+    periods = np.array([0, 1, 3, 9, 10, 24, 25, 59, 60, 80])
+    grid = calculate_LCCA_batch(1e6, MAINTENANCE_COSTS, rates[:, None], periods[None, :])
+    assert grid.shape == (rates.size, periods.size)
+    expected = np.array([[_baseline(1e6, MAINTENANCE_COSTS, rate, int(period))[0] for period in periods]
+                         for rate in rates])
+    np.testing.assert_allclose(grid, expected, rtol=1e-12)
+
+
+def test_lcca_batch_broadcasts_initial_costs():
+    initial_costs = np.array([0.0, 5e5, 1e6])
+    lcc = calculate_LCCA_batch(initial_costs, MAINTENANCE_COSTS, 0.04, 30)
+    expected = [_baseline(cost, MAINTENANCE_COSTS, 0.04, 30)[0] for cost in initial_costs]
+    np.testing.assert_allclose(lcc, expected, rtol=1e-12)
@@ -0,0 +1,57 @@
+# tests/test_maintenance.py
+
+import itertools
+
+import numpy as np
+import pytest
+
+from src.maintenance import DEFAULT_TREATMENTS, Treatment, optimize_maintenance_strategy, schedule_to_text
+
+
+def _brute_force(distress_per_year, limits, treatments, discount_rate):
+    actions = [Treatment('None', 0.0, {})] + list(treatments)
+    n_years = len(next(iter(distress_per_year.values())))
+    best = None
+    for sequence in itertools.product(range(len(actions)), repeat=n_years):
+        condition = dict.fromkeys(limits, 0.0)
+        cost = 0.0
+        for year, action in enumerate(sequence):
+            for name in limits:
+                condition[name] = (condition[name] * (1 - actions[action].reductions.get(name, 0.0))
+                                   + distress_per_year[name][year])
+            if any(condition[name] > limits[name] for name in limits):
+                break
+            cost += actions[action].cost * (1 + discount_rate) ** -(year + 1)
+        else:
+            best = cost if best is None else min(best, cost)
+    return best
+
+
+def test_optimizer_matches_brute_force():
+    rng = np.random.default_rng(0)
+    for _ in range(40):
+        n_years = int(rng.integers(4, 7))
+        distress_per_year = {name: rng.uniform(0.05, 0.3, n_years) for name in ('Fatigue Cracking', 'Rutting')}
+        limits = {name: float(rng.uniform(0.3, 1.0) * damage.sum()) for name, damage in distress_per_year.items()}
+        expected = _brute_force(distress_per_year, limits, DEFAULT_TREATMENTS, 0.03)
+        if expected is None:
+            with pytest.raises(ValueError):
+                optimize_maintenance_strategy(distress_per_year, limits, grid_size=16)
+            continue
+        result = optimize_maintenance_strategy(distress_per_year, limits, grid_size=16)
+        assert result['Lifecycle Cost'] == pytest.approx(expected, rel=1e-9)
+        for name, limit in limits.items():
+            assert np.all(result['condition'][name] <= limit)
+
+
+def test_single_distress_near_limit_matches_brute_force():
+    distress_per_year = {'Rutting': np.array([0.2, 0.25, 0.18, 0.3, 0.22, 0.27])}
+    limits = {'Rutting': 0.63}
+    result = optimize_maintenance_strategy(distress_per_year, limits, grid_size=8)
+    expected = _brute_force(distress_per_year, limits, DEFAULT_TREATMENTS, 0.03)
+    assert result['Lifecycle Cost'] == pytest.approx(expected, rel=1e-9)
+
+
+def test_schedule_to_text_keeps_cents():
+    assert schedule_to_text({10: 150000.0, 5: 1234567.0}) == "5:1234567, 10:150000"
+    assert schedule_to_text({3: 20000.5, 7: 0.25}) == "3:20000.5, 7:0.25"
@@ -0,0 +1,28 @@
+# tests/test_models.py
+
+import numpy as np
+import pytest
+
+from src.models import ClimateData, ClimateRecord
+from src.timestep import climate_series
+
+
+def test_climate_series_are_stored_as_read_only_arrays():
+    climate = ClimateData.from_series([10.0, 20.0, 30.0, 20.0], [50.0, 60.0, 70.0, 80.0], steps_per_year=4)
+    assert climate.temperature_series.dtype == float and not climate.temperature_series.flags.writeable
+    assert climate.rainfall == pytest.approx(260.0)
+    with pytest.raises(ValueError):
+        climate.rainfall_series[0] = 0.0
+    record = ClimateRecord.from_model(climate)
+    assert record.temperature_series == (10.0, 20.0, 30.0, 20.0)
+    assert type(record.temperature_series[0]) is float
+
+
+def test_climate_series_of_different_lengths_are_rejected():
+    with pytest.raises(ValueError, match='same length'):
+        ClimateData.from_series([10.0, 20.0, 30.0], [50.0, 60.0], steps_per_year=3)
+    climate = ClimateData(20.0, 10.0, 800.0)
+    climate.temperature_series = np.array([10.0, 20.0, 30.0])
+    climate.rainfall_series = np.array([50.0, 60.0])
+    with pytest.raises(ValueError, match='same length'):
+        climate_series(climate)
@@ -0,0 +1,102 @@
+# tests/test_performance.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models import ClimateData, MaterialProperties, SubgradeProperties, TrafficData
+from src.performance import (design_new_pavement, design_new_pavement_batch, predict_fatigue_cracking,
+                             predict_rutting)
+
+AXLE_LOADS = [80.0, 100.0, 120.0, 35.5]
+LOAD_COUNTS = [3.0, 2.0, 1.0, 0.5]
+CLIMATE = ClimateData(20.0, 10.0, 800.0)
+SUBGRADE = SubgradeProperties(50.0, 5.0)
+MATERIAL = MaterialProperties(3000.0, 30.0, 0.5)
+
+
+def _baseline(traffic_data, climate_data, subgrade_props, material_props):
+    """
+    Per-year, per-load loops of the original implementation, with each load weighted by its count.
+    """
+    counts = traffic_data.load_counts or [1.0] * len(traffic_data.axle_loads)
+    fatigue = rutting = 0.0
+    for year in range(traffic_data.analysis_period):
+        growth_factor = (1 + traffic_data.traffic_growth_rate) ** year
+        for load, count in zip(traffic_data.axle_loads, counts):
+            load = load * growth_factor
+            fatigue += count * (load / material_props.asphalt_modulus) ** 3
+            rutting += count * (load / subgrade_props.modulus) * (climate_data.rainfall / 1000)
+    return {
+        'Fatigue Cracking': fatigue,
+        'Rutting': rutting,
+        'Thermal Cracking': material_props.thermal_coeff * climate_data.temperature_variation
+    }
+
+
+@pytest.mark.parametrize('growth', [0.0, 0.03, -0.02, 1e-9])
+@pytest.mark.parametrize('load_counts', [None, LOAD_COUNTS])
+@pytest.mark.parametrize('period', [0, 1, 25])
+def test_closed_form_matches_yearly_loops(growth, load_counts, period):
+    traffic = TrafficData(AXLE_LOADS, growth, period, load_counts)
+    expected = _baseline(traffic, CLIMATE, SUBGRADE, MATERIAL)
+    assert predict_fatigue_cracking(None, traffic, MATERIAL) == pytest.approx(expected['Fatigue Cracking'], rel=1e-12)
+    assert predict_rutting(None, traffic, CLIMATE, SUBGRADE) == pytest.approx(expected['Rutting'], rel=1e-12)
+    results = design_new_pavement(None, traffic, CLIMATE, SUBGRADE, MATERIAL)
+    assert results == pytest.approx(expected, rel=1e-12)
+
+
+def _batch_scenarios(n=40):
+    rng = np.random.default_rng(1)
+    return {
+        'traffic_growth_rate': np.concatenate([[0.0, -0.02, 1e-9], rng.uniform(-0.03, 0.08, n - 3)]),
+        'analysis_period': rng.integers(0, 40, n).astype(float),
+        'rainfall': rng.uniform(300, 1500, n),
+        'temperature_variation': rng.uniform(5, 30, n),
+        'subgrade_modulus': rng.uniform(30, 150, n),
+        'asphalt_modulus': rng.uniform(1500, 5000, n),
+        'thermal_coeff': rng.uniform(0.1, 1.0, n)
+    }
+
+
+def _scalar_results(scenarios, load_counts):
+    rows = []
+    for i in range(len(scenarios['traffic_growth_rate'])):
+        traffic = TrafficData(AXLE_LOADS, float(scenarios['traffic_growth_rate'][i]),
+                              int(scenarios['analysis_period'][i]), load_counts)
+        climate = ClimateData(20.0, float(scenarios['temperature_variation'][i]), float(scenarios['rainfall'][i]))
+        subgrade = SubgradeProperties(float(scenarios['subgrade_modulus'][i]), 5.0)
+        material = MaterialProperties(float(scenarios['asphalt_modulus'][i]), 30.0, float(scenarios['thermal_coeff'][i]))
+        rows.append(design_new_pavement(None, traffic, climate, subgrade, material))
+    return {output: np.array([row[output] for row in rows]) for output in rows[0]}
+
+
+@pytest.mark.parametrize('load_counts', [None, LOAD_COUNTS])
+def test_batch_with_shared_spectrum_matches_scalar_design(load_counts):
+    scenarios = _batch_scenarios()
+    expected = _scalar_results(scenarios, load_counts)
+    results = design_new_pavement_batch(scenarios, AXLE_LOADS, load_counts)
+    for output, values in expected.items():
+        np.testing.assert_allclose(results[output], values, rtol=1e-12)
+
+
+def test_batch_with_spectrum_columns_matches_scalar_design():
+    scenarios = _batch_scenarios()
+    loads, counts = np.array(AXLE_LOADS), np.array(LOAD_COUNTS)
+    n = len(scenarios['rainfall'])
+    frame = pd.DataFrame({**scenarios, 'axle_load_sum': np.full(n, counts @ loads),
+                          'axle_load_cube_sum': np.full(n, counts @ loads ** 3)},
+                         index=pd.Index([f'{i:04d}' for i in range(n)], name='section_id'))
+    results = design_new_pavement_batch(frame)
+    assert results.index.equals(frame.index)
+    for output, values in _scalar_results(scenarios, LOAD_COUNTS).items():
+        np.testing.assert_allclose(results[output].to_numpy(), values, rtol=1e-12)
+
+
+def test_batch_reports_missing_columns():
+    scenarios = _batch_scenarios()
+    with pytest.raises(ValueError, match='axle_load_cube_sum'):
+        design_new_pavement_batch({**scenarios, 'axle_load_sum': scenarios['rainfall']})
+    del scenarios['rainfall']
+    with pytest.raises(ValueError, match='rainfall'):
+        design_new_pavement_batch(scenarios, AXLE_LOADS)
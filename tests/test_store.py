@@ -0,0 +1,71 @@
+# tests/test_store.py
+
+import datetime
+
+import numpy as np
+import pytest
+
+from src.models import ClimateData, MaterialProperties, Pavement, SubgradeProperties, TrafficData
+from src.store import ProjectStore, restore_models
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ProjectStore(str(tmp_path / 'store.db')) as project_store:
+        yield project_store
+
+
+def _bulk_columns(n):
+    return {
+        'section': np.array([f'{i % 4:04d}' for i in range(n)]),
+        'traffic_growth_rate': np.linspace(0.0, 0.05, n),
+        'Fatigue Cracking': np.arange(n, dtype=float),
+        'Rutting': np.arange(n, dtype=float) / 10
+    }
+
+
+def test_iter_scenarios_pages_by_id_and_applies_filters(store):
+    assert store.bulk_insert(_bulk_columns(25), project='north', run_date='2024-01-01', batch_size=7) == 25
+    store.bulk_insert(_bulk_columns(5), project='south', run_date='2024-06-01')
+    pages = list(store.iter_scenarios(page_size=10, project='north'))
+    assert [len(page) for page in pages] == [10, 10, 5]
+    ids = [scenario['id'] for page in pages for scenario in page]
+    assert ids == sorted(ids) and len(set(ids)) == 25
+    sections = [scenario['section'] for page in store.iter_scenarios(page_size=3, project='north', section='0002')
+                for scenario in page]
+    assert sections == ['0002'] * 6
+    assert store.count(date_from='2024-03-01') == 5
+    assert store.count(date_to=datetime.date(2024, 3, 1)) == 25
+    assert store.count(project='north', result_ranges={'Fatigue Cracking': (10, 14)}) == 5
+    assert store.sections('north') == ['0000', '0001', '0002', '0003']
+    with pytest.raises(ValueError):
+        store.count(result_ranges={'Unknown': (0, 1)})
+
+
+def test_bulk_insert_stores_inputs_and_results(store):
+    store.bulk_insert(_bulk_columns(3), project='north')
+    page = next(store.iter_scenarios(include_inputs=True))
+    assert [scenario['inputs']['traffic_growth_rate'] for scenario in page] == pytest.approx([0.0, 0.025, 0.05])
+    assert [scenario['rutting'] for scenario in page] == pytest.approx([0.0, 0.1, 0.2])
+    assert store.get(page[1]['id'])['results'] == {'Fatigue Cracking': 1.0, 'Rutting': 0.1}
+    with pytest.raises(ValueError):
+        store.bulk_insert({'section': np.array(['a', 'b']), 'Rutting': np.zeros(3)})
+
+
+def test_restore_models_round_trip(store):
+    climate = ClimateData.from_series([10.0, 20.0, 30.0, 20.0], [50.0, 60.0, 70.0, 80.0], steps_per_year=4)
+    inputs = {'traffic': TrafficData([80.0, 100.0], 0.03, 20, [3.0, 2.0]), 'climate': climate,
+              'subgrade': SubgradeProperties(50.0, 5.0), 'material': MaterialProperties(3000.0, 30.0, 0.5),
+              'pavement': Pavement([('Asphalt', 100.0), ('Base', 200.0)]), 'discount_rate': 0.03}
+    scenario_id = store.save_scenario('north', '0012', inputs, results={'Rutting': 1.5, 'LCC over Time': [1.0, 2.0]})
+    scenario = store.get(scenario_id)
+    assert scenario['section'] == '0012'
+    assert scenario['results'] == {'Rutting': 1.5, 'LCC over Time': [1.0, 2.0]}
+    restored = restore_models(scenario['inputs'])
+    assert restored['discount_rate'] == 0.03
+    assert vars(restored['traffic']) == vars(inputs['traffic'])
+    assert restored['climate'].temperature_series == [10.0, 20.0, 30.0, 20.0]
+    assert restored['climate'].rainfall == climate.rainfall and restored['climate'].steps_per_year == 4
+    assert vars(restored['subgrade']) == vars(inputs['subgrade'])
+    assert vars(restored['material']) == vars(inputs['material'])
+    assert [tuple(layer) for layer in restored['pavement'].layers] == inputs['pavement'].layers